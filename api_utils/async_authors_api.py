@@ -0,0 +1,53 @@
+from api_utils.async_base_api import AsyncBaseAPI, AsyncResponse
+from api_utils.authors_api import AUTHORS_RESOURCE
+
+class AsyncAuthorsAPI(AsyncBaseAPI):
+    def __init__(self, base_url: str, registry=None, **kwargs):
+        """
+        :param registry: Optional CleanupRegistry; created authors are recorded
+                         in it and deleted at the end of the test or session.
+        """
+        super().__init__(base_url, **kwargs)
+        self.registry = registry
+
+    async def create_author(self, author_payload: dict) -> AsyncResponse:
+        """
+        Sends a POST request to create a new author.
+        """
+        response = await self.post("/api/v1/Authors", json=author_payload)
+        if self.registry is not None and response.status_code == 200:
+            self.registry.register(AUTHORS_RESOURCE, self.base_url, author_payload["id"])
+        return response
+
+    async def get_author(self, author_id: int) -> AsyncResponse:
+        """
+        Sends a GET request to retrieve an author by ID.
+        """
+        return await self.get(f"/api/v1/Authors/{author_id}")
+
+    async def delete_author(self, author_id: int) -> AsyncResponse:
+        """
+        Sends a DELETE request to remove an author by ID.
+        """
+        response = await self.delete(f"/api/v1/Authors/{author_id}")
+        if self.registry is not None and response.status_code in (200, 204, 404):
+            self.registry.forget(AUTHORS_RESOURCE, self.base_url, author_id)
+        return response
+
+    async def create_authors(self, author_payloads: list[dict], return_exceptions: bool = False) -> list:
+        """
+        Creates many authors concurrently. Responses are returned in payload order.
+        """
+        return await self.gather(
+            *(self.create_author(payload) for payload in author_payloads),
+            return_exceptions=return_exceptions
+        )
+
+    async def get_authors(self, author_ids: list[int], return_exceptions: bool = False) -> list:
+        """
+        Retrieves many authors concurrently. Responses are returned in ID order.
+        """
+        return await self.gather(
+            *(self.get_author(author_id) for author_id in author_ids),
+            return_exceptions=return_exceptions
+        )
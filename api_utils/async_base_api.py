@@ -0,0 +1,90 @@
+import asyncio
+import json as jsonlib
+import time
+import aiohttp
+from config.config import BASE_API_URL, ASYNC_MAX_CONCURRENCY, API_POOL_SIZE, API_TIMEOUT
+
+
+class AsyncResponse:
+    """
+    Minimal response object mirroring the parts of `requests.Response`
+    the tests rely on (`status_code`, `headers`, `text`, `json()`).
+    """
+
+    def __init__(self, status_code: int, headers: dict, text: str, elapsed: float):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+        self.elapsed = elapsed
+
+    def json(self):
+        return jsonlib.loads(self.text)
+
+
+class AsyncBaseAPI:
+    """
+    asyncio-based sibling of BaseAPI.
+
+    Requests share one pooled aiohttp session; at most `max_concurrency`
+    requests are in flight at once and each request has its own timeout.
+    Use as an async context manager so the session is closed afterwards.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_API_URL,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        pool_size: int = API_POOL_SIZE,
+        timeout: float = API_TIMEOUT
+    ):
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session and semaphore bind to the running loop
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def request(self, method: str, endpoint: str, timeout: float | None = None, **kwargs) -> AsyncResponse:
+        session = self._get_session()
+        url = f"{self.base_url}{endpoint}"
+        client_timeout = aiohttp.ClientTimeout(total=timeout if timeout is not None else self.timeout)
+        async with self._semaphore:
+            start = time.perf_counter()
+            async with session.request(method, url, timeout=client_timeout, **kwargs) as response:
+                text = await response.text()
+                return AsyncResponse(response.status, dict(response.headers), text, time.perf_counter() - start)
+
+    async def post(self, endpoint: str, json: dict, **kwargs) -> AsyncResponse:
+        return await self.request("POST", endpoint, json=json, **kwargs)
+
+    async def get(self, endpoint: str, **kwargs) -> AsyncResponse:
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> AsyncResponse:
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def gather(self, *coroutines, return_exceptions: bool = False) -> list:
+        """
+        Run many request coroutines at once. Concurrency is still bounded by
+        `max_concurrency`, so this is safe to call with thousands of calls.
+        """
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
@@ -1,22 +1,59 @@
 from api_utils.base_api import BaseAPI
+from config.config import API_BULK_CONCURRENCY
+
+AUTHORS_RESOURCE = "authors"
+
 
 class AuthorsAPI(BaseAPI):
-    def __init__(self, base_url: str):
-        super().__init__(base_url)
+    def __init__(self, base_url: str, registry=None, **kwargs):
+        """
+        :param registry: Optional CleanupRegistry; created authors are recorded
+                         in it and deleted at the end of the test or session.
+        """
+        super().__init__(base_url, **kwargs)
+        self.registry = registry
+
     def create_author(self, author_payload: dict):
         """
         Sends a POST request to create a new author.
         """
-        return self.post("/api/v1/Authors", json=author_payload)
+        response = self.post("/api/v1/Authors", json=author_payload)
+        if self.registry is not None and response.status_code == 200:
+            self.registry.register(AUTHORS_RESOURCE, self.base_url, author_payload["id"])
+        return response
 
-    def get_author(self, author_id: int):
+    def get_author(self, author_id: int, use_cache: bool = True):
         """
         Sends a GET request to retrieve an author by ID.
         """
-        return self.get(f"/api/v1/Authors/{author_id}")
+        return self.get(f"/api/v1/Authors/{author_id}", use_cache=use_cache)
 
     def delete_author(self, author_id: int):
         """
         Sends a DELETE request to remove an author by ID.
         """
-        return self.delete(f"/api/v1/Authors/{author_id}")
+        response = self.delete(f"/api/v1/Authors/{author_id}")
+        if self.registry is not None and response.status_code in (200, 204, 404):
+            self.registry.forget(AUTHORS_RESOURCE, self.base_url, author_id)
+        return response
+
+    def create_authors(self, author_payloads: list[dict], max_workers: int = API_BULK_CONCURRENCY,
+                       return_exceptions: bool = False) -> list:
+        """
+        Creates many authors in parallel. Responses are returned in payload order.
+        """
+        return self.bulk(self.create_author, author_payloads, max_workers, return_exceptions)
+
+    def get_authors(self, author_ids: list[int], max_workers: int = API_BULK_CONCURRENCY,
+                    return_exceptions: bool = False) -> list:
+        """
+        Retrieves many authors in parallel. Responses are returned in ID order.
+        """
+        return self.bulk(self.get_author, author_ids, max_workers, return_exceptions)
+
+    def delete_authors(self, author_ids: list[int], max_workers: int = API_BULK_CONCURRENCY,
+                       return_exceptions: bool = False) -> list:
+        """
+        Deletes many authors in parallel. Responses are returned in ID order.
+        """
+        return self.bulk(self.delete_author, author_ids, max_workers, return_exceptions)
@@ -1,20 +1,96 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from config.config import BASE_API_URL 
+from typing import Callable, Iterable
+from api_utils.response_cache import ResponseCache
+from api_utils.transport import Transport
+from config.config import BASE_API_URL, API_BULK_CONCURRENCY
+from support.step_timer import timed_step
+
+logger = logging.getLogger(__name__)
 
 
 class BaseAPI:
-    def __init__(self, base_url: str = BASE_API_URL):
+    def __init__(self, base_url: str = BASE_API_URL, transport: Transport | None = None,
+                 cache: ResponseCache | None = None):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.transport = transport or Transport(base_url)
+        self.session = self.transport.session
+        self.cache = cache
 
+    @timed_step
     def post(self, endpoint: str, json: dict, **kwargs):
         url = f"{self.base_url}{endpoint}"
-        return self.session.post(url, json=json, **kwargs)
+        response = self.transport.request("POST", url, json=json, **kwargs)
+        if self.cache:
+            self.cache.invalidate(url)
+        self._log("POST", url, response)
+        return response
 
-    def get(self, endpoint: str, **kwargs):
+    @timed_step
+    def get(self, endpoint: str, use_cache: bool = True, **kwargs):
+        """
+        GET `endpoint`. With a cache configured, fresh responses are served from
+        it and stale ones are revalidated; pass use_cache=False for fresh data.
+        Responses are cached per URL including the query string from `params`.
+        """
         url = f"{self.base_url}{endpoint}"
-        return self.session.get(url, **kwargs)
+        if not (self.cache and use_cache):
+            response = self.transport.request("GET", url, **kwargs)
+            self._log("GET", url, response)
+            return response
+
+        cache_key = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+        entry = self.cache.lookup(cache_key)
+        if entry and self.cache.is_fresh(entry):
+            response = self.cache.serve(entry)
+            self._log("GET", url, response, cache="hit")
+            return response
+        if entry:
+            kwargs["headers"] = {**self.cache.conditional_headers(entry), **kwargs.get("headers", {})}
+        response = self.transport.request("GET", url, **kwargs)
+        if entry and response.status_code == 304:
+            response = self.cache.serve(entry, revalidated=True)
+            self._log("GET", url, response, cache="revalidated")
+            return response
+        self.cache.store(cache_key, response)
+        self._log("GET", url, response, cache="miss")
+        return response
 
+    @timed_step
     def delete(self, endpoint: str, **kwargs):
         url = f"{self.base_url}{endpoint}"
-        return self.session.delete(url, **kwargs)
+        response = self.transport.request("DELETE", url, **kwargs)
+        if self.cache:
+            self.cache.invalidate(url)
+        self._log("DELETE", url, response)
+        return response
+
+    @staticmethod
+    def _log(method: str, url: str, response, cache: str = ""):
+        # DEBUG: one event per request, e.g. sampled with LOG_SAMPLE_RATES=DEBUG=0.1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s -> %s", method, url, response.status_code, stacklevel=2,
+                         extra={"method": method, "url": url, "status": response.status_code, "cache": cache})
+
+    def bulk(self, func: Callable, items: Iterable, max_workers: int = API_BULK_CONCURRENCY,
+             return_exceptions: bool = False) -> list:
+        """
+        Call `func(item)` for every item with at most `max_workers` in flight,
+        sharing this client's pooled session. Results are returned in item order;
+        with `return_exceptions` failures are returned instead of raised.
+        """
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="bulk") as executor:
+            futures = [executor.submit(func, item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
@@ -0,0 +1,182 @@
+"""
+Tracked cleanup of records created by tests.
+
+API clients register every resource they create; the registry deletes them
+in parallel at the end of a test or of the session. Each registration and
+removal is appended to a small per-worker JSONL journal before the request
+returns, so records created by a worker that crashed are deleted the next
+time that worker starts (`recover`).
+
+Records on the in-process local stand-in (USE_LOCAL_API, a random port on
+127.0.0.1) die with the process; they are not journaled, and entries for
+such hosts found in an older journal are dropped instead of retried.
+"""
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+from api_utils.authors_api import AuthorsAPI, AUTHORS_RESOURCE
+from config.config import API_BULK_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+# (kind, base_url, resource id)
+Resource = tuple[str, str, object]
+
+
+def delete_authors(base_url: str, author_ids: list, max_workers: int) -> list:
+    return AuthorsAPI(base_url).delete_authors(author_ids, max_workers=max_workers, return_exceptions=True)
+
+
+DEFAULT_DELETERS = {AUTHORS_RESOURCE: delete_authors}
+# Where the local stand-in server listens (see support.fake_rest_server)
+EPHEMERAL_HOSTS = {"127.0.0.1"}
+
+
+def is_ephemeral(base_url: str) -> bool:
+    return urlsplit(base_url).hostname in EPHEMERAL_HOSTS
+
+
+class CleanupRegistry:
+    """
+    :param journal_path: JSONL journal of registrations/removals (None keeps it in memory only).
+    :param deleters: Per resource kind, `func(base_url, ids, max_workers) -> responses/exceptions`.
+    """
+
+    def __init__(self, journal_path: str | None = None, max_workers: int = API_BULK_CONCURRENCY,
+                 deleters: dict[str, Callable] | None = None):
+        self.journal_path = Path(journal_path) if journal_path else None
+        self.max_workers = max_workers
+        self.deleters = deleters or DEFAULT_DELETERS
+        self._pending: set[Resource] = set()
+        self._lock = threading.Lock()
+        self._journal = None
+
+        # Statistics
+        self.registered = 0
+        self.forgotten = 0
+        self.deleted = 0
+        self.failed = 0
+        self.recovered = 0
+
+        if self.journal_path:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def stats(self) -> dict:
+        return {
+            "registered": self.registered,
+            "forgotten": self.forgotten,
+            "deleted": self.deleted,
+            "failed": self.failed,
+            "recovered": self.recovered,
+            "pending": len(self._pending),
+        }
+
+    def _append(self, op: str, resource: Resource):
+        # Called with the lock held; flushed per line so a crash loses nothing
+        if self.journal_path is None:
+            return
+        if self._journal is None:
+            self._journal = self.journal_path.open("a", buffering=1)
+        kind, base_url, resource_id = resource
+        self._journal.write(json.dumps({"op": op, "kind": kind, "base_url": base_url, "id": resource_id}) + "\n")
+
+    def register(self, kind: str, base_url: str, resource_id):
+        resource = (kind, base_url, resource_id)
+        with self._lock:
+            self._pending.add(resource)
+            self._append("add", resource)
+            self.registered += 1
+
+    def forget(self, kind: str, base_url: str, resource_id):
+        """Stop tracking a resource that was deleted by the test itself."""
+        resource = (kind, base_url, resource_id)
+        with self._lock:
+            if resource in self._pending:
+                self._pending.discard(resource)
+                self._append("remove", resource)
+                self.forgotten += 1
+
+    def pending(self) -> set[Resource]:
+        with self._lock:
+            return set(self._pending)
+
+    def teardown(self, resources: set[Resource] | None = None):
+        """
+        Delete `resources` (default: everything pending), grouped per kind and
+        host and in parallel. Resources that could not be deleted stay pending
+        and in the journal for the next run.
+        """
+        resources = self.pending() if resources is None else resources & self.pending()
+        groups = defaultdict(list)
+        for kind, base_url, resource_id in resources:
+            groups[(kind, base_url)].append(resource_id)
+
+        for (kind, base_url), ids in groups.items():
+            results = self.deleters[kind](base_url, ids, self.max_workers)
+            with self._lock:
+                for resource_id, result in zip(ids, results):
+                    if isinstance(result, Exception) or result.status_code not in (200, 204, 404):
+                        self.failed += 1
+                        continue
+                    self._pending.discard((kind, base_url, resource_id))
+                    self._append("remove", (kind, base_url, resource_id))
+                    self.deleted += 1
+            logger.info(f"Cleaned up {len(ids)} {kind} on {base_url}.")
+        if resources:
+            self._compact()
+
+    def recover(self):
+        """Delete resources left in the journal by an earlier, crashed run of this worker."""
+        if not (self.journal_path and self.journal_path.exists()):
+            return
+        leftovers = set()
+        for line in self.journal_path.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn last line of a crashed writer
+            resource = (entry["kind"], entry["base_url"], entry["id"])
+            if entry["op"] == "add":
+                leftovers.add(resource)
+            else:
+                leftovers.discard(resource)
+        stale = {resource for resource in leftovers if is_ephemeral(resource[1])}
+        if stale:
+            logger.info(f"Dropping {len(stale)} journaled resources of a local stand-in server that no longer runs.")
+            leftovers -= stale
+        if not leftovers:
+            self._compact()  # Drops a torn last line before new entries are appended
+            return
+        logger.warning(f"Recovering {len(leftovers)} resources left by a previous run in {self.journal_path}.")
+        with self._lock:
+            self._pending |= leftovers
+        self.recovered += len(leftovers)
+        self.teardown(leftovers)
+
+    def _compact(self):
+        """Rewrite the journal with only the still-pending resources."""
+        if self.journal_path is None:
+            return
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            lines = "".join(
+                json.dumps({"op": "add", "kind": kind, "base_url": base_url, "id": resource_id}) + "\n"
+                for kind, base_url, resource_id in self._pending
+            )
+            temp_path = self.journal_path.with_suffix(".tmp")
+            temp_path.write_text(lines)
+            os.replace(temp_path, self.journal_path)
+
+    def close(self):
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
@@ -0,0 +1,270 @@
+"""
+Load generation for the Authors endpoints.
+
+Drives AuthorsAPI.create_author/get_author/delete_author either at a fixed
+concurrency level (closed model: N workers issue requests back to back) or at
+a target request rate (open model: requests are dispatched on a schedule),
+for a fixed duration, and reports latency percentiles, throughput and errors.
+
+Usage:
+    python -m api_utils.load_generator --duration 30 --concurrency 10 --rate 50
+"""
+import argparse
+import html
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from api_utils.authors_api import AuthorsAPI
+from api_utils.schemas import AUTHOR, ValidationReport, validate_responses
+from api_utils.transport import Transport
+from config.config import BASE_API_URL, LOAD_DURATION, LOAD_CONCURRENCY, LOAD_RATE, LOAD_VALIDATE
+from support.random_utils import generate_author_payload
+from support.step_timer import timer as step_timer
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each operation in the generated traffic
+DEFAULT_OPERATION_MIX = {"create_author": 2, "get_author": 6, "delete_author": 2}
+# IDs present in the default fake REST API data set
+SEEDED_AUTHOR_IDS = range(1, 201)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+@dataclass
+class LoadReport:
+    duration: float = 0.0
+    latencies: dict = field(default_factory=lambda: defaultdict(list))
+    errors: Counter = field(default_factory=Counter)
+    missed: int = 0
+    title: str = "Load test"
+    unit: str = "requests"
+    validation: ValidationReport | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, operation: str, latency: float, error: str | None = None):
+        with self._lock:
+            self.latencies[operation].append(latency)
+            if error:
+                self.errors[f"{operation}: {error}"] += 1
+
+    def record_missed(self):
+        """Count a scheduled dispatch that no worker could start before the deadline."""
+        with self._lock:
+            self.missed += 1
+
+    @property
+    def total_requests(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+    @property
+    def error_rate(self) -> float:
+        total = self.total_requests
+        return sum(self.errors.values()) / total if total else 0.0
+
+    def _stats(self, values: list[float]) -> dict:
+        ordered = sorted(values)
+        return {
+            "requests": len(ordered),
+            "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        }
+
+    def to_dict(self) -> dict:
+        all_latencies = [value for values in self.latencies.values() for value in values]
+        return {
+            "duration_seconds": round(self.duration, 3),
+            "total_requests": self.total_requests,
+            "throughput_rps": round(self.total_requests / self.duration, 2) if self.duration else 0.0,
+            "error_rate": round(self.error_rate, 4),
+            "errors": dict(self.errors),
+            "missed_dispatches": self.missed,
+            "overall": self._stats(all_latencies),
+            "operations": {operation: self._stats(values) for operation, values in sorted(self.latencies.items())},
+            **({"schema_validation": self.validation.to_dict()} if self.validation else {}),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_html(self) -> str:
+        """Render the report as an HTML section for pytest-html."""
+        data = self.to_dict()
+        rows = "".join(
+            f"<tr><td>{html.escape(name)}</td><td>{stats['requests']}</td><td>{stats['p50_ms']}</td>"
+            f"<td>{stats['p95_ms']}</td><td>{stats['p99_ms']}</td><td>{stats['max_ms']}</td></tr>"
+            for name, stats in [("overall", data["overall"]), *data["operations"].items()]
+        )
+        errors = "".join(
+            f"<li>{html.escape(name)}: {count}</li>" for name, count in sorted(data["errors"].items())
+        ) or "<li>none</li>"
+        missed = f", {self.missed} missed dispatches" if self.missed else ""
+        validation = f"<p>Schema validation: {html.escape(self.validation.summary())}</p>" if self.validation else ""
+        return (
+            f"<div class='load-report'><h3>{html.escape(self.title)}</h3>"
+            f"<p>{data['total_requests']} {self.unit} in {data['duration_seconds']}s, "
+            f"{data['throughput_rps']} req/s, error rate {data['error_rate']:.2%}{missed}</p>"
+            "<table><tr><th>Operation</th><th>Requests</th><th>p50 (ms)</th><th>p95 (ms)</th>"
+            f"<th>p99 (ms)</th><th>max (ms)</th></tr>{rows}</table>"
+            f"<p>Errors:</p><ul>{errors}</ul>{validation}</div>"
+        )
+
+
+class LoadGenerator:
+    """
+    Generates Authors API traffic for `duration` seconds.
+
+    :param concurrency: Number of worker threads (each with its own session).
+    :param rate: Target requests per second; 0 runs the workers unthrottled.
+    :param operation_mix: Relative weights of create/get/delete operations.
+    :param registry: Optional CleanupRegistry that records created authors for deletion.
+    :param validate: Check every successful create/get response against the Author schema,
+        on a separate thread so validation does not hold up the workers.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_API_URL,
+        duration: float = LOAD_DURATION,
+        concurrency: int = LOAD_CONCURRENCY,
+        rate: float = LOAD_RATE,
+        operation_mix: dict | None = None,
+        registry=None,
+        validate: bool = LOAD_VALIDATE
+    ):
+        self.base_url = base_url
+        self.duration = duration
+        self.concurrency = concurrency
+        self.rate = rate
+        self.operation_mix = operation_mix or DEFAULT_OPERATION_MIX
+        self.registry = registry
+        self.validate = validate
+        self._local = threading.local()
+        self._responses: queue.SimpleQueue | None = None
+
+    def _api(self) -> AuthorsAPI:
+        # One AuthorsAPI (and connection pool) per worker thread. No retries and no circuit
+        # breaker: the report measures single requests and counts every error
+        if not hasattr(self._local, "api"):
+            transport = Transport(self.base_url, max_retries=0, circuit_breaker=False)
+            self._local.api = AuthorsAPI(self.base_url, registry=self.registry, transport=transport)
+        return self._local.api
+
+    def _pick_operation(self) -> str:
+        operations = list(self.operation_mix)
+        return random.choices(operations, weights=[self.operation_mix[op] for op in operations])[0]
+
+    def _execute(self, report: LoadReport, scheduled: float | None = None, deadline: float | None = None):
+        # Rate mode passes the scheduled dispatch time: latency counts the time spent queued
+        # for a free worker, and a dispatch that could not start before the deadline is dropped
+        if deadline is not None and time.perf_counter() >= deadline:
+            report.record_missed()
+            return
+        operation = self._pick_operation()
+        api = self._api()
+        payload = generate_author_payload() if operation == "create_author" else None
+        start = scheduled if scheduled is not None else time.perf_counter()
+        error = None
+        try:
+            if operation == "create_author":
+                response = api.create_author(payload)
+            elif operation == "get_author":
+                response = api.get_author(random.choice(SEEDED_AUTHOR_IDS))
+            else:
+                response = api.delete_author(random.choice(SEEDED_AUTHOR_IDS))
+            if response.status_code >= 400:
+                error = f"HTTP {response.status_code}"
+        except Exception as e:
+            error = type(e).__name__
+        report.record(operation, time.perf_counter() - start, error)
+        # Validated by the validator thread; delete responses have no body
+        if self._responses is not None and error is None and operation != "delete_author":
+            self._responses.put(response)
+
+    def run(self) -> LoadReport:
+        report = LoadReport(validation=ValidationReport() if self.validate else None)
+        mode = f"{self.rate} req/s" if self.rate else "unthrottled"
+        logger.info(f"Starting load: {self.concurrency} workers, {mode}, {self.duration}s.")
+        # Per-request latencies are kept in the load report; skip step timing on this hot path
+        step_timing_enabled, step_timer.enabled = step_timer.enabled, False
+        validator = None
+        if report.validation is not None:
+            # Drains the responses handed over by the workers until the None sentinel
+            self._responses = queue.SimpleQueue()
+            validator = threading.Thread(
+                target=validate_responses, args=(iter(self._responses.get, None), AUTHOR),
+                kwargs={"report": report.validation}, name="load-validator", daemon=True
+            )
+            validator.start()
+        start = time.perf_counter()
+        deadline = start + self.duration
+
+        if self.rate:
+            # Open model: dispatch on schedule, workers only bound concurrency
+            interval = 1.0 / self.rate
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                next_dispatch = start
+                while next_dispatch < deadline:
+                    executor.submit(self._execute, report, next_dispatch, deadline)
+                    next_dispatch += interval
+                    time.sleep(max(next_dispatch - time.perf_counter(), 0))
+        else:
+            # Closed model: every worker issues requests back to back
+            def worker():
+                while time.perf_counter() < deadline:
+                    self._execute(report)
+
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for _ in range(self.concurrency):
+                    executor.submit(worker)
+
+        report.duration = time.perf_counter() - start
+        step_timer.enabled = step_timing_enabled
+        if validator is not None:
+            self._responses.put(None)
+            validator.join()
+            self._responses = None
+        logger.info(f"Load finished: {report.total_requests} requests, error rate {report.error_rate:.2%}.")
+        if report.missed:
+            logger.warning(f"{report.missed} scheduled requests missed the deadline waiting for a free worker; "
+                           f"raise the concurrency or lower the rate.")
+        return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate load against the Authors API.")
+    parser.add_argument("--base-url", default=BASE_API_URL)
+    parser.add_argument("--duration", type=float, default=LOAD_DURATION, help="Seconds to run.")
+    parser.add_argument("--concurrency", type=int, default=LOAD_CONCURRENCY, help="Worker threads.")
+    parser.add_argument("--rate", type=float, default=LOAD_RATE, help="Target req/s (0 = unthrottled).")
+    parser.add_argument("--output", default="reports/load_report.json", help="JSON report path.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    report = LoadGenerator(args.base_url, args.duration, args.concurrency, args.rate).run()
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(report.to_json())
+    Path(args.output).with_suffix(".html").write_text(report.to_html())
+    print(report.to_json())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import copy
+import hashlib
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    response: requests.Response
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return self.response.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.response.headers.get("Last-Modified")
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of GET responses with a TTL and an optional on-disk tier.
+
+    Fresh entries are served without a request. Stale entries that carry an
+    ETag or Last-Modified are revalidated with a conditional request; a 304
+    refreshes the entry. Writes (POST/PUT/DELETE) invalidate the written path
+    and its parent collection.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 60, disk_dir: str | None = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+        }
+
+    def _disk_path(self, url: str) -> Path:
+        return self.disk_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.pickle"
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """Return the entry for `url` (fresh or stale), or None."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                return entry
+        if self.disk_dir:
+            try:
+                entry = pickle.loads(self._disk_path(url).read_bytes())
+            except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+                return None
+            self._store_memory(url, entry)
+            return entry
+        return None
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def conditional_headers(self, entry: CacheEntry) -> dict:
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def serve(self, entry: CacheEntry, revalidated: bool = False) -> requests.Response:
+        """Return a copy of the cached response marked with `from_cache`."""
+        if revalidated:
+            self.revalidations += 1
+            entry.stored_at = time.time()
+        else:
+            self.hits += 1
+        response = copy.copy(entry.response)
+        response.from_cache = True
+        return response
+
+    def store(self, url: str, response: requests.Response):
+        self.misses += 1
+        if response.status_code != 200:
+            return
+        entry = CacheEntry(response, time.time())
+        self._store_memory(url, entry)
+        if self.disk_dir:
+            self._disk_path(url).write_bytes(pickle.dumps(entry))
+
+    def _store_memory(self, url: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str):
+        """Drop `url` and its parent collection (ignoring query strings)."""
+        path = urlsplit(url)._replace(query="", fragment="").geturl().rstrip("/")
+        parent = path.rsplit("/", 1)[0]
+
+        def affected(cached_url: str) -> bool:
+            cached_path = urlsplit(cached_url)._replace(query="", fragment="").geturl().rstrip("/")
+            return cached_path in (path, parent)
+
+        with self._lock:
+            stale = [cached_url for cached_url in self._entries if affected(cached_url)]
+            for cached_url in stale:
+                del self._entries[cached_url]
+        if self.disk_dir:
+            for cached_url in stale:
+                self._disk_path(cached_url).unlink(missing_ok=True)
+            # Entries only on disk (e.g. from an earlier run) are keyed by hash
+            self._disk_path(path).unlink(missing_ok=True)
+            self._disk_path(parent).unlink(missing_ok=True)
+        self.invalidations += len(stale)
@@ -0,0 +1,196 @@
+"""
+Response schemas for the Authors endpoints.
+
+Schemas are declared once as data and compiled on first use into a plain
+Python function (generated source, exact `type(...) is` checks, no per-field
+interpretation), so checking a valid document costs a handful of dict lookups.
+A validator collects every violation instead of stopping at the first one,
+and `validate_responses` aggregates violations over a whole batch of bulk or
+load-test responses into a ValidationReport.
+
+The local stand-in server validates request payloads with AUTHOR_PAYLOAD.
+"""
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+# Exact Python types accepted for each declared JSON type (bool is not an int)
+JSON_TYPES = {
+    int: (int,),
+    float: (int, float),
+    str: (str,),
+    bool: (bool,),
+    dict: (dict,),
+    list: (list,),
+}
+MAX_SAMPLES = 20
+
+
+@dataclass(frozen=True)
+class Field:
+    """:param type: A JSON type from JSON_TYPES or a nested Schema."""
+    type: object
+    nullable: bool = False
+    required: bool = True
+
+
+class Schema:
+    """
+    A JSON object with declared fields. `check(data, path, violations)` is
+    the compiled validator; it appends (path, problem) tuples to `violations`.
+    `name` only labels the schema (messages, tracebacks), any string will do.
+    """
+
+    def __init__(self, name: str, fields: dict[str, Field], allow_extra: bool = True):
+        self.name = name
+        self.fields = fields
+        self.allow_extra = allow_extra
+        self._check: Callable | None = None
+
+    def _source(self, namespace: dict) -> str:
+        lines = [
+            "def check(data, path, violations):",
+            "    if type(data) is not dict:",
+            "        violations.append((path, 'expected object'))",
+            "        return",
+        ]
+        for index, (name, spec) in enumerate(self.fields.items()):
+            lines.append(f"    value = data.get({name!r}, MISSING)")
+            lines.append("    if value is MISSING:")
+            lines.append(f"        violations.append((path + {'.' + name!r}, 'missing'))" if spec.required else "        pass")
+            lines.append("    elif value is None:")
+            lines.append("        pass" if spec.nullable else f"        violations.append((path + {'.' + name!r}, 'null'))")
+            if isinstance(spec.type, Schema):
+                namespace[f"nested_{index}"] = spec.type.check
+                lines.append("    else:")
+                lines.append(f"        nested_{index}(value, path + {'.' + name!r}, violations)")
+            else:
+                types = JSON_TYPES[spec.type]
+                namespace[f"types_{index}"] = types
+                condition = f"type(value) is not {types[0].__name__}" if len(types) == 1 else f"type(value) not in types_{index}"
+                lines.append(f"    elif {condition}:")
+                lines.append(f"        violations.append((path + {'.' + name!r}, 'expected {spec.type.__name__}'))")
+        if not self.allow_extra:
+            namespace["known"] = frozenset(self.fields)
+            lines.append("    for name in data.keys() - known:")
+            lines.append("        violations.append((path + '.' + name, 'unexpected field'))")
+        return "\n".join(lines)
+
+    @property
+    def check(self) -> Callable:
+        if self._check is None:
+            namespace = {"MISSING": object()}
+            exec(compile(self._source(namespace), f"<schema {self.name}>", "exec"), namespace)
+            self._check = namespace["check"]
+        return self._check
+
+    def errors(self, data, path: str = "$") -> list[tuple[str, str]]:
+        violations = []
+        self.check(data, path, violations)
+        return violations
+
+    def assert_valid(self, data):
+        violations = self.errors(data)
+        assert not violations, f"{self.name} schema violations: " + ", ".join(f"{p} {problem}" for p, problem in violations)
+
+
+class ArrayOf(Schema):
+    """A JSON array whose items all match `items`."""
+
+    def __init__(self, items: Schema):
+        super().__init__(f"{items.name}List", {})
+        self.items = items
+
+    def _source(self, namespace: dict) -> str:
+        namespace["check_item"] = self.items.check
+        return "\n".join([
+            "def check(data, path, violations):",
+            "    if type(data) is not list:",
+            "        violations.append((path, 'expected array'))",
+            "        return",
+            # Aggregated per item position pattern, not per index
+            "    item_path = path + '[*]'",
+            "    for item in data:",
+            "        check_item(item, item_path, violations)",
+        ])
+
+
+@dataclass
+class ValidationReport:
+    """Violation counts over many documents (thread-safe, e.g. for load tests)."""
+    checked: int = 0
+    invalid: int = 0
+    violations: Counter = field(default_factory=Counter)
+    samples: list = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, violations: list[tuple[str, str]], label=None):
+        with self._lock:
+            self.checked += 1
+            if not violations:
+                return
+            self.invalid += 1
+            self.violations.update(f"{path} {problem}" for path, problem in violations)
+            if len(self.samples) < MAX_SAMPLES:
+                self.samples.append({"document": self.checked - 1 if label is None else label, "violations": violations})
+
+    @property
+    def valid(self) -> bool:
+        return self.invalid == 0
+
+    def summary(self) -> str:
+        if self.valid:
+            return f"All {self.checked} documents valid."
+        counts = ", ".join(f"{violation} ({count})" for violation, count in self.violations.most_common())
+        return f"{self.invalid} of {self.checked} documents invalid: {counts}"
+
+    def to_dict(self) -> dict:
+        return {
+            "checked": self.checked,
+            "invalid": self.invalid,
+            "violations": dict(self.violations.most_common()),
+            "samples": self.samples,
+        }
+
+
+def validate_responses(responses: Iterable, schema: Schema, expected_status: int = 200,
+                       report: ValidationReport | None = None) -> ValidationReport:
+    """
+    Validate a batch of responses (e.g. from AuthorsAPI bulk methods with
+    return_exceptions=True). Exceptions, unexpected status codes and bodies
+    that are not JSON count as violations of the whole document.
+    """
+    report = report or ValidationReport()
+    for index, response in enumerate(responses):
+        if isinstance(response, Exception):
+            report.add([("$", f"request failed: {type(response).__name__}")], index)
+        elif response.status_code != expected_status:
+            report.add([("$", f"status {response.status_code}")], index)
+        else:
+            try:
+                data = response.json()
+            except ValueError:
+                report.add([("$", "invalid JSON")], index)
+                continue
+            report.add(schema.errors(data), index)
+    return report
+
+
+AUTHOR = Schema("Author", {
+    "id": Field(int),
+    "idBook": Field(int),
+    "firstName": Field(str, nullable=True),
+    "lastName": Field(str, nullable=True),
+})
+AUTHOR_LIST = ArrayOf(AUTHOR)
+# Request body accepted by POST/PUT: every field optional, unknown fields ignored
+AUTHOR_PAYLOAD = Schema("AuthorPayload", {
+    name: Field(spec.type, nullable=spec.nullable, required=False) for name, spec in AUTHOR.fields.items()
+})
+VALIDATION_PROBLEM = Schema("ValidationProblem", {
+    "type": Field(str),
+    "title": Field(str),
+    "status": Field(int),
+    "errors": Field(dict),
+})
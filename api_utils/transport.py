@@ -0,0 +1,154 @@
+import logging
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.config import (
+    API_CONNECT_TIMEOUT, API_TIMEOUT, API_MAX_RETRIES, API_BACKOFF_BASE, API_BACKOFF_MAX,
+    API_POOL_SIZE, API_KEEP_ALIVE, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRY_STATUSES = {429, 502, 503, 504}
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Fails fast after `failure_threshold` consecutive failed requests
+    (connection errors, timeouts or 5xx once retries are exhausted, or any
+    other error). After `reset_timeout` seconds a single trial request is let
+    through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def before_request(self):
+        with self._lock:
+            state = self.state
+            if state == "open" or (state == "half-open" and self._trial_in_flight):
+                raise CircuitOpenError(f"Circuit open after {self.failures} consecutive failures.")
+            if state == "half-open":
+                self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                if self.opened_at is None:
+                    logger.warning(f"Opening circuit after {self.failures} consecutive failures.")
+                self.opened_at = time.monotonic()
+
+
+class Transport:
+    """
+    `requests.Session` wrapper with default connect/read timeouts, a sized
+    connection pool, jittered exponential retries for idempotent methods and a
+    circuit breaker. Every response carries `retries` and `total_elapsed`
+    (seconds across all attempts, including back-off).
+
+    :param circuit_breaker: True for a breaker of this transport only (so one
+        test tripping it does not fail the next ones), a CircuitBreaker to
+        share, or False for none (e.g. load tests, which measure every request).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        connect_timeout: float = API_CONNECT_TIMEOUT,
+        read_timeout: float = API_TIMEOUT,
+        max_retries: int = API_MAX_RETRIES,
+        backoff_base: float = API_BACKOFF_BASE,
+        backoff_max: float = API_BACKOFF_MAX,
+        pool_size: int = API_POOL_SIZE,
+        keep_alive: bool = API_KEEP_ALIVE,
+        circuit_breaker: CircuitBreaker | bool = True
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        if isinstance(circuit_breaker, CircuitBreaker):
+            self.circuit_breaker = circuit_breaker
+        else:
+            self.circuit_breaker = CircuitBreaker() if circuit_breaker else None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def _backoff(self, attempt: int, response: requests.Response | None = None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        # Full jitter: spread retries of parallel workers instead of synchronising them
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        retries_allowed = self.max_retries if method in IDEMPOTENT_METHODS else 0
+        start = time.perf_counter()
+        attempt = 0
+
+        # The breaker sees one outcome per logical request, however many attempts it took
+        breaker = self.circuit_breaker
+        if breaker:
+            breaker.before_request()
+        failed = True
+        try:
+            while True:
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    if attempt >= retries_allowed:
+                        logger.error(f"{method} {url} failed after {attempt} retries: {e}")
+                        raise
+                    response = None
+                    logger.warning(f"{method} {url} attempt {attempt + 1} failed: {type(e).__name__}")
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt >= retries_allowed:
+                        failed = response.status_code >= 500
+                        response.retries = attempt
+                        response.total_elapsed = time.perf_counter() - start
+                        return response
+                    logger.warning(f"{method} {url} attempt {attempt + 1} returned {response.status_code}")
+
+                time.sleep(self._backoff(attempt, response))
+                attempt += 1
+        finally:
+            # Also on unexpected errors (e.g. ChunkedEncodingError), so a half-open trial never stays in flight
+            if breaker and failed:
+                breaker.record_failure()
+            elif breaker:
+                breaker.record_success()
@@ -0,0 +1,239 @@
+"""
+Micro-benchmarks for the framework's own overhead.
+
+Covers test data generation, BaseAPI request overhead against the local
+stand-in server (compared with a bare requests.Session), CommonFunctions
+actions against a static HTML fixture, and browser/context/page fixture
+setup and teardown (the fixtures' own code path, with network routing,
+capture policy and performance observers, next to a bare context). Results
+are written as JSON and compared against a stored baseline; a median slower
+than the baseline by more than the threshold fails the run. Without a
+baseline the results are saved as the baseline and the run passes.
+
+Usage:
+    python -m benchmarks.run_benchmarks                   # run and compare
+    python -m benchmarks.run_benchmarks --save-baseline   # record a new baseline
+    python -m benchmarks.run_benchmarks --only data,api   # skip browser benchmarks
+"""
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+from api_utils.base_api import BaseAPI
+from api_utils.schemas import AUTHOR_LIST
+from support.fake_rest_server import FakeRestServer, seeded_authors
+from support.random_utils import generate_author_payload, generate_user_details
+from support.step_timer import timer as step_timer
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_DIR = Path(__file__).parent
+FIXTURE_PAGE = BENCHMARK_DIR / "fixtures" / "chat_page.html"
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+GROUPS = ("data", "api", "ui", "fixtures")
+
+
+def measure(func, iterations: int, warmup: int = 5, setup=None) -> dict:
+    """Time `func` over `iterations` calls after `warmup` untimed calls."""
+    for _ in range(warmup):
+        func(setup() if setup else None)
+    samples = []
+    for _ in range(iterations):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        func(argument)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1] * 1000, 4),
+        "ops_per_second": round(1 / statistics.fmean(samples), 1),
+    }
+
+
+def bench_data(scale: float) -> dict:
+    iterations = max(1, int(2000 * scale))
+    return {
+        "data.generate_user_details": measure(lambda _: generate_user_details(), iterations),
+        "data.generate_author_payload": measure(lambda _: generate_author_payload(), iterations),
+        "data.validate_author_list": measure(lambda authors: AUTHOR_LIST.errors(authors), iterations,
+                                             setup=lambda: list(seeded_authors(100).values())),
+    }
+
+
+def bench_api(scale: float) -> dict:
+    iterations = max(1, int(500 * scale))
+    results = {}
+    with FakeRestServer() as server:
+        raw_session = requests.Session()
+        api = BaseAPI(server.url)
+        url = f"{server.url}/api/v1/Authors/1"
+        results["api.raw_session_get"] = measure(lambda _: raw_session.get(url), iterations)
+        results["api.base_api_get"] = measure(lambda _: api.get("/api/v1/Authors/1"), iterations)
+
+        step_timing_enabled, step_timer.enabled = step_timer.enabled, False
+        try:
+            results["api.base_api_get_untimed"] = measure(lambda _: api.get("/api/v1/Authors/1"), iterations)
+        finally:
+            step_timer.enabled = step_timing_enabled
+        results["api.base_api_post"] = measure(
+            lambda payload: api.post("/api/v1/Authors", json=payload), iterations, setup=generate_author_payload
+        )
+    step_timer.reset()
+    results["api.framework_overhead"] = {
+        "iterations": iterations,
+        "median_ms": round(results["api.base_api_get"]["median_ms"] - results["api.raw_session_get"]["median_ms"], 4),
+    }
+    return results
+
+
+def bench_ui(scale: float, browser_pool) -> dict:
+    from support.common_functions import CommonFunctions
+
+    iterations = max(1, int(100 * scale))
+    context = browser_pool.new_context()
+    page = context.new_page()
+    page.set_content(FIXTURE_PAGE.read_text())
+    common_functions = CommonFunctions(page)
+    option = page.locator("label.option-button.primary")
+    text_input = page.get_by_placeholder("Type here...")
+    bubble = page.locator("div.bubble-conatiner p")
+    try:
+        results = {
+            "ui.click_button": measure(lambda _: common_functions.click_button(option), iterations),
+            "ui.input_text": measure(lambda _: common_functions.input_text(text_input, "benchmark"), iterations),
+            "ui.is_text_visible": measure(
+                lambda _: common_functions.is_text_visible(bubble, "How can we help you today?"), iterations
+            ),
+            "ui.element_is_visible": measure(lambda _: common_functions.element_is_visible(option.first), iterations),
+        }
+    finally:
+        context.close()
+        step_timer.reset()
+    return results
+
+
+def bench_fixtures(scale: float, browser_pool) -> dict:
+    from config.config import PERF_METRICS
+    from support.perf_metrics import PerfMonitor
+    from support.ui_fixtures import (
+        close_test_context, new_capture_policy, new_har_manager, new_network_router, open_test_context
+    )
+
+    iterations = max(1, int(20 * scale))
+    network_router, har_manager, capture_policy = new_network_router(), new_har_manager(), new_capture_policy()
+
+    def context_and_page(_):
+        # What the browser_context, page and perf_monitor fixtures do for a passing test
+        context = open_test_context(browser_pool, network_router, har_manager, capture_policy, "benchmark")
+        page = context.new_page()
+        if PERF_METRICS:
+            PerfMonitor("benchmark").attach(context, page)
+        page.close()
+        close_test_context(context, har_manager, capture_policy, "benchmark", "benchmark", failed=False, passed=True)
+
+    def bare_context_and_page(_):
+        context = browser_pool.new_context(viewport={"width": 2560, "height": 1440})
+        context.new_page().close()
+        context.close()
+
+    try:
+        results = {
+            "fixtures.browser_context_and_page": measure(context_and_page, iterations, warmup=2),
+            "fixtures.bare_context_and_page": measure(bare_context_and_page, iterations, warmup=2),
+        }
+    finally:
+        capture_policy.shutdown()
+    stats = browser_pool.stats()
+    results["fixtures.browser_launch"] = {"iterations": stats["launches"], "median_ms": stats["average_launch_seconds"] * 1000}
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return benchmarks whose median regressed by more than `threshold` (e.g. 0.2 = 20%)."""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if not base or base.get("median_ms", 0) <= 0 or name.endswith("framework_overhead"):
+            continue
+        change = stats["median_ms"] / base["median_ms"] - 1
+        if change > threshold:
+            regressions.append(f"{name}: {base['median_ms']}ms -> {stats['median_ms']}ms (+{change:.0%})")
+    return regressions
+
+
+def run(groups: list[str], scale: float) -> dict:
+    results = {}
+    if "data" in groups:
+        results.update(bench_data(scale))
+    if "api" in groups:
+        results.update(bench_api(scale))
+    if "ui" in groups or "fixtures" in groups:
+        from playwright.sync_api import Error as PlaywrightError
+        from config.config import HEADLESS
+        from support.browser_pool import BrowserPool
+
+        browser_pool = BrowserPool(headless=HEADLESS)
+        try:
+            browser_pool.browser
+        except PlaywrightError as e:
+            logger.warning(f"Skipping browser benchmarks, launch failed: {str(e).splitlines()[0]}")
+            browser_pool.close()
+            return results
+        try:
+            if "fixtures" in groups:
+                results.update(bench_fixtures(scale, browser_pool))
+            if "ui" in groups:
+                results.update(bench_ui(scale, browser_pool))
+        finally:
+            browser_pool.close()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the framework's own overhead.")
+    parser.add_argument("--only", default=",".join(GROUPS), help=f"Comma-separated groups: {', '.join(GROUPS)}.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply iteration counts.")
+    parser.add_argument("--output", default="reports/benchmarks.json")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown (0.2 = 20%%).")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    results = run([group.strip() for group in args.only.split(",")], args.scale)
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    for name, stats in results.items():
+        print(f"{name:45} median {stats['median_ms']:>10.4f} ms")
+
+    if args.save_baseline:
+        baseline = json.loads(Path(args.baseline).read_text()) if Path(args.baseline).exists() else {}
+        baseline.update(results)
+        Path(args.baseline).write_text(json.dumps(baseline, indent=2))
+        print(f"Baseline saved to {args.baseline}.")
+        return 0
+
+    if not Path(args.baseline).exists():
+        # First run on this machine: later runs are compared against this one
+        Path(args.baseline).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.baseline).write_text(json.dumps(results, indent=2))
+        print(f"No baseline at {args.baseline}; saved these results as the baseline.")
+        return 0
+    regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
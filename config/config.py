@@ -5,3 +5,123 @@ import os
 BASE_URL = os.getenv("BASE_URL", "https://www.talkfurther.com/try-it")
 BASE_API_URL = os.getenv("BASE_API_URL", "https://fakerestapi.azurewebsites.net")
 
+# Serve the API tests from the bundled local stand-in instead of BASE_API_URL
+USE_LOCAL_API = os.getenv("USE_LOCAL_API", "false").lower() == "true"
+
+# API transport
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "100"))
+API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "5"))
+API_TIMEOUT = float(os.getenv("API_TIMEOUT", "30"))
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "3"))
+API_BACKOFF_BASE = float(os.getenv("API_BACKOFF_BASE", "0.5"))
+API_BACKOFF_MAX = float(os.getenv("API_BACKOFF_MAX", "8"))
+API_KEEP_ALIVE = os.getenv("API_KEEP_ALIVE", "true").lower() == "true"
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+
+# Opt-in GET response cache
+API_CACHE = os.getenv("API_CACHE", "false").lower() == "true"
+API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", "60"))
+API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "256"))
+API_CACHE_DIR = os.getenv("API_CACHE_DIR", "")
+
+# Async API client
+ASYNC_MAX_CONCURRENCY = int(os.getenv("ASYNC_MAX_CONCURRENCY", "50"))
+
+# Load testing
+LOAD_DURATION = float(os.getenv("LOAD_DURATION", "30"))
+LOAD_CONCURRENCY = int(os.getenv("LOAD_CONCURRENCY", "10"))
+LOAD_RATE = float(os.getenv("LOAD_RATE", "0"))
+LOAD_MAX_ERROR_RATE = float(os.getenv("LOAD_MAX_ERROR_RATE", "0.01"))
+LOAD_VALIDATE = os.getenv("LOAD_VALIDATE", "true").lower() == "true"
+
+# Browser pool
+HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+BROWSER_MAX_CONTEXTS = int(os.getenv("BROWSER_MAX_CONTEXTS", "50"))
+
+# Test data pool (leave DATA_POOL_SEED empty for a random, logged seed)
+DATA_POOL_SEED = os.getenv("DATA_POOL_SEED", "")
+DATA_POOL_BATCH = int(os.getenv("DATA_POOL_BATCH", "500"))
+DATA_POOL_FILE = os.getenv("DATA_POOL_FILE", "")
+
+# Step timing instrumentation
+STEP_TIMING = os.getenv("STEP_TIMING", "true").lower() == "true"
+STEP_TIMINGS_FILE = os.getenv("STEP_TIMINGS_FILE", "reports/step_timings.json")
+
+# Video/trace capture (off | on | retain-on-failure | trace-on-first-retry)
+CAPTURE_MODE = os.getenv("CAPTURE_MODE", "retain-on-failure")
+VIDEO_WIDTH = int(os.getenv("VIDEO_WIDTH", "1280"))
+VIDEO_HEIGHT = int(os.getenv("VIDEO_HEIGHT", "720"))
+
+# Parallel execution
+WORKER_ID = os.getenv("WORKER_ID", "0")
+WORKER_COUNT = os.getenv("WORKER_COUNT", "1")
+RUN_ID = os.getenv("RUN_ID", "")
+VIDEO_DIR = os.getenv("VIDEO_DIR", "videos")
+DURATIONS_FILE = os.getenv("DURATIONS_FILE", ".test_durations.json")
+
+# Network interception for UI tests
+NETWORK_ROUTING = os.getenv("NETWORK_ROUTING", "true").lower() == "true"
+BLOCKED_RESOURCE_TYPES = os.getenv("BLOCKED_RESOURCE_TYPES", "image,media,font").split(",")
+NETWORK_DENY_PATTERNS = os.getenv(
+    "NETWORK_DENY_PATTERNS",
+    "*google-analytics.com*,*googletagmanager.com*,*doubleclick.net*,*facebook.net*,*hotjar.com*,*clarity.ms*,*segment.io*"
+).split(",")
+NETWORK_ALLOW_PATTERNS = [p for p in os.getenv("NETWORK_ALLOW_PATTERNS", "").split(",") if p]
+NETWORK_CACHE_DIR = os.getenv("NETWORK_CACHE_DIR", ".network_cache")
+
+# HAR record/replay for UI tests (off | record | replay)
+HAR_MODE = os.getenv("HAR_MODE", "off")
+HAR_DIR = os.getenv("HAR_DIR", "har")
+HAR_URL_FILTER = os.getenv("HAR_URL_FILTER", "**/*")
+HAR_NOT_FOUND = os.getenv("HAR_NOT_FOUND", "abort")
+
+# Declarative chat flows
+FLOW_DIR = os.getenv("FLOW_DIR", "flows")
+FLOW_STEP_BUDGET = float(os.getenv("FLOW_STEP_BUDGET", "10"))
+FLOW_ENFORCE_BUDGETS = os.getenv("FLOW_ENFORCE_BUDGETS", "false").lower() == "true"
+
+# Concurrent UI conversations (async Playwright)
+UI_CONVERSATIONS = int(os.getenv("UI_CONVERSATIONS", "10"))
+UI_CONCURRENCY = int(os.getenv("UI_CONCURRENCY", "5"))
+
+# Bulk API operations and cleanup of created records (CLEANUP_SCOPE: session | test)
+API_BULK_CONCURRENCY = int(os.getenv("API_BULK_CONCURRENCY", "16"))
+CLEANUP = os.getenv("CLEANUP", "true").lower() == "true"
+CLEANUP_SCOPE = os.getenv("CLEANUP_SCOPE", "session")
+CLEANUP_JOURNAL_DIR = os.getenv("CLEANUP_JOURNAL_DIR", ".cleanup_journal")
+
+# Import/collection time profiling
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "false").lower() == "true"
+STARTUP_PROFILE_FILE = os.getenv("STARTUP_PROFILE_FILE", "reports/startup_profile.json")
+
+# Structured JSON logs of framework events (LOG_SAMPLE_RATES e.g. "DEBUG=0.1,INFO=0.5")
+STRUCTURED_LOGS = os.getenv("STRUCTURED_LOGS", "false").lower() == "true"
+LOG_DIR = os.getenv("LOG_DIR", "reports/logs")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LOGGERS = os.getenv("LOG_LOGGERS", "support,api_utils,pages").split(",")
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "")
+LOG_REDACT = os.getenv("LOG_REDACT", "true").lower() == "true"
+LOG_REDACT_FIELDS = os.getenv("LOG_REDACT_FIELDS", "text,actual_text,email,phone,password").split(",")
+
+# Test-result history, flaky quarantine (QUARANTINE: rerun | xfail | off) and failure-first ordering
+RESULT_HISTORY = os.getenv("RESULT_HISTORY", "true").lower() == "true"
+RESULT_HISTORY_DB = os.getenv("RESULT_HISTORY_DB", ".test_history.db")
+FLAKY_WINDOW = int(os.getenv("FLAKY_WINDOW", "20"))
+FLAKY_MIN_RUNS = int(os.getenv("FLAKY_MIN_RUNS", "5"))
+FLAKY_MIN_FLIPS = int(os.getenv("FLAKY_MIN_FLIPS", "2"))
+FLAKY_THRESHOLD = float(os.getenv("FLAKY_THRESHOLD", "0.2"))
+FLAKY_RERUNS = int(os.getenv("FLAKY_RERUNS", "2"))
+QUARANTINE = os.getenv("QUARANTINE", "rerun")
+FAILURE_FIRST = os.getenv("FAILURE_FIRST", "true").lower() == "true"
+
+# Browser performance metrics of UI tests (PERF_BUDGETS in ms, CLS unitless, e.g. "lcp=2500,next_bubble_p95=3000")
+PERF_METRICS = os.getenv("PERF_METRICS", "true").lower() == "true"
+PERF_METRICS_FILE = os.getenv("PERF_METRICS_FILE", "reports/perf_metrics.jsonl")
+PERF_BUDGETS = os.getenv("PERF_BUDGETS", "ttfb=1500,fcp=3000,lcp=4000,cls=0.25,total_blocking_time=600,next_bubble_p95=5000")
+PERF_ENFORCE_BUDGETS = os.getenv("PERF_ENFORCE_BUDGETS", "false").lower() == "true"
+
+# Streaming JSONL results (one line per test and per step, safe for concurrent workers)
+RESULT_STREAM = os.getenv("RESULT_STREAM", "true").lower() == "true"
+RESULT_STREAM_FILE = os.getenv("RESULT_STREAM_FILE", "reports/results.jsonl")
+RESULT_STREAM_STEPS = os.getenv("RESULT_STREAM_STEPS", "true").lower() == "true"
@@ -1,57 +1,103 @@
+import logging
+import os
 from pathlib import Path
+
+# Before any other import, so the profile covers everything conftest loads
+from config.config import STARTUP_PROFILE, STARTUP_PROFILE_FILE, STRUCTURED_LOGS, RESULT_HISTORY, RESULT_STREAM
+from support.startup_profiler import profiler as startup_profiler, StartupProfilePlugin
+if STARTUP_PROFILE:
+    startup_profiler.install()
+
 import pytest
-from playwright.sync_api import sync_playwright
-
-# UI Imports
-from pages.home_page import HomePage
-from support.common_functions import CommonFunctions
-from config.config import BASE_URL 
-
-# API imports
-from config.config import BASE_API_URL
-from api_utils.authors_api import AuthorsAPI
-
-@pytest.fixture
-def browser():
-    """Set up the Playwright browser."""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=False, 
-            args=["--window-size=1920,1080"]
-        )
-        yield browser
-        browser.close()
-
-@pytest.fixture
-def browser_context(browser):
-    """Set up a fresh browser context for each test to avoid shared session data."""
-    context = browser.new_context(
-        viewport={"width": 2560, "height": 1440},
-        record_video_dir="videos" 
+from py.xml import raw
+from pytest_html import extras
+
+from support.parallel_runner import save_durations
+from support.step_timer import timer as step_timer
+
+# UI and API fixtures import Playwright / API clients only when requested
+pytest_plugins = ["support.ui_fixtures", "support.api_fixtures"]
+
+test_durations = {}
+
+def pytest_addoption(parser):
+    parser.addoption("--load", action="store_true", default=False, help="Run tests marked as load tests.")
+    parser.addoption(
+        "--changed-since", metavar="BASE", default=None,
+        help="Only run tests affected by files changed since BASE (e.g. HEAD or origin/main)."
     )
-    yield context
-    context.close()  # Ensures cookies, cache, and storage are cleared
-
-@pytest.fixture
-def page(browser_context):
-    """Provide a new page for each test, ensuring isolation."""
-    page = browser_context.new_page()
-    yield page
-    page.close()
-
-@pytest.fixture
-def common_functions(page):
-    """Initialize and provide the CommonFunctions class."""
-    return CommonFunctions(page)
-
-@pytest.fixture
-def home_page(page, browser_context):
-    """Initialize and provide the HomePage class."""
-    return HomePage(page, browser_context, BASE_URL)
-
-@pytest.fixture
-def authors_api():
-    """
-    Returns an instance of AuthorsAPI which extends BaseAPI.
-    """
-    return AuthorsAPI(BASE_API_URL)
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "load: load/throughput test, only runs with --load")
+    config.addinivalue_line("markers", "start_from(name): start the test from a captured HomePage checkpoint")
+    config.addinivalue_line("markers", "flaky(reruns): rerun on failure (pytest-rerunfailures)")
+    # Framework logs are captured by pytest (shown for failing tests) instead of a basicConfig handler;
+    # with structured logs they only go to the JSON log, formatted off the test thread
+    if config.getoption("log_level") is None and not STRUCTURED_LOGS:
+        config.option.log_level = logging.getLevelName(logging.INFO)
+    if STARTUP_PROFILE:
+        config.pluginmanager.register(StartupProfilePlugin(startup_profiler, STARTUP_PROFILE_FILE), "startup-profile")
+    if STRUCTURED_LOGS:
+        from support.structured_log import StructuredLogging, StructuredLogPlugin, worker_log_path
+        config.pluginmanager.register(StructuredLogPlugin(StructuredLogging(worker_log_path())), "structured-logs")
+    if RESULT_HISTORY or config.getoption("changed_since"):
+        from support.result_history import ResultHistory, ResultHistoryPlugin
+        from support.affected_tests import changed_files
+        base = config.getoption("changed_since")
+        changed = changed_files(base) if base else None
+        history = ResultHistory() if RESULT_HISTORY else None
+        config.pluginmanager.register(ResultHistoryPlugin(history, changed), "result-history")
+    if RESULT_STREAM and not config.option.collectonly:
+        from support.result_stream import ResultStreamPlugin
+        config.pluginmanager.register(ResultStreamPlugin(), "result-stream")
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--load"):
+        return
+    skip_load = pytest.mark.skip(reason="Load test, run with --load")
+    for item in items:
+        if "load" in item.keywords:
+            item.add_marker(skip_load)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report on the item (item.rep_setup / rep_call / rep_teardown)."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+    artifacts = getattr(item, "capture_artifacts", None)
+    if report.when == "teardown" and artifacts:
+        report.extra = getattr(report, "extra", []) + [
+            extras.url(artifact_link(item.config, path), name=path.name) for path in artifacts
+        ]
+    monitor = getattr(item, "perf_monitor", None)
+    if report.when == "teardown" and monitor and monitor.metrics:
+        report.extra = getattr(report, "extra", []) + [extras.json(monitor.to_dict(), name="Performance metrics")]
+
+def artifact_link(config, path: Path) -> str:
+    """Link to an artifact relative to the HTML report, so reports/ and videos/ can move together."""
+    html_path = getattr(config.option, "htmlpath", None)
+    if not html_path:
+        return str(path)
+    return os.path.relpath(path.resolve(), Path(html_path).resolve().parent)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    step_timer.current_test = item.nodeid
+
+def pytest_sessionstart(session):
+    if step_timer.enabled and not session.config.option.collectonly:
+        step_timer.start()
+
+def pytest_html_results_summary(prefix, summary, postfix):
+    if step_timer.count:
+        postfix.append(raw(step_timer.slowest_steps_html()))
+
+def pytest_runtest_logreport(report):
+    """Accumulate setup + call + teardown time per test for shard balancing."""
+    test_durations[report.nodeid] = test_durations.get(report.nodeid, 0.0) + report.duration
+
+def pytest_sessionfinish(session):
+    if test_durations:
+        save_durations(test_durations)
+    step_timer.save()
@@ -0,0 +1,69 @@
+from playwright.async_api import Page, BrowserContext
+from pages.home_page import HomePageElements
+from support.async_common_functions import AsyncCommonFunctions
+from support.step_timer import timed_async_step
+
+
+class AsyncHomePage(HomePageElements):
+    """
+    `playwright.async_api` version of HomePage with the same locators, option
+    lists and method names, so flows can drive either one.
+    """
+
+    def __init__(self, page: Page, context: BrowserContext, base_url: str):
+        super().__init__(page)
+        self.page = page
+        self.context = context
+        self.base_url = base_url
+        self.common_functions = AsyncCommonFunctions(page)
+
+    @timed_async_step
+    async def navigate_to_home_page(self):
+        """Navigate to the homepage and wait for the welcome banner."""
+        await self.page.goto(self.base_url, wait_until="domcontentloaded")
+        await self.home_page_header_selector.wait_for(state="visible")
+
+    async def select_random_option(self, options: list, locator: str) -> str:
+        """Randomly selects an option from a given list."""
+        return await self.common_functions.click_random_option_by_text(options, locator)
+
+    async def select_initial_option(self, option_text: str):
+        """Clicks on a specified option using dynamic text filtering."""
+        await self.common_functions.click_button(self.initial_options_btn.filter(has_text=option_text))
+
+    @timed_async_step
+    async def select_tour_date_and_time(self):
+        """Select the tour day (see `tour_day`) and a random time slot."""
+        day_locator = self.page.locator(f"div.day-in-month:has-text('{self.tour_day()}')")
+        await day_locator.wait_for(state="visible")
+        await day_locator.click()
+        await self.common_functions.click_random_option_by_text(self.time_options, self.time_locator)
+
+    async def click_next(self):
+        await self.common_functions.click_button(self.next_btn)
+
+    async def click_confirm_selections(self):
+        await self.common_functions.click_button(self.confirm_selections)
+
+    async def personal_data_input(self, data):
+        await self.common_functions.input_text(self.input_name, data)
+
+    async def click_submit(self):
+        await self.common_functions.click_button(self.submit_btn)
+
+    async def click_schedule_a_visit(self):
+        await self.common_functions.click_button(self.schedule_a_visit_btn)
+
+    async def close_chat(self):
+        await self.common_functions.click_button(self.close_chat_btn)
+
+    async def checkpoint(self, name: str, data: dict | None = None):
+        """Snapshots are captured by the sync HomePage only; concurrent runs always start fresh."""
+
+    async def wait_for_next_message(self, action):
+        """Run `action` (a coroutine function) and wait until a new chat bubble appears."""
+        return await self.common_functions.wait_for_count_change(self.info_message, action)
+
+    async def wait(self, timeout: int = 60000):
+        """Wait for the chat to settle, i.e. until the 'please wait' banner is gone."""
+        await self.common_functions.wait_for_element_to_disappear(self.please_wait_banner, timeout=timeout)
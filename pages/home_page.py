@@ -1,19 +1,58 @@
 from playwright.sync_api import Page, BrowserContext
 from support.common_functions import CommonFunctions
-from support.random_utils import click_random_option_by_text
-from datetime import date, timedelta
-
-
-class HomePage:
-
-    def __init__(self, page: Page, context: BrowserContext, base_url: str):
-        self.page = page
-        self.base_url = base_url
-        
-        # page instances
-        self.common_functions = CommonFunctions(page)
-
-        # Locators
+from support.random_utils import click_random_option_by_text, today
+from support.step_timer import timed_step
+from support.state_snapshots import SnapshotStore
+from support.perf_metrics import PerfMonitor
+from datetime import timedelta
+
+
+class HomePageElements:
+    """Locators and option lists shared by HomePage and AsyncHomePage."""
+
+    schedule_a_tour_options = ["Parent", "Spouse", "Family Member", "Friend", "Other"]
+
+    level_of_care_options = [
+        "Independent Living",
+        "Assisted Living",
+        "Memory Care",
+        "Respite Care",
+        "Not Sure",
+    ]
+
+    relationship_options = [
+        "Parent",
+        "Spouse",
+        "Myself",
+        "Relative",
+        "Friend",
+    ]
+
+    timeline_options = [
+        "Immediately",
+        "1 to 3 Months",
+        "3 Months +",
+        "Just Researching"
+    ]
+
+    time_options = [
+        "8:00 AM", "9:00 AM", "10:00 AM", "11:00 AM",
+        "12:00 PM", "1:00 PM", "3:00 PM",
+        "4:00 PM", "5:00 PM", "6:00 PM", "7:00 PM"
+    ]
+
+    activities = [
+        "Happy Hour",
+        "Music Activities",
+        "Exercise Classes",
+        "Game Night & Bingo",
+        "Cooking",
+        "Group Outings",
+        "No, thank you"
+    ]
+
+    def __init__(self, page):
+        # Locators (sync and async pages build them the same way)
         self.initial_options_btn = page.locator("label.option-button.primary")
         self.home_page_header_selector = page.locator("div.banner-text:has-text('Welcome to the live Further demo!')")
         self.next_btn = page.get_by_role("button", name="Next")
@@ -29,57 +68,41 @@ class HomePage:
         self.activities_locator = "label.option-button"
         self.time_locator = "div.time"
 
+    @staticmethod
+    def tour_day() -> str:
+        """Day of month to book: 2 days ahead, since one day ahead is already selected by default."""
+        return str((today() + timedelta(days=2)).day)
+
 
-        # Arrays
-
-        self.schedule_a_tour_options = ["Parent", "Spouse", "Family Member", "Friend", "Other"]
-
-        self.level_of_care_options = [
-            "Independent Living",
-            "Assisted Living",
-            "Memory Care",
-            "Respite Care",
-            "Not Sure",
-        ]
-
-        self.relationship_options = [
-            "Parent",
-            "Spouse",
-            "Myself",
-            "Relative",
-            "Friend",
-        ]
-
-        self.timeline_options = [
-            "Immediately",
-            "1 to 3 Months",
-            "3 Months +",
-            "Just Researching"
-        ]
-
-        self.time_options = [
-            "8:00 AM", "9:00 AM", "10:00 AM", "11:00 AM",
-            "12:00 PM", "1:00 PM", "3:00 PM",
-            "4:00 PM", "5:00 PM", "6:00 PM", "7:00 PM"
-        ]
-
-        self.activities = [
-            "Happy Hour",
-            "Music Activities",
-            "Exercise Classes",
-            "Game Night & Bingo",
-            "Cooking",
-            "Group Outings",
-            "No, thank you"
-        ]
+class HomePage(HomePageElements):
+
+    def __init__(self, page: Page, context: BrowserContext, base_url: str,
+                 snapshot_store: SnapshotStore | None = None, restored_snapshot: str | None = None,
+                 perf_monitor: PerfMonitor | None = None):
+        super().__init__(page)
+        self.page = page
+        self.context = context
+        self.base_url = base_url
+        self.snapshot_store = snapshot_store
+        self.restored_snapshot = restored_snapshot
+        # Times every click to the next chat bubble in the page itself; the page object only reads the results
+        self.perf_monitor = perf_monitor
+        
+        # page instances
+        self.common_functions = CommonFunctions(page)
 
     # Functions
 
+    @timed_step
     def navigate_to_home_page(self):
-        """Navigate to the homepage."""
-        self.page.goto(self.base_url)
-        self.page.wait_for_load_state("networkidle")
+        """
+        Navigate to the homepage. Waits for the welcome banner rather than
+        `networkidle`, which never settles while the chat widget long-polls.
+        """
+        self.page.goto(self.base_url, wait_until="domcontentloaded")
         self.home_page_header_selector.wait_for(state="visible")
+        if self.perf_monitor:
+            self.perf_monitor.capture_page_load(self.page)
 
     def select_random_option(self, options: list, locator):
         """
@@ -94,14 +117,12 @@ class HomePage:
         self.common_functions.click_button(locator)
     
     
+    @timed_step
     def select_tour_date_and_time(self): 
         
-        """ Date calculation logic, select 2 days ahead since one day ahead is already selected by default
+        """ Select the tour day (see `tour_day`) and a random time slot
         """
-        tomorrow = date.today() + timedelta(days=2)
-        tomorrow_day_str = str(tomorrow.day)
-
-        day_locator = self.page.locator(f"div.day-in-month:has-text('{tomorrow_day_str}')")
+        day_locator = self.page.locator(f"div.day-in-month:has-text('{self.tour_day()}')")
 
         day_locator.wait_for(state="visible")
         day_locator.click()
@@ -145,5 +166,38 @@ class HomePage:
         """
         self.common_functions.click_button(self.close_chat_btn)
 
-    def wait(self): 
-        self.page.wait_for_timeout(10000)
+    def checkpoint(self, name: str, data: dict | None = None):
+        """
+        Capture the current storage state as snapshot `name` so later tests
+        can start from this point (`@pytest.mark.start_from(name)`).
+        """
+        if self.snapshot_store is not None:
+            self.snapshot_store.capture(name, self.context, self.page, data)
+
+    def resume_from_checkpoint(self, name: str, ready_locator=None, timeout: int = 10000) -> bool:
+        """
+        Open the page restored from snapshot `name` and wait for `ready_locator`.
+        Returns False, with storage cleared, when the snapshot is unavailable or
+        the chat did not resume; the caller should then replay the flow prefix.
+        """
+        if self.restored_snapshot != name:
+            return False
+        self.page.goto(self.snapshot_store.url(name), wait_until="domcontentloaded")
+        if ready_locator is None or self.common_functions.element_is_visible(ready_locator, timeout=timeout):
+            return True
+        self.context.clear_cookies()
+        self.page.evaluate("() => { window.localStorage.clear(); window.sessionStorage.clear(); }")
+        return False
+
+    def wait_for_next_message(self, action):
+        """
+        Run `action` (e.g. a click) and wait until a new chat bubble appears.
+        Returns the new number of chat bubbles.
+        """
+        return self.common_functions.wait_for_count_change(self.info_message, action)
+
+    def wait(self, timeout: int = 60000):
+        """
+        Wait for the chat to settle, i.e. until the 'please wait' banner is gone.
+        """
+        self.common_functions.wait_for_element_to_disappear(self.please_wait_banner, timeout=timeout)
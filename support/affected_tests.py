@@ -0,0 +1,173 @@
+"""
+Select the tests affected by changed files.
+
+A test depends on its own module, the conftest.py files above it, the
+modules that define the fixtures it uses and the modules imported by any of
+those, anywhere in the test module and conftest.py and inside the fixture
+bodies (the UI/API fixtures import lazily). From there, dependencies are
+followed transitively through module-level imports only, so e.g. a CLI
+helper importing a client inside a function does not make every test
+depend on that client. A test is selected when
+one of its dependencies changed, e.g. a change to pages/home_page.py selects
+the E2E tests and a change under api_utils/ selects the API and load tests.
+
+Data files count as changes to the module that reads them (DATA_DEPENDENCIES).
+Any other changed file that is not Python and not in IGNORED_CHANGES (e.g.
+requirements.txt) selects every test.
+"""
+import ast
+import fnmatch
+import inspect
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Data directory -> module that loads it
+DATA_DEPENDENCIES = {
+    "flows/": "support/flow_engine.py",
+    "har/": "support/har_replay.py",
+}
+# Changes that cannot affect a test outcome
+IGNORED_CHANGES = ["*.md", ".gitignore", ".github/*", "benchmarks/*", "requests.jsonl"]
+
+
+def changed_files(base: str = "HEAD", root: Path = ROOT) -> set[str]:
+    """
+    Files changed since `base` (its merge base with HEAD for branch names such
+    as origin/main), including uncommitted and untracked files.
+    """
+    def git(*args) -> list[str]:
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=True)
+        return [line for line in result.stdout.splitlines() if line]
+
+    merge_base = base
+    if base != "HEAD":
+        merge_base = (git("merge-base", base, "HEAD") or [base])[0]
+    return set(git("diff", "--name-only", merge_base)) | set(git("ls-files", "--others", "--exclude-standard"))
+
+
+def _resolve(module: str, root: Path) -> list[str]:
+    """Repository files a dotted module name may refer to (nothing for third-party modules)."""
+    base = root / Path(*module.split("."))
+    return [
+        str(path.relative_to(root)) for path in (base.with_suffix(".py"), base / "__init__.py") if path.is_file()
+    ]
+
+
+def _module_level(tree: ast.AST):
+    """Like ast.walk, but without descending into function bodies."""
+    pending = list(ast.iter_child_nodes(tree))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            continue
+        yield node
+        pending.extend(ast.iter_child_nodes(node))
+
+
+def _imports(tree: ast.AST, path: str, root: Path, nested: bool = False) -> set[str]:
+    """Repository files imported in `tree` (parsed from `path`); with `nested` also inside functions."""
+    package = list(Path(path).parent.parts)
+    files = set()
+    for node in (ast.walk(tree) if nested else _module_level(tree)):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                files.update(_resolve(alias.name, root))
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            if node.level:
+                parent = package[:len(package) - node.level + 1]
+                module = ".".join(filter(None, [*parent, module]))
+            files.update(_resolve(module, root))
+            for alias in node.names:
+                files.update(_resolve(f"{module}.{alias.name}" if module else alias.name, root))
+    return files
+
+
+@lru_cache(maxsize=None)
+def _parse(path: str, root: Path) -> ast.AST | None:
+    try:
+        return ast.parse((root / path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def module_dependencies(path: str, root: Path = ROOT) -> frozenset[str]:
+    """`path` and every repository file it imports at module level, transitively (paths relative to `root`)."""
+    seen = {path}
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        tree = _parse(current, root)
+        for dependency in (_imports(tree, current, root) if tree else set()) - seen:
+            seen.add(dependency)
+            pending.append(dependency)
+    return frozenset(seen)
+
+
+@lru_cache(maxsize=None)
+def file_dependencies(path: str, root: Path = ROOT) -> frozenset[str]:
+    """`module_dependencies` of `path` and of everything imported anywhere in it, function bodies included."""
+    tree = _parse(path, root)
+    dependencies = set(module_dependencies(path, root))
+    for imported in (_imports(tree, path, root, nested=True) if tree else set()):
+        dependencies |= module_dependencies(imported, root)
+    return frozenset(dependencies)
+
+
+def _relative(path, root: Path) -> str | None:
+    try:
+        return str(Path(path).resolve().relative_to(root))
+    except (TypeError, ValueError):
+        return None
+
+
+def function_dependencies(func, root: Path = ROOT) -> set[str]:
+    """Dependencies of the module defining `func` plus of the imports inside its body."""
+    func = inspect.unwrap(func)
+    path = _relative(inspect.getsourcefile(func), root)
+    if path is None:
+        return set()  # pytest built-ins and third-party fixtures
+    dependencies = set(module_dependencies(path, root))
+    try:
+        body = ast.parse(inspect.cleandoc("\n" + inspect.getsource(func)))
+    except (OSError, TypeError, SyntaxError):
+        return dependencies
+    for imported in _imports(body, path, root, nested=True):
+        dependencies |= module_dependencies(imported, root)
+    return dependencies
+
+
+def item_dependencies(item, root: Path = ROOT) -> set[str]:
+    """Every repository file the outcome of a collected pytest item may depend on."""
+    test_path = _relative(item.path, root)
+    dependencies = set(file_dependencies(test_path, root)) if test_path else set()
+    directory = Path(test_path or ".").parent
+    for directory in [directory, *directory.parents]:
+        if (root / directory / "conftest.py").is_file():
+            dependencies |= file_dependencies(str(directory / "conftest.py"), root)
+    fixture_info = getattr(item, "_fixtureinfo", None)
+    for fixture_defs in (fixture_info.name2fixturedefs.values() if fixture_info else []):
+        for fixture_def in fixture_defs:
+            dependencies |= function_dependencies(fixture_def.func, root)
+    return dependencies
+
+
+def select(items: list, changed: set[str], root: Path = ROOT) -> tuple[list, list]:
+    """Split `items` into (selected, deselected) for the `changed` files."""
+    changed_modules = set()
+    for path in changed:
+        module = next((module for prefix, module in DATA_DEPENDENCIES.items() if path.startswith(prefix)), None)
+        if module:
+            changed_modules.add(module)
+        elif path.endswith(".py"):
+            changed_modules.add(path)
+        elif not any(fnmatch.fnmatch(path, pattern) for pattern in IGNORED_CHANGES):
+            return list(items), []  # e.g. requirements.txt: everything may be affected
+    selected, deselected = [], []
+    for item in items:
+        (selected if item_dependencies(item, root) & changed_modules else deselected).append(item)
+    return selected, deselected
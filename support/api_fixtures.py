@@ -0,0 +1,113 @@
+"""
+API fixtures (base URL, response cache, cleanup registry, API clients).
+
+Loaded as a pytest plugin from conftest.py. Clients are imported inside the
+fixtures, so e.g. aiohttp is only imported when the async client is used.
+"""
+from pathlib import Path
+import pytest
+
+from config.config import BASE_API_URL, USE_LOCAL_API
+from config.config import API_CACHE, API_CACHE_TTL, API_CACHE_SIZE, API_CACHE_DIR
+from config.config import CLEANUP, CLEANUP_SCOPE, CLEANUP_JOURNAL_DIR, WORKER_ID
+
+api_cache_stats_key = pytest.StashKey[dict]()
+cleanup_stats_key = pytest.StashKey[dict]()
+
+
+@pytest.fixture(scope="session")
+def api_base_url():
+    """
+    Base URL for API tests. With USE_LOCAL_API=true a local stand-in server
+    is started once per session on a random port and used instead.
+    """
+    if not USE_LOCAL_API:
+        yield BASE_API_URL
+        return
+    from support.fake_rest_server import FakeRestServer
+
+    with FakeRestServer() as server:
+        yield server.url
+
+@pytest.fixture(scope="session")
+def api_response_cache(pytestconfig):
+    """Session-wide GET response cache, or None unless API_CACHE=true."""
+    if not API_CACHE:
+        yield None
+        return
+    from api_utils.response_cache import ResponseCache
+
+    cache = ResponseCache(max_entries=API_CACHE_SIZE, ttl=API_CACHE_TTL, disk_dir=API_CACHE_DIR or None)
+    yield cache
+    pytestconfig.stash[api_cache_stats_key] = cache.stats()
+
+@pytest.fixture(scope="session")
+def cleanup_registry(pytestconfig):
+    """
+    Tracks records created through the API clients and deletes them in
+    parallel at session end. Leftovers journaled by a crashed earlier run of
+    this worker are deleted first. None when CLEANUP=false.
+    """
+    if not CLEANUP:
+        yield None
+        return
+    from api_utils.cleanup_registry import CleanupRegistry
+
+    # The local stand-in keeps nothing across runs, so there is nothing to recover later
+    journal = None if USE_LOCAL_API else Path(CLEANUP_JOURNAL_DIR) / f"worker_{WORKER_ID}.jsonl"
+    registry = CleanupRegistry(journal)
+    registry.recover()
+    yield registry
+    registry.teardown()
+    registry.close()
+    pytestconfig.stash[cleanup_stats_key] = registry.stats()
+
+@pytest.fixture
+def api_cleanup(cleanup_registry):
+    """
+    The cleanup registry; with CLEANUP_SCOPE=test, records created during the
+    test are deleted when it finishes instead of at session end.
+    """
+    if cleanup_registry is None or CLEANUP_SCOPE != "test":
+        yield cleanup_registry
+        return
+    existing = cleanup_registry.pending()
+    yield cleanup_registry
+    cleanup_registry.teardown(cleanup_registry.pending() - existing)
+
+@pytest.fixture
+def authors_api(api_base_url, api_response_cache, api_cleanup):
+    """
+    Returns an instance of AuthorsAPI which extends BaseAPI.
+    """
+    from api_utils.authors_api import AuthorsAPI
+
+    return AuthorsAPI(api_base_url, registry=api_cleanup, cache=api_response_cache)
+
+@pytest.fixture
+def async_authors_api(api_base_url, api_cleanup):
+    """
+    Returns an instance of AsyncAuthorsAPI. The underlying session is created
+    lazily inside the event loop that first uses it, e.g. `asyncio.run(...)`.
+    """
+    from api_utils.async_authors_api import AsyncAuthorsAPI
+
+    return AsyncAuthorsAPI(api_base_url, registry=api_cleanup)
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report API round trips saved by the response cache and records cleaned up."""
+    stats = config.stash.get(api_cache_stats_key, None)
+    if stats:
+        terminalreporter.write_sep("-", "api response cache")
+        terminalreporter.write_line(
+            f"{stats['hits']} hits, {stats['misses']} misses, {stats['revalidations']} revalidations, "
+            f"{stats['invalidations']} invalidations."
+        )
+    stats = config.stash.get(cleanup_stats_key, None)
+    if stats and (stats['registered'] or stats['recovered']):
+        terminalreporter.write_sep("-", "api cleanup")
+        terminalreporter.write_line(
+            f"{stats['registered']} records created, {stats['forgotten']} deleted by tests, "
+            f"{stats['deleted']} cleaned up ({stats['recovered']} left by a previous run), "
+            f"{stats['failed']} failed, {stats['pending']} left in the journal."
+        )
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable
+from playwright.async_api import Page, Locator, expect
+from support.common_functions import POLL_INITIAL_INTERVAL, POLL_MAX_INTERVAL, POLL_BACKOFF
+from support.step_timer import timed_async_step
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCommonFunctions:
+    """
+    asyncio sibling of CommonFunctions for `playwright.async_api` pages, so
+    many conversations can be driven from one event loop.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    @timed_async_step
+    async def click_button(self, locator: Locator, index: int = 0, timeout: int = 60000):
+        """Scroll to and click a button or element."""
+        try:
+            element = locator.nth(index)
+            logger.info("Clicking button at index %s.", index)
+            await element.scroll_into_view_if_needed(timeout=timeout)
+            await element.click(timeout=timeout)
+        except Exception as e:
+            logger.error("Failed to click button: %s", e)
+            raise
+
+    @timed_async_step
+    async def click_random_option_by_text(self, text_options: list[str],
+                                          locator_prefix: str = "label.option-button.primary") -> str:
+        """Click an element matching `locator_prefix` with a randomly chosen text from `text_options`."""
+        selected_text = random.choice(text_options)
+        await self.page.locator(f"{locator_prefix}:has-text('{selected_text}')").click()
+        logger.info("Selected option: %s", selected_text)
+        return selected_text
+
+    @timed_async_step
+    async def input_text(self, locator: Locator, text: str, index: int = 0, timeout: int = 60000):
+        """Input text into a given element."""
+        try:
+            element = locator.nth(index)
+            logger.info("Filling %s characters into element at index %s.", len(text), index, extra={"text": text})
+            await element.fill(text, timeout=timeout)
+        except Exception as e:
+            logger.error("Failed to input text: %s", e)
+            raise
+
+    @timed_async_step
+    async def element_is_visible(self, locator: Locator, timeout: int = 60000) -> bool:
+        """Check if an element is visible."""
+        try:
+            await expect(locator).to_be_visible(timeout=timeout)
+            return True
+        except AssertionError as e:
+            logger.error("Error checking element visibility: %s", e)
+            return False
+
+    @timed_async_step
+    async def element_is_not_visible(self, locator: Locator, timeout: int = 60000) -> bool:
+        """Check if an element is NOT visible (hidden or detached)."""
+        try:
+            await expect(locator).not_to_be_visible(timeout=timeout)
+            return True
+        except AssertionError as e:
+            logger.error("Error checking element non-visibility: %s", e)
+            return False
+
+    @timed_async_step
+    async def is_text_visible(self, locator: Locator, expected_text: str, index: int = 0, timeout: int = 60000) -> None:
+        """Verify the element at `index` is visible and its text equals `expected_text`."""
+        element = locator.nth(index)
+        await element.wait_for(state="visible", timeout=timeout)
+        actual_text = (await element.inner_text()).strip()
+        assert actual_text == expected_text.strip(), f"Expected: '{expected_text}', but got: '{actual_text}'"
+
+    @timed_async_step
+    async def is_text_present_on_page(self, expected_text: str, timeout: int = 60000):
+        """Verify the expected text is visible anywhere on the page."""
+        await self.page.wait_for_selector(f"text={expected_text}", timeout=timeout)
+
+    async def poll_until(self, condition: Callable[[], Awaitable[object]], description: str, timeout: int = 60000):
+        """
+        Await `condition` until it returns a truthy value, backing off like
+        CommonFunctions.poll_until. Other conversations run while this one sleeps.
+        """
+        start = time.perf_counter()
+        deadline = start + timeout / 1000
+        interval = POLL_INITIAL_INTERVAL
+        while True:
+            result = await condition()
+            if result:
+                logger.info("Waited %.3fs for %s.", time.perf_counter() - start, description)
+                return result
+            if time.perf_counter() >= deadline:
+                raise TimeoutError(f"Timed out after {timeout}ms waiting for {description}.")
+            await asyncio.sleep(interval / 1000)
+            interval = min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+
+    @timed_async_step
+    async def wait_for_count_change(self, locator: Locator, action: Callable[[], Awaitable[None]] | None = None,
+                                    previous_count: int | None = None, timeout: int = 60000) -> int:
+        """Async CommonFunctions.wait_for_count_change; `action` is a coroutine function."""
+        if previous_count is None:
+            previous_count = await locator.count()
+        if action:
+            await action()
+        current = {}
+
+        async def count_changed():
+            current["count"] = await locator.count()
+            return current["count"] != previous_count
+
+        await self.poll_until(count_changed, f"element count to change from {previous_count}", timeout)
+        return current["count"]
+
+    @timed_async_step
+    async def wait_for_element_to_disappear(self, locator: Locator, timeout: int = 60000):
+        """Wait until an element is hidden or detached."""
+        await locator.first.wait_for(state="hidden", timeout=timeout)
@@ -0,0 +1,97 @@
+import logging
+import time
+from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Keeps one browser alive per worker process for the whole session.
+    Tests are isolated through fresh browser contexts; the browser itself is
+    recycled after `max_contexts` contexts or when it has crashed/disconnected.
+    """
+
+    def __init__(self, headless: bool = False, max_contexts: int = 50, launch_args: list[str] | None = None):
+        self.headless = headless
+        self.max_contexts = max_contexts
+        self.launch_args = launch_args or ["--window-size=1920,1080"]
+
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._contexts_on_browser = 0
+
+        # Statistics
+        self.launches = 0
+        self.recycles = 0
+        self.crashes = 0
+        self.contexts_served = 0
+        self.launch_durations: list[float] = []
+
+    @property
+    def browser(self) -> Browser:
+        """Return a healthy browser, launching or relaunching it if needed."""
+        if self._browser is None:
+            self._launch()
+        elif not self._browser.is_connected():
+            logger.warning("Browser disconnected, relaunching.")
+            self.crashes += 1
+            self._browser = None
+            self._launch()
+        elif self._contexts_on_browser >= self.max_contexts:
+            logger.info(f"Recycling browser after {self._contexts_on_browser} contexts.")
+            self.recycles += 1
+            self._close_browser()
+            self._launch()
+        return self._browser
+
+    def new_context(self, **kwargs) -> BrowserContext:
+        """Create a fresh, isolated browser context on the pooled browser."""
+        context = self.browser.new_context(**kwargs)
+        self._contexts_on_browser += 1
+        self.contexts_served += 1
+        return context
+
+    def close(self):
+        """Close the browser and stop Playwright."""
+        self._close_browser()
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def stats(self) -> dict:
+        """
+        Summarise pool usage. Saved launch time is estimated as the number of
+        launches avoided multiplied by the average measured launch duration.
+        """
+        average_launch = sum(self.launch_durations) / len(self.launch_durations) if self.launch_durations else 0.0
+        launches_avoided = max(self.contexts_served - self.launches, 0)
+        return {
+            "launches": self.launches,
+            "recycles": self.recycles,
+            "crashes": self.crashes,
+            "contexts_served": self.contexts_served,
+            "average_launch_seconds": round(average_launch, 3),
+            "launches_avoided": launches_avoided,
+            "estimated_seconds_saved": round(launches_avoided * average_launch, 3),
+        }
+
+    def _launch(self):
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        start = time.perf_counter()
+        self._browser = self._playwright.chromium.launch(headless=self.headless, args=self.launch_args)
+        duration = time.perf_counter() - start
+        self.launch_durations.append(duration)
+        self.launches += 1
+        self._contexts_on_browser = 0
+        logger.info(f"Launched browser in {duration:.2f}s (launch #{self.launches}).")
+
+    def _close_browser(self):
+        if self._browser is None:
+            return
+        try:
+            self._browser.close()
+        except Exception as e:
+            logger.warning(f"Failed to close browser cleanly: {e}")
+        self._browser = None
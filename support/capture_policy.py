@@ -0,0 +1,95 @@
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from playwright.sync_api import BrowserContext, Video
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_MODES = ("off", "on", "retain-on-failure", "trace-on-first-retry")
+
+
+class CapturePolicy:
+    """
+    Decides which artifacts a test records and keeps.
+
+    - off: no video, no trace.
+    - on: always record and keep video.
+    - retain-on-failure: record video, keep it only when the test fails.
+    - trace-on-first-retry: no video; record a Playwright trace on the first
+      retry (pytest-rerunfailures) and keep it when that retry fails.
+
+    Kept artifacts are named after the test and the attempt (1 for the first
+    run), so a rerun does not overwrite the artifacts of an earlier attempt.
+
+    Discarded videos are deleted on a background thread so teardown does not
+    wait on disk I/O.
+    """
+
+    def __init__(self, mode: str = "retain-on-failure", artifacts_dir: str = "videos",
+                 video_size: tuple[int, int] = (1280, 720)):
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"Unknown capture mode '{mode}', expected one of {CAPTURE_MODES}.")
+        self.mode = mode
+        self.artifacts_dir = Path(artifacts_dir)
+        self.video_size = video_size
+        self._cleanup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-cleanup")
+        self._videos: dict[int, list[Video]] = {}
+        self._tracing: set[int] = set()
+        self._attempts: dict[int, int] = {}
+
+    @property
+    def records_video(self) -> bool:
+        return self.mode in ("on", "retain-on-failure")
+
+    def context_options(self) -> dict:
+        """Options for `browser.new_context`."""
+        if not self.records_video:
+            return {}
+        width, height = self.video_size
+        return {"record_video_dir": str(self.artifacts_dir), "record_video_size": {"width": width, "height": height}}
+
+    def start(self, context: BrowserContext, retry: int = 0):
+        """Begin capturing for a test; `retry` is 0 for the first attempt."""
+        self._attempts[id(context)] = retry + 1
+        if self.records_video:
+            videos = self._videos.setdefault(id(context), [])
+            context.on("page", lambda page: videos.append(page.video))
+        if self.mode == "trace-on-first-retry" and retry == 1:
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            self._tracing.add(id(context))
+
+    def finish(self, context: BrowserContext, test_name: str, failed: bool) -> list[Path]:
+        """
+        Close `context`, keep the artifacts the policy asks for and schedule
+        the rest for deletion. Returns the kept artifact paths.
+        """
+        safe_name = re.sub(r"[^\w.-]+", "_", test_name) + f"-attempt{self._attempts.pop(id(context), 1)}"
+        kept = []
+
+        if id(context) in self._tracing:
+            self._tracing.discard(id(context))
+            if failed:
+                trace_path = self.artifacts_dir / f"{safe_name}-trace.zip"
+                context.tracing.stop(path=trace_path)
+                kept.append(trace_path)
+            else:
+                context.tracing.stop()
+
+        videos = [video for video in self._videos.pop(id(context), []) if video]
+        context.close()  # Finalises the video files
+
+        keep_videos = self.mode == "on" or (self.mode == "retain-on-failure" and failed)
+        for index, video in enumerate(videos):
+            path = Path(video.path())
+            if keep_videos:
+                target = self.artifacts_dir / f"{safe_name}-{index}{path.suffix}"
+                path.replace(target)
+                kept.append(target)
+            else:
+                self._cleanup.submit(path.unlink, missing_ok=True)
+        return kept
+
+    def shutdown(self):
+        """Wait for pending deletions."""
+        self._cleanup.shutdown(wait=True)
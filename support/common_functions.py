@@ -1,25 +1,34 @@
 import logging
+import time
+from typing import Callable
 from playwright.sync_api import Page, Locator, expect
+from support.step_timer import timed_step
 
-# Logger configuration
+# Logging is configured by the entry point (pytest or a CLI), not on import
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Adaptive polling: start fast, back off while nothing changes
+POLL_INITIAL_INTERVAL = 25
+POLL_MAX_INTERVAL = 500
+POLL_BACKOFF = 1.5
 
 class CommonFunctions:
     def __init__(self, page: Page):
         self.page = page
 
+    @timed_step
     def click_button(self, locator: Locator, index: int = 0, timeout: int = 60000):
         """Scroll to and click a button or element."""
         try:
             element = locator.nth(index)
-            logger.info(f"Clicking button at index {index}.")
+            logger.info("Clicking button at index %s.", index)
             element.scroll_into_view_if_needed(timeout=timeout)
             element.click(timeout=timeout)
         except Exception as e:
-            logger.error(f"Failed to click button: {e}")
+            logger.error("Failed to click button: %s", e)
             raise
 
+    @timed_step
     def click_element_by_text(self, base_locator: str, text: str, timeout: int = 60000):
         """
         Clicks on an element based on the base locator and text content.
@@ -28,47 +37,52 @@ class CommonFunctions:
         """
         try:
             target_element = self.page.locator(f"{base_locator}:has-text('{text}')")
-            logger.info(f"Clicking element with text '{text}' using base locator '{base_locator}'.")
+            logger.info("Clicking element with text '%s' using base locator '%s'.", text, base_locator)
             expect(target_element).to_be_visible(timeout=timeout)
             target_element.click(timeout=timeout)
         except Exception as e:
-            logger.error(f"Failed to click element by text: {e}")
+            logger.error("Failed to click element by text: %s", e)
             raise
 
+    @timed_step
     def input_text(self, locator: Locator, text: str, index: int = 0, timeout: int = 60000):
         """Input text into a given element."""
         try:
             element = locator.nth(index)
-            logger.info(f"Filling text '{text}' into element at index {index}.")
+            # The typed value is an `extra` field so structured logs can redact it
+            logger.info("Filling %s characters into element at index %s.", len(text), index, extra={"text": text})
             element.fill(text, timeout=timeout)
         except Exception as e:
-            logger.error(f"Failed to input text: {e}")
+            logger.error("Failed to input text: %s", e)
             raise
 
+    @timed_step
     def element_is_visible(self, locator: Locator, timeout: int = 60000):
         """Check if an element is visible."""
         try:
             logger.info("Checking element visibility.")
             expect(locator).to_be_visible(timeout=timeout)
             visibility = locator.is_visible(timeout=timeout)
-            logger.info(f"Element is visible: {visibility}")
+            logger.info("Element is visible: %s", visibility)
             return visibility
         except Exception as e:
-            logger.error(f"Error checking element visibility: {e}")
+            logger.error("Error checking element visibility: %s", e)
             return False
 
+    @timed_step
     def element_is_not_visible(self, locator: Locator, timeout: int = 60000):
         """Check if an element is NOT visible (hidden or detached)."""
         try:
             logger.info("Checking if element is NOT visible.")
             expect(locator).not_to_be_visible(timeout=timeout)
             visibility = not locator.is_visible(timeout=timeout)
-            logger.info(f"Element is NOT visible: {visibility}")
+            logger.info("Element is NOT visible: %s", visibility)
             return visibility
         except Exception as e:
-            logger.error(f"Error checking element non-visibility: {e}")
+            logger.error("Error checking element non-visibility: %s", e)
             return False
 
+    @timed_step
     def is_text_visible(self, locator: Locator, expected_text: str, index: int = 0, timeout: int = 60000) -> None:
         """
         Verify if the expected text is visible in a specific element.
@@ -79,16 +93,19 @@ class CommonFunctions:
         """
         try:
             element = locator.nth(index)
-            logger.info(f"Verifying text '{expected_text}' is visible in element at index {index}.")
+            # Expected texts are often generated names/emails: keep them in the (redacted) extras only
+            logger.info("Verifying text is visible in element at index %s.", index, extra={"text": expected_text})
             element.wait_for(state="visible", timeout=timeout)
             actual_text = element.inner_text().strip()
             if actual_text != expected_text.strip():
-                logger.error(f"Text mismatch: Expected '{expected_text}', got '{actual_text}'.")
+                logger.error("Text mismatch in element at index %s.", index,
+                             extra={"text": expected_text, "actual_text": actual_text})
             assert actual_text == expected_text.strip(), f"Expected: '{expected_text}', but got: '{actual_text}'"
         except Exception as e:
-            logger.error(f"Text visibility verification failed: {e}")
+            logger.error("Text visibility verification failed: %s", type(e).__name__, extra={"text": expected_text})
             raise
 
+    @timed_step
     def is_text_present_on_page(self, expected_text: str, timeout: int = 60000):
         """
         Verify if the expected text is visible anywhere on the page.
@@ -96,9 +113,66 @@ class CommonFunctions:
         :param timeout: Timeout for waiting.
         """
         try:
-            logger.info(f"Verifying text '{expected_text}' is visible anywhere on the page.")
+            logger.info("Verifying text is visible anywhere on the page.", extra={"text": expected_text})
             self.page.wait_for_selector(f"text={expected_text}", timeout=timeout)
-            logger.info(f"Text '{expected_text}' is present on the page.")
+            logger.info("Text is present on the page.", extra={"text": expected_text})
         except Exception as e:
-            logger.error(f"Text visibility verification failed: {e}")
+            logger.error("Text visibility verification failed: %s", type(e).__name__, extra={"text": expected_text})
             raise
+
+
+    # Wait engine
+
+    def _log_wait(self, description: str, start: float):
+        logger.info("Waited %.3fs for %s.", time.perf_counter() - start, description)
+
+    def poll_until(self, condition: Callable[[], object], description: str, timeout: int = 60000):
+        """
+        Poll `condition` until it returns a truthy value, starting with a short
+        interval and backing off while nothing changes. Returns that value.
+        :param condition: Callable evaluated on every poll.
+        :param description: What is being waited for (used in logs/errors).
+        :param timeout: Timeout in milliseconds.
+        """
+        start = time.perf_counter()
+        deadline = start + timeout / 1000
+        interval = POLL_INITIAL_INTERVAL
+        while True:
+            result = condition()
+            if result:
+                self._log_wait(description, start)
+                return result
+            if time.perf_counter() >= deadline:
+                logger.error("Timed out after %sms waiting for %s.", timeout, description)
+                raise TimeoutError(f"Timed out after {timeout}ms waiting for {description}.")
+            # wait_for_timeout keeps Playwright's event loop running between polls
+            self.page.wait_for_timeout(interval)
+            interval = min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+
+    @timed_step
+    def wait_for_count_change(self, locator: Locator, action: Callable[[], None] | None = None,
+                              previous_count: int | None = None, timeout: int = 60000) -> int:
+        """
+        Wait until the number of elements matching `locator` differs from
+        `previous_count` (or from the count before `action` runs, if given).
+        Returns the new count.
+        """
+        if previous_count is None:
+            previous_count = locator.count()
+        if action:
+            action()
+        current = {}
+
+        def count_changed():
+            current["count"] = locator.count()
+            return current["count"] != previous_count
+
+        self.poll_until(count_changed, f"element count to change from {previous_count}", timeout)
+        return current["count"]
+
+    @timed_step
+    def wait_for_element_to_disappear(self, locator: Locator, timeout: int = 60000):
+        """Wait until an element is hidden or detached."""
+        start = time.perf_counter()
+        locator.first.wait_for(state="hidden", timeout=timeout)
+        self._log_wait("element to disappear", start)
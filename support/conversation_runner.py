@@ -0,0 +1,139 @@
+"""
+Concurrent chat conversations.
+
+Runs N independent conversations of a declarative flow (see flows/) from a
+single asyncio event loop: one browser, one context per conversation, and at
+most `concurrency` conversations in flight. Every conversation is timed end
+to end and the results are reported like the API load generator (p50/p95/p99,
+error breakdown), so this doubles as a synthetic UI load generator.
+
+Usage:
+    python -m support.conversation_runner --flow pricing --conversations 20 --concurrency 5
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from playwright.async_api import async_playwright, Browser, Route
+
+from api_utils.load_generator import LoadReport
+from config.config import BASE_URL, HEADLESS, UI_CONVERSATIONS, UI_CONCURRENCY, NETWORK_ROUTING, BLOCKED_RESOURCE_TYPES
+from pages.async_home_page import AsyncHomePage
+from support.flow_engine import AsyncFlowEngine
+from support.step_timer import timer as step_timer
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationRunner:
+    """
+    :param concurrency: Maximum number of conversations in flight.
+    :param block_resources: Abort requests of BLOCKED_RESOURCE_TYPES (images, fonts, ...).
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        concurrency: int = UI_CONCURRENCY,
+        headless: bool = HEADLESS,
+        block_resources: bool = NETWORK_ROUTING
+    ):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.headless = headless
+        self.block_resources = block_resources
+        self.conversations: list[dict] = []
+
+    @staticmethod
+    async def _block_heavy_resources(route: Route):
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.fallback()
+
+    async def _conversation(self, browser: Browser, index: int, flow: str, semaphore: asyncio.Semaphore,
+                            report: LoadReport):
+        async with semaphore:
+            context = await browser.new_context(viewport={"width": 1280, "height": 720})
+            if self.block_resources:
+                await context.route("**/*", self._block_heavy_resources)
+            page = await context.new_page()
+            engine = AsyncFlowEngine(AsyncHomePage(page, context, self.base_url))
+            start = time.perf_counter()
+            error = None
+            try:
+                await engine.run(flow)
+            except Exception as e:
+                error = type(e).__name__
+                logger.error(f"Conversation {index} failed: {e}")
+            finally:
+                duration = time.perf_counter() - start
+                await context.close()
+            report.record(flow, duration, error)
+            self.conversations.append({
+                "index": index,
+                "duration": round(duration, 3),
+                "error": error,
+                "steps": [{"step": timing.label, "duration": round(timing.duration, 3)} for timing in engine.timings],
+            })
+
+    async def run_async(self, flow: str, conversations: int = UI_CONVERSATIONS) -> LoadReport:
+        report = LoadReport(title=f"Concurrent conversations: {flow}", unit="conversations")
+        self.conversations = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        logger.info(f"Starting {conversations} '{flow}' conversations, {self.concurrency} at a time.")
+        # Conversation durations are the measurement here; skip per-action step timing
+        step_timing_enabled, step_timer.enabled = step_timer.enabled, False
+        try:
+            async with async_playwright() as playwright:
+                browser = await playwright.chromium.launch(headless=self.headless)
+                start = time.perf_counter()
+                try:
+                    await asyncio.gather(*(
+                        self._conversation(browser, index, flow, semaphore, report) for index in range(conversations)
+                    ))
+                finally:
+                    report.duration = time.perf_counter() - start
+                    await browser.close()
+        finally:
+            step_timer.enabled = step_timing_enabled
+        logger.info(f"Conversations finished: {report.total_requests} in {report.duration:.1f}s, "
+                    f"error rate {report.error_rate:.2%}.")
+        return report
+
+    def run(self, flow: str, conversations: int = UI_CONVERSATIONS) -> LoadReport:
+        """
+        Blocking wrapper around `run_async`. The event loop runs on its own
+        thread so it never clashes with a sync Playwright instance (e.g. the
+        session browser pool) in the calling thread.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="conversations") as executor:
+            return executor.submit(asyncio.run, self.run_async(flow, conversations)).result()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run many chat conversations concurrently.")
+    parser.add_argument("--flow", default="schedule_a_tour", help="Flow name from FLOW_DIR.")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--conversations", type=int, default=UI_CONVERSATIONS)
+    parser.add_argument("--concurrency", type=int, default=UI_CONCURRENCY)
+    parser.add_argument("--output", default="reports/conversations.json", help="JSON report path.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    runner = ConversationRunner(args.base_url, args.concurrency)
+    report = asyncio.run(runner.run_async(args.flow, args.conversations))
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps({**report.to_dict(), "conversations": runner.conversations}, indent=2))
+    Path(args.output).with_suffix(".html").write_text(report.to_html())
+    print(report.to_json())
+    return 0 if not report.errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Pre-generated test data pool.
+
+Users and author payloads are generated in batches up front with one seeded
+Faker instance, so data generation stays out of the test hot path. Records
+are served with `deque.popleft()`, which is atomic, so threads share a pool
+without locking; the lock is only taken to refill an exhausted batch.
+
+Parallel workers get disjoint, interleaved author ID ranges (worker N of M
+uses IDs start+N, start+N+M, ...) and worker-tagged emails, so records never
+collide across processes. A pool can be saved to disk and reloaded to rerun
+with exactly the same data.
+"""
+import json
+import logging
+import random
+import threading
+from collections import deque
+from pathlib import Path
+from faker import Faker
+
+logger = logging.getLogger(__name__)
+
+AUTHOR_ID_START = 10000
+AUTHOR_ID_END = 100000
+
+
+class DataPool:
+    def __init__(self, seed: int, worker_id: int = 0, worker_count: int = 1, batch_size: int = 500):
+        self.seed = seed
+        self.worker_id = worker_id
+        self.worker_count = max(worker_count, 1)
+        self.batch_size = batch_size
+
+        self._faker = Faker("en_US")
+        self._faker.seed_instance(seed + worker_id)
+        self._random = random.Random(seed + worker_id)
+
+        author_ids = list(range(AUTHOR_ID_START + worker_id, AUTHOR_ID_END, self.worker_count))
+        self._random.shuffle(author_ids)
+        self._author_ids = deque(author_ids)
+
+        self._users: deque = deque()
+        self._authors: deque = deque()
+        self._user_index = 0
+        self._refill_lock = threading.Lock()
+
+    def _phone(self) -> str:
+        # NANP: area code and exchange never start with 0 or 1
+        area = self._random.randint(200, 999)
+        exchange = self._random.randint(200, 999)
+        line = self._random.randint(0, 9999)
+        return f"+1-{area}-{exchange}-{line:04d}"
+
+    def _generate_users(self, count: int) -> list[dict]:
+        users = []
+        for _ in range(count):
+            first_name = self._faker.first_name()
+            last_name = self._faker.last_name()
+            self._user_index += 1
+            # Worker id + running index make every email unique across workers
+            email = f"{first_name}.{last_name}.{self.worker_id}x{self._user_index}@{self._faker.free_email_domain()}".lower()
+            users.append({
+                "first_name": first_name,
+                "last_name": last_name,
+                "full_name": f"{first_name} {last_name}",
+                "email": email,
+                "phone": self._phone(),
+            })
+        return users
+
+    def _generate_authors(self, count: int) -> list[dict]:
+        authors = []
+        for _ in range(min(count, len(self._author_ids))):
+            authors.append({
+                "id": self._author_ids.popleft(),
+                "idBook": 0,
+                "firstName": self._faker.first_name(),
+                "lastName": self._faker.last_name(),
+            })
+        if not authors:
+            raise RuntimeError(f"Author ID range exhausted for worker {self.worker_id}.")
+        return authors
+
+    def _take(self, records: deque, generate) -> dict:
+        while True:
+            try:
+                return dict(records.popleft())
+            except IndexError:
+                with self._refill_lock:
+                    if not records:
+                        records.extend(generate(self.batch_size))
+
+    def next_user(self) -> dict:
+        """Return an unused user (first/last/full name, email and a valid 10-digit phone)."""
+        return self._take(self._users, self._generate_users)
+
+    def next_author(self) -> dict:
+        """Return an unused author payload with a unique ID."""
+        return self._take(self._authors, self._generate_authors)
+
+    def prefill(self, users: int = 0, authors: int = 0):
+        """Generate records ahead of time, e.g. before a load run."""
+        with self._refill_lock:
+            self._users.extend(self._generate_users(max(users - len(self._users), 0)))
+            if authors > len(self._authors):
+                self._authors.extend(self._generate_authors(authors - len(self._authors)))
+
+    def save(self, path: str):
+        """Persist the records not yet served so a rerun gets the same data."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps({
+            "seed": self.seed,
+            "worker_id": self.worker_id,
+            "worker_count": self.worker_count,
+            "user_index": self._user_index,
+            "users": list(self._users),
+            "authors": list(self._authors),
+        }, indent=2))
+
+    @classmethod
+    def load(cls, path: str, batch_size: int = 500) -> "DataPool":
+        """Recreate a pool from a saved file; its records are served first."""
+        data = json.loads(Path(path).read_text())
+        pool = cls(data["seed"], data["worker_id"], data["worker_count"], batch_size)
+        used_ids = {author["id"] for author in data["authors"]}
+        pool._author_ids = deque(author_id for author_id in pool._author_ids if author_id not in used_ids)
+        pool._user_index = data["user_index"]
+        pool._users.extend(data["users"])
+        pool._authors.extend(data["authors"])
+        logger.info(f"Loaded data pool from {path} (seed {pool.seed}).")
+        return pool
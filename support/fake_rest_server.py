@@ -0,0 +1,159 @@
+"""
+In-process stand-in for the fake REST API (`/api/v1/Authors`).
+
+Mirrors the contract the API tests rely on: seeded authors can be fetched,
+POST/PUT echo a valid author back, DELETE always succeeds without removing
+the seeded record, and invalid payloads are rejected with a 400 validation
+problem response. Runs on a random loopback port in a background thread.
+"""
+import json
+import logging
+import re
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from api_utils.schemas import AUTHOR, AUTHOR_PAYLOAD
+
+logger = logging.getLogger(__name__)
+
+AUTHORS_PATH = "/api/v1/Authors"
+SEEDED_AUTHOR_COUNT = 200
+
+
+def seeded_authors(count: int = SEEDED_AUTHOR_COUNT) -> dict:
+    return {
+        author_id: {
+            "id": author_id,
+            "idBook": (author_id + 1) // 2,
+            "firstName": f"First Name {author_id}",
+            "lastName": f"Last Name {author_id}",
+        }
+        for author_id in range(1, count + 1)
+    }
+
+
+def validate_author(payload) -> dict:
+    """Return validation errors keyed by field, empty when the payload is valid."""
+    errors = {}
+    for path, _ in AUTHOR_PAYLOAD.errors(payload):
+        target = "Author" if path == "$" else AUTHOR_PAYLOAD.fields[path[2:]].type.__name__
+        errors[path] = [f"The JSON value could not be converted to {target}."]
+    return errors
+
+
+def to_author(payload: dict) -> dict:
+    """Echo a payload as a full author, defaulting missing fields like the real API."""
+    return {name: payload.get(name, 0 if spec.type is int else None) for name, spec in AUTHOR.fields.items()}
+
+
+class FakeRestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as two writes; with Nagle on, delayed ACKs stall
+    # every request on a kept-alive connection by ~40 ms
+    disable_nagle_algorithm = True
+    authors: dict = {}
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def _send_json(self, status: int, body=None):
+        data = b"" if body is None else json.dumps(body).encode()
+        self.server.requests_per_connection[self.client_address] += 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(raw or b"null")
+        except json.JSONDecodeError:
+            return None
+
+    def _author_id(self):
+        match = re.fullmatch(rf"{AUTHORS_PATH}/(-?\d+)", self.path.split("?")[0])
+        return int(match.group(1)) if match else None
+
+    def _validation_error(self, errors: dict):
+        self._send_json(400, {
+            "type": "https://tools.ietf.org/html/rfc7231#section-6.5.1",
+            "title": "One or more validation errors occurred.",
+            "status": 400,
+            "errors": errors,
+        })
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == AUTHORS_PATH:
+            return self._send_json(200, list(self.authors.values()))
+        book_match = re.fullmatch(rf"{AUTHORS_PATH}/authors/books/(\d+)", path)
+        if book_match:
+            id_book = int(book_match.group(1))
+            return self._send_json(200, [a for a in self.authors.values() if a["idBook"] == id_book])
+        author_id = self._author_id()
+        if author_id is None or author_id not in self.authors:
+            return self._send_json(404, {"title": "Not Found", "status": 404})
+        self._send_json(200, self.authors[author_id])
+
+    def do_POST(self):
+        if self.path.split("?")[0] != AUTHORS_PATH:
+            return self._send_json(404, {"title": "Not Found", "status": 404})
+        payload = self._read_json()
+        errors = validate_author(payload)
+        if errors:
+            return self._validation_error(errors)
+        self._send_json(200, to_author(payload))
+
+    def do_PUT(self):
+        if self._author_id() is None:
+            return self._send_json(404, {"title": "Not Found", "status": 404})
+        payload = self._read_json()
+        errors = validate_author(payload)
+        if errors:
+            return self._validation_error(errors)
+        self._send_json(200, to_author(payload))
+
+    def do_DELETE(self):
+        if self._author_id() is None:
+            return self._send_json(404, {"title": "Not Found", "status": 404})
+        self._send_json(200)
+
+
+class FakeRestServer:
+    """Runs the stand-in API on a random local port in a daemon thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        handler = type("Handler", (FakeRestHandler,), {"authors": seeded_authors()})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._server.requests_per_connection = Counter()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests_per_connection(self) -> Counter:
+        """Requests answered on each client connection, keyed by client address."""
+        return self._server.requests_per_connection
+
+    def start(self) -> "FakeRestServer":
+        self._thread.start()
+        logger.info(f"Local fake REST API listening on {self.url}.")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
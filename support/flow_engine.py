@@ -0,0 +1,347 @@
+"""
+Declarative chat-flow engine.
+
+A flow is a YAML (or JSON) file under FLOW_DIR listing the steps of one
+conversation path; `flows/common.yaml` holds the expected messages and
+reusable step fragments shared by all flows. Steps are executed through
+`HomePage`, so adding a conversation path is a data change:
+
+    - do: click_submit                      # any HomePage method without arguments
+    - select_option: Pricing                # one of the initial options
+    - select_random: {options: timeline_options, locator: tour_options_locator}
+    - input: "{email}"                      # formatted with the flow data (user details)
+    - expect_error: invalid_email           # message key from common.yaml
+    - expect_text: "{full_name}"            # text anywhere on the page
+    - expect_visible: please_wait_banner    # HomePage locator name or a selector
+    - expect_hidden: please_wait_banner
+    - checkpoint: pricing_contact_details   # storage snapshot, see HomePage.checkpoint
+    - use: contact_email                    # expand a fragment
+    - concurrent:                           # independent assertions, waited for together
+        - expect_visible: close_chat_btn
+        - expect_text: "{full_name}"
+
+Actions the bot answers with a new chat bubble (picking an option,
+submitting an answer) wait for that bubble through
+`HomePage.wait_for_next_message`, so each step takes as long as the app needs
+and the next one never acts on a half-rendered chat. Set `reply: false` on
+such a step when the bot does not answer it (e.g. a submit the input
+validation rejects, or ticking one of several options), or `reply: true` on
+any other action the bot answers.
+
+Any step may set `budget` (seconds, default FLOW_STEP_BUDGET). Every step is
+timed and recorded in the step timer; steps over budget are logged and, with
+FLOW_ENFORCE_BUDGETS=true, fail the flow once it has finished.
+
+AsyncFlowEngine runs the same definitions through an AsyncHomePage, e.g. for
+many concurrent conversations (see support/conversation_runner.py).
+"""
+import asyncio
+import functools
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+from config.config import FLOW_DIR, FLOW_STEP_BUDGET, FLOW_ENFORCE_BUDGETS
+from pages.home_page import HomePage
+from pages.async_home_page import AsyncHomePage
+from support.random_utils import generate_user_details
+from support.step_timer import timer as step_timer
+
+logger = logging.getLogger(__name__)
+
+COMMON_FILE = "common.yaml"
+ACTIONS = ("do", "select_option", "select_random", "input", "checkpoint")
+ASSERTIONS = ("expect_error", "expect_text", "expect_visible", "expect_hidden")
+STEP_KINDS = ACTIONS + ASSERTIONS + ("concurrent",)
+# Answered by the bot with a new chat bubble unless the step sets `reply: false`
+REPLIED_ACTIONS = ("select_option", "select_random")
+REPLIED_METHODS = ("click_submit", "click_confirm_selections", "click_schedule_a_visit")
+STEP_OPTIONS = ("budget", "reply")
+
+
+@dataclass(frozen=True)
+class Step:
+    kind: str
+    arg: object
+    budget: float = FLOW_STEP_BUDGET
+    reply: bool = False
+
+    @property
+    def label(self) -> str:
+        if self.kind == "concurrent":
+            return f"concurrent[{', '.join(step.label for step in self.arg)}]"
+        if self.kind == "select_random":
+            return f"select_random {self.arg['options']}"
+        return f"{self.kind} {self.arg}"
+
+
+@dataclass(frozen=True)
+class Flow:
+    name: str
+    description: str
+    steps: tuple[Step, ...]
+    messages: dict = field(default_factory=dict)
+
+
+@dataclass
+class StepTiming:
+    index: int
+    label: str
+    duration: float
+    budget: float
+
+    @property
+    def over_budget(self) -> bool:
+        return self.duration > self.budget
+
+
+def _read(path: Path) -> dict:
+    text = path.read_text()
+    return json.loads(text) if path.suffix == ".json" else yaml.safe_load(text) or {}
+
+
+def _compile_step(raw, fragments: dict, source: str) -> list[Step]:
+    if isinstance(raw, str):
+        raw = {"do": raw}
+    budget = float(raw.get("budget", FLOW_STEP_BUDGET))
+    kinds = [key for key in raw if key not in STEP_OPTIONS]
+    if len(kinds) != 1 or (kinds[0] not in STEP_KINDS and kinds[0] != "use"):
+        raise ValueError(f"{source}: expected one of {STEP_KINDS + ('use',)} per step, got {raw}.")
+    kind, arg = kinds[0], raw[kinds[0]]
+
+    if kind == "use":
+        if arg not in fragments:
+            raise ValueError(f"{source}: unknown fragment '{arg}'.")
+        return [step for fragment_step in fragments[arg] for step in _compile_step(fragment_step, fragments, source)]
+    if kind == "concurrent":
+        steps = tuple(step for child in arg for step in _compile_step(child, fragments, source))
+        if any(step.kind not in ASSERTIONS for step in steps):
+            raise ValueError(f"{source}: only {ASSERTIONS} can run concurrently.")
+        return [Step(kind, steps, budget)]
+    if kind == "select_random" and not {"options", "locator"} <= set(arg):
+        raise ValueError(f"{source}: select_random needs 'options' and 'locator'.")
+    reply = raw.get("reply", kind in REPLIED_ACTIONS or (kind == "do" and arg in REPLIED_METHODS))
+    if reply and kind not in ACTIONS:
+        raise ValueError(f"{source}: only {ACTIONS} can wait for a reply.")
+    return [Step(kind, arg, budget, bool(reply))]
+
+
+@functools.lru_cache(maxsize=None)
+def load_flow(name: str, flow_dir: str = FLOW_DIR) -> Flow:
+    """Parse, expand and validate a flow once per process."""
+    directory = Path(flow_dir)
+    common = _read(directory / COMMON_FILE) if (directory / COMMON_FILE).exists() else {}
+    path = next((directory / f"{name}{suffix}" for suffix in (".yaml", ".yml", ".json")
+                 if (directory / f"{name}{suffix}").exists()), None)
+    if path is None:
+        raise FileNotFoundError(f"No flow named '{name}' in {directory}.")
+    definition = _read(path)
+    fragments = {**common.get("fragments", {}), **definition.get("fragments", {})}
+    steps = [step for raw in definition["steps"] for step in _compile_step(raw, fragments, str(path))]
+    return Flow(
+        name=definition.get("name", name),
+        description=definition.get("description", ""),
+        steps=tuple(steps),
+        messages={**common.get("messages", {}), **definition.get("messages", {})}
+    )
+
+
+def find_checkpoint_flow(checkpoint: str, flow_dir: str = FLOW_DIR) -> str:
+    """Name of the first flow (by file name) with a `checkpoint` step named `checkpoint`."""
+    for path in sorted(Path(flow_dir).iterdir()):
+        if path.name == COMMON_FILE or path.suffix not in (".yaml", ".yml", ".json"):
+            continue
+        if any(step.kind == "checkpoint" and step.arg == checkpoint for step in load_flow(path.stem, flow_dir).steps):
+            return path.stem
+    raise ValueError(f"No flow in {flow_dir} has a checkpoint '{checkpoint}'.")
+
+
+class FlowEngine:
+    def __init__(self, home_page: HomePage | AsyncHomePage, flow_dir: str = FLOW_DIR, enforce_budgets: bool = FLOW_ENFORCE_BUDGETS):
+        self.home_page = home_page
+        self.common_functions = home_page.common_functions
+        self.flow_dir = flow_dir
+        self.enforce_budgets = enforce_budgets
+        self.timings: list[StepTiming] = []
+        self._locators: dict = {}
+
+    def run(self, name: str, data: dict | None = None, start_after: str | None = None,
+            stop_after: str | None = None) -> dict:
+        """
+        Run flow `name` with `data` (fresh user details by default) and return the data.
+        `start_after`/`stop_after` name a checkpoint step to resume from or stop at.
+        """
+        flow, data, steps = self._plan(name, data, start_after, stop_after)
+        for index, step in steps:
+            start = time.perf_counter()
+            if step.reply:
+                self.home_page.wait_for_next_message(lambda: self._execute(step, flow, data))
+            else:
+                self._execute(step, flow, data)
+            self._record(flow, index, step, time.perf_counter() - start)
+        self._check_budgets(flow)
+        return data
+
+    def _plan(self, name: str, data: dict | None, start_after: str | None, stop_after: str | None):
+        flow = load_flow(name, self.flow_dir)
+        data = data if data is not None else generate_user_details()
+        begin = self._checkpoint_index(flow, start_after) + 1 if start_after else 0
+        end = self._checkpoint_index(flow, stop_after) + 1 if stop_after else len(flow.steps)
+        steps = list(enumerate(flow.steps, start=1))[begin:end]
+        logger.info(f"Running flow '{flow.name}' ({len(steps)} steps).")
+        self.timings = []
+        return flow, data, steps
+
+    def _record(self, flow: Flow, index: int, step: Step, duration: float):
+        timing = StepTiming(index, step.label, duration, step.budget)
+        self.timings.append(timing)
+        if step_timer.enabled:
+            step_timer.record(f"flow {flow.name}:{index:02d}", duration, step.label)
+        if timing.over_budget:
+            logger.warning(f"Flow '{flow.name}' step {index} ({step.label}) took {duration:.2f}s, budget {step.budget}s.")
+
+    def _check_budgets(self, flow: Flow):
+        over_budget = [timing for timing in self.timings if timing.over_budget]
+        if over_budget and self.enforce_budgets:
+            raise AssertionError(f"Flow '{flow.name}' exceeded the budget of {len(over_budget)} step(s): " + "; ".join(
+                f"#{timing.index} {timing.label} {timing.duration:.2f}s > {timing.budget}s" for timing in over_budget
+            ))
+
+    @staticmethod
+    def _checkpoint_index(flow: Flow, checkpoint: str) -> int:
+        for position, step in enumerate(flow.steps):
+            if step.kind == "checkpoint" and step.arg == checkpoint:
+                return position
+        raise ValueError(f"Flow '{flow.name}' has no checkpoint '{checkpoint}'.")
+
+    def _locator(self, name: str):
+        """Resolve a HomePage locator/selector attribute or a raw selector, once per engine."""
+        if name not in self._locators:
+            target = getattr(self.home_page, name, name)
+            self._locators[name] = self.home_page.page.locator(target) if isinstance(target, str) else target
+        return self._locators[name]
+
+    def _text_locator(self, text: str):
+        key = f"text={text}"
+        if key not in self._locators:
+            self._locators[key] = self.home_page.page.locator(key).first
+        return self._locators[key]
+
+    def _options(self, options) -> list[str]:
+        return list(options) if isinstance(options, list) else getattr(self.home_page, options)
+
+    def _execute(self, step: Step, flow: Flow, data: dict):
+        home_page, arg = self.home_page, step.arg
+        if step.kind == "do":
+            getattr(home_page, arg)()
+        elif step.kind == "select_option":
+            home_page.select_initial_option(arg)
+        elif step.kind == "select_random":
+            home_page.select_random_option(self._options(arg["options"]), getattr(home_page, arg["locator"], arg["locator"]))
+        elif step.kind == "input":
+            home_page.personal_data_input(str(arg).format_map(data))
+        elif step.kind == "checkpoint":
+            home_page.checkpoint(arg, data)
+        elif step.kind == "expect_error":
+            self.common_functions.is_text_visible(home_page.error_message, flow.messages.get(arg, arg))
+        elif step.kind == "expect_text":
+            self.common_functions.is_text_present_on_page(str(arg).format_map(data))
+        elif step.kind == "expect_visible":
+            assert self.common_functions.element_is_visible(self._locator(arg)), f"'{arg}' is not visible."
+        elif step.kind == "expect_hidden":
+            assert self.common_functions.element_is_not_visible(self._locator(arg)), f"'{arg}' is still visible."
+        elif step.kind == "concurrent":
+            self._expect_all(step.arg, flow, data, timeout=int(step.budget * 1000))
+
+    def _check(self, step: Step, flow: Flow, data: dict) -> bool:
+        """Non-blocking evaluation of one assertion step."""
+        if step.kind == "expect_error":
+            element = self.home_page.error_message.first
+            return element.is_visible() and element.inner_text().strip() == flow.messages.get(step.arg, step.arg).strip()
+        if step.kind == "expect_text":
+            return self._text_locator(str(step.arg).format_map(data)).is_visible()
+        visible = self._locator(step.arg).first.is_visible()
+        return visible if step.kind == "expect_visible" else not visible
+
+    def _expect_all(self, steps: tuple[Step, ...], flow: Flow, data: dict, timeout: int):
+        """
+        Wait for several independent assertions in one polling loop, so the
+        group takes as long as the slowest assertion rather than their sum.
+        An assertion stays satisfied once it has been met.
+        """
+        pending = list(steps)
+
+        def all_met():
+            pending[:] = [step for step in pending if not self._check(step, flow, data)]
+            return not pending
+
+        try:
+            self.common_functions.poll_until(all_met, f"{len(steps)} concurrent assertions", timeout)
+        except TimeoutError:
+            raise AssertionError("Unmet assertions: " + ", ".join(step.label for step in pending)) from None
+
+
+class AsyncFlowEngine(FlowEngine):
+    """Runs the same flow definitions through an AsyncHomePage."""
+
+    async def run(self, name: str, data: dict | None = None, start_after: str | None = None,
+                  stop_after: str | None = None) -> dict:
+        flow, data, steps = self._plan(name, data, start_after, stop_after)
+        for index, step in steps:
+            start = time.perf_counter()
+            if step.reply:
+                await self.home_page.wait_for_next_message(lambda: self._execute(step, flow, data))
+            else:
+                await self._execute(step, flow, data)
+            self._record(flow, index, step, time.perf_counter() - start)
+        self._check_budgets(flow)
+        return data
+
+    async def _execute(self, step: Step, flow: Flow, data: dict):
+        home_page, arg = self.home_page, step.arg
+        if step.kind == "do":
+            await getattr(home_page, arg)()
+        elif step.kind == "select_option":
+            await home_page.select_initial_option(arg)
+        elif step.kind == "select_random":
+            await home_page.select_random_option(self._options(arg["options"]), getattr(home_page, arg["locator"], arg["locator"]))
+        elif step.kind == "input":
+            await home_page.personal_data_input(str(arg).format_map(data))
+        elif step.kind == "checkpoint":
+            await home_page.checkpoint(arg, data)
+        elif step.kind == "expect_error":
+            await self.common_functions.is_text_visible(home_page.error_message, flow.messages.get(arg, arg))
+        elif step.kind == "expect_text":
+            await self.common_functions.is_text_present_on_page(str(arg).format_map(data))
+        elif step.kind == "expect_visible":
+            assert await self.common_functions.element_is_visible(self._locator(arg)), f"'{arg}' is not visible."
+        elif step.kind == "expect_hidden":
+            assert await self.common_functions.element_is_not_visible(self._locator(arg)), f"'{arg}' is still visible."
+        elif step.kind == "concurrent":
+            await self._expect_all(step.arg, flow, data, timeout=int(step.budget * 1000))
+
+    async def _check(self, step: Step, flow: Flow, data: dict) -> bool:
+        if step.kind == "expect_error":
+            element = self.home_page.error_message.first
+            return await element.is_visible() and (await element.inner_text()).strip() == flow.messages.get(step.arg, step.arg).strip()
+        if step.kind == "expect_text":
+            return await self._text_locator(str(step.arg).format_map(data)).is_visible()
+        visible = await self._locator(step.arg).first.is_visible()
+        return visible if step.kind == "expect_visible" else not visible
+
+    async def _expect_all(self, steps: tuple[Step, ...], flow: Flow, data: dict, timeout: int):
+        pending = list(steps)
+
+        async def all_met():
+            results = await asyncio.gather(*(self._check(step, flow, data) for step in pending))
+            pending[:] = [step for step, met in zip(list(pending), results) if not met]
+            return not pending
+
+        try:
+            await self.common_functions.poll_until(all_met, f"{len(steps)} concurrent assertions", timeout)
+        except TimeoutError:
+            raise AssertionError("Unmet assertions: " + ", ".join(step.label for step in pending)) from None
@@ -0,0 +1,208 @@
+"""
+HAR record/replay for UI tests.
+
+- record: the traffic of each test is captured into `<har_dir>/<node id>.har`
+  (node ID made file-system safe, so equally named tests of different modules
+  do not share an archive); the archive is only kept when the test passes.
+- replay: responses are served from the test's archive so the flow can run
+  without network access; unmatched requests are aborted (or fall back to
+  the network with HAR_NOT_FOUND=fallback).
+
+Playwright matches POSTs by their body, so everything the chat posts must be
+the same on replay. While recording, each test gets a random seed and a start
+time, stored in the archive (`log._pins`); in both modes they seed the test
+data and the random option picks (see random_utils.pin_test_data) and
+install the page clock, so a replayed run types, picks and books exactly what
+was recorded.
+
+Staleness check:
+    python -m support.har_replay check har/ --post-pattern "/graphql"
+"""
+import argparse
+import hashlib
+import json
+import logging
+import random
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import requests
+from playwright.sync_api import BrowserContext
+
+from support.random_utils import pin_test_data, unpin_test_data
+
+logger = logging.getLogger(__name__)
+
+HAR_MODES = ("off", "record", "replay")
+# Re-issued by the staleness check without side effects
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def har_name(test_name: str) -> str:
+    """File-system safe archive name for a test node ID (parametrised ids included)."""
+    return re.sub(r"[^\w.-]+", "_", test_name)
+
+
+class HarManager:
+    def __init__(self, mode: str = "off", har_dir: str = "har", url_filter: str = "**/*", not_found: str = "abort"):
+        if mode not in HAR_MODES:
+            raise ValueError(f"Unknown HAR mode '{mode}', expected one of {HAR_MODES}.")
+        self.mode = mode
+        self.har_dir = Path(har_dir)
+        self.url_filter = url_filter
+        self.not_found = not_found
+        self._pins: dict[str, dict] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def har_path(self, test_name: str) -> Path:
+        return self.har_dir / f"{har_name(test_name)}.har"
+
+    def _recording_path(self, test_name: str) -> Path:
+        return self.har_dir / f"{har_name(test_name)}.recording.har"
+
+    def attach(self, context: BrowserContext, test_name: str):
+        """Start recording into, or replaying from, the test's archive, with the test data pinned."""
+        if self.mode == "record":
+            self.har_dir.mkdir(parents=True, exist_ok=True)
+            context.route_from_har(
+                self._recording_path(test_name), url=self.url_filter, update=True, update_content="embed"
+            )
+            pins = {"seed": random.randrange(2**31), "now": datetime.now().astimezone().isoformat(timespec="seconds")}
+            self._pins[test_name] = pins
+        elif self.mode == "replay":
+            path = self.har_path(test_name)
+            if not path.exists():
+                raise FileNotFoundError(f"No HAR recording for '{test_name}' at {path}, run with HAR_MODE=record first.")
+            context.route_from_har(path, url=self.url_filter, not_found=self.not_found)
+            pins = json.loads(path.read_text())["log"].get("_pins")
+            if pins is None:
+                logger.warning(f"{path} has no pinned test data, its POSTs will not match; record it again.")
+                return
+        else:
+            return
+        now = datetime.fromisoformat(pins["now"])
+        context.clock.install(time=now)
+        pin_test_data(pins["seed"], now.date())
+
+    def finalize(self, test_name: str, passed: bool):
+        """
+        Called after the context is closed (which flushes the recording).
+        Keeps the recording only for passing runs.
+        """
+        if self.enabled:
+            unpin_test_data()
+        if self.mode != "record":
+            return
+        pins = self._pins.pop(test_name, None)
+        recording = self._recording_path(test_name)
+        if not recording.exists():
+            return
+        if passed:
+            har = json.loads(recording.read_text())
+            har["log"]["_pins"] = pins
+            recording.write_text(json.dumps(har))
+            recording.replace(self.har_path(test_name))
+            logger.info(f"Saved HAR recording to {self.har_path(test_name)}.")
+        else:
+            recording.unlink()
+            logger.info(f"Discarded HAR recording of failed test '{test_name}'.")
+
+
+def _body_digest(text: str, mime_type: str) -> str:
+    if "json" in (mime_type or ""):
+        try:
+            text = json.dumps(json.loads(text), sort_keys=True)
+        except json.JSONDecodeError:
+            pass
+    return hashlib.sha256((text or "").encode()).hexdigest()
+
+
+def check_staleness(har_path: Path, url_pattern: str = ".*", max_age_days: float = 30, timeout: float = 30,
+                    post_pattern: str | None = None) -> tuple[list[str], list[str]]:
+    """
+    Compare a recording against live responses.
+    Re-issues every recorded GET, HEAD and OPTIONS request whose URL matches
+    `url_pattern`, plus the POSTs whose URL matches `post_pattern` (only for
+    endpoints known to be idempotent, e.g. read-only GraphQL queries), with
+    the recorded body. Returns the issues (differences in status code or body,
+    recordings older than `max_age_days`) and the matching requests that were
+    not re-checked, so their responses can go stale unnoticed.
+    """
+    har = json.loads(Path(har_path).read_text())
+    entries = har["log"]["entries"]
+    issues, unchecked = [], []
+
+    if entries:
+        recorded_at = datetime.fromisoformat(entries[0]["startedDateTime"].replace("Z", "+00:00"))
+        age_days = (datetime.now(timezone.utc) - recorded_at).total_seconds() / 86400
+        if age_days > max_age_days:
+            issues.append(f"{har_path}: recorded {age_days:.0f} days ago (max {max_age_days}).")
+
+    pattern = re.compile(url_pattern)
+    post = re.compile(post_pattern) if post_pattern else None
+    with requests.Session() as session:
+        for entry in entries:
+            request, response = entry["request"], entry["response"]
+            method = request["method"].upper()
+            if not pattern.search(request["url"]):
+                continue
+            if method not in SAFE_METHODS and not (method == "POST" and post and post.search(request["url"])):
+                unchecked.append(f"{method} {request['url']}")
+                continue
+            post_data = request.get("postData") or {}
+            headers = {"Content-Type": post_data["mimeType"]} if post_data.get("mimeType") else {}
+            try:
+                live = session.request(method, request["url"], data=post_data.get("text"), headers=headers, timeout=timeout)
+            except requests.RequestException as e:
+                issues.append(f"{request['url']}: live request failed ({type(e).__name__}).")
+                continue
+            if live.status_code != response["status"]:
+                issues.append(f"{request['url']}: status {response['status']} recorded, {live.status_code} live.")
+                continue
+            content = response.get("content", {})
+            recorded_text = content.get("text", "")
+            if content.get("encoding") == "base64":
+                continue  # binary assets, status check is enough
+            mime_type = content.get("mimeType", "")
+            if _body_digest(recorded_text, mime_type) != _body_digest(live.text, mime_type):
+                issues.append(f"{request['url']}: response body changed since recording.")
+    return issues, unchecked
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="HAR recording utilities.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check = subparsers.add_parser("check", help="Flag recordings that differ from live responses.")
+    check.add_argument("paths", nargs="+", help="HAR files or directories containing them.")
+    check.add_argument("--url-pattern", default=".*", help="Only re-check URLs matching this regex.")
+    check.add_argument("--max-age-days", type=float, default=30)
+    check.add_argument("--post-pattern", help="Also re-issue POSTs to URLs matching this regex (idempotent endpoints only).")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    har_files = []
+    for path in map(Path, args.paths):
+        har_files.extend(sorted(path.glob("*.har")) if path.is_dir() else [path])
+
+    stale = 0
+    for har_file in har_files:
+        issues, unchecked = check_staleness(har_file, args.url_pattern, args.max_age_days, post_pattern=args.post_pattern)
+        for issue in issues:
+            logger.warning(issue)
+        if unchecked:
+            logger.warning(f"{har_file}: {len(unchecked)} requests not re-checked: {', '.join(unchecked)}.")
+        if issues:
+            stale += 1
+        else:
+            logger.info(f"{har_file}: up to date.")
+    logger.info(f"{stale} of {len(har_files)} recordings are stale.")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
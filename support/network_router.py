@@ -0,0 +1,157 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+from playwright.sync_api import BrowserContext, Route, Request
+
+logger = logging.getLogger(__name__)
+
+# Cached bodies are stored decoded, so these no longer describe them
+HOP_BY_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class NetworkRouter:
+    """
+    Request-routing layer for a browser context.
+
+    - Aborts requests whose resource type is blocked or whose URL matches a
+      deny pattern, unless the URL matches an allow pattern.
+    - Serves cacheable static assets (scripts, stylesheets) from an on-disk
+      cache keyed by URL + ETag; entries older than `cache_ttl` are
+      revalidated with If-None-Match.
+    - Counts blocked requests, cache hits and the bytes served from cache.
+    """
+
+    def __init__(
+        self,
+        blocked_resource_types: list[str] | None = None,
+        deny_patterns: list[str] | None = None,
+        allow_patterns: list[str] | None = None,
+        cache_dir: str | None = None,
+        cacheable_resource_types: list[str] | None = None,
+        cache_ttl: float = 24 * 3600
+    ):
+        self.blocked_resource_types = set(blocked_resource_types or [])
+        self.deny_patterns = deny_patterns or []
+        self.allow_patterns = allow_patterns or []
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cacheable_resource_types = set(cacheable_resource_types or ["script", "stylesheet"])
+        self.cache_ttl = cache_ttl
+
+        # Statistics
+        self.requests_seen = 0
+        self.requests_blocked = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_revalidations = 0
+        self.bytes_from_cache = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def attach(self, context: BrowserContext):
+        """Route every request made by `context` through this router."""
+        context.route("**/*", self._handle)
+
+    def stats(self) -> dict:
+        return {
+            "requests_seen": self.requests_seen,
+            "requests_blocked": self.requests_blocked,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_revalidations": self.cache_revalidations,
+            "bytes_from_cache": self.bytes_from_cache,
+        }
+
+    def is_blocked(self, url: str, resource_type: str) -> bool:
+        if any(fnmatch(url, pattern) for pattern in self.allow_patterns):
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        return any(fnmatch(url, pattern) for pattern in self.deny_patterns)
+
+    def _handle(self, route: Route, request: Request):
+        self.requests_seen += 1
+        if self.is_blocked(request.url, request.resource_type):
+            self.requests_blocked += 1
+            route.abort("blockedbyclient")
+            return
+        if self.cache_dir and request.method == "GET" and request.resource_type in self.cacheable_resource_types:
+            self._handle_cacheable(route, request)
+            return
+        route.fallback()
+
+    def _handle_cacheable(self, route: Route, request: Request):
+        meta_path = self.cache_dir / f"{self._key(request.url)}.json"
+        meta = self._read_meta(meta_path)
+
+        if meta and time.time() - meta["stored_at"] < self.cache_ttl:
+            self._fulfill_from_cache(route, meta)
+            return
+
+        headers = dict(request.headers)
+        if meta and meta.get("etag"):
+            headers["if-none-match"] = meta["etag"]
+        try:
+            response = route.fetch(headers=headers)
+        except Exception as e:
+            logger.warning(f"Fetch failed for {request.url}: {e}")
+            route.fallback()
+            return
+
+        if meta and response.status == 304:
+            self.cache_revalidations += 1
+            meta["stored_at"] = time.time()
+            self._write_atomic(meta_path, json.dumps(meta).encode())
+            self._fulfill_from_cache(route, meta)
+            return
+
+        self.cache_misses += 1
+        body = response.body()
+        etag = response.headers.get("etag")
+        if response.status == 200 and etag:
+            body_path = self.cache_dir / f"{self._key(request.url + etag)}.body"
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps({
+                "url": request.url,
+                "etag": etag,
+                "status": response.status,
+                "headers": {
+                    name: value for name, value in response.headers.items()
+                    if name.lower() not in HOP_BY_HOP_HEADERS
+                },
+                "body_file": body_path.name,
+                "stored_at": time.time(),
+            }).encode())
+        route.fulfill(response=response, body=body)
+
+    def _fulfill_from_cache(self, route: Route, meta: dict):
+        try:
+            body = (self.cache_dir / meta["body_file"]).read_bytes()
+        except FileNotFoundError:
+            route.fallback()
+            return
+        self.cache_hits += 1
+        self.bytes_from_cache += len(body)
+        route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+
+    @staticmethod
+    def _key(value: str) -> str:
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    @staticmethod
+    def _read_meta(path: Path) -> dict | None:
+        try:
+            return json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        # Parallel workers may share the cache directory; never expose partial files
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,210 @@
+"""
+Parallel, sharded test runner.
+
+Fans the collected tests out across N worker processes, each with its own
+Playwright instance, video directory and pytest-html report, then merges the
+worker reports into a single HTML report. Shards are balanced using per-test
+durations recorded by previous runs.
+
+All workers share one run ID and stream their results into the same
+RESULT_STREAM_FILE (the previous run's file is moved aside first), which
+is rendered into summary.html next to the report.
+With `--no-html` the workers skip pytest-html, which keeps every result in
+memory until the end, and the streamed summary is the only report.
+
+Usage:
+    python -m support.parallel_runner --workers 4 tests/ -- --maxfail=1 -v
+    python -m support.parallel_runner --workers 4 --changed-since origin/main tests/
+    python -m support.parallel_runner --workers 8 --no-html tests/
+"""
+import argparse
+import heapq
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from config.config import DURATIONS_FILE, STEP_TIMINGS_FILE, RESULT_STREAM, RESULT_STREAM_FILE
+from support.step_timer import timer as step_timer, load_aggregate, merge_aggregates
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEST_DURATION = 1.0
+RESULT_ROW_PATTERN = re.compile(r'<tbody class="[^"]*results-table-row">.*?</tbody>', re.DOTALL)
+SUMMARY_OUTCOMES = ["passed", "skipped", "failed", "error", "xfailed", "xpassed"]
+
+
+def load_durations(path: str = DURATIONS_FILE) -> dict:
+    """Load recorded per-test durations (node id -> seconds)."""
+    try:
+        return json.loads(Path(path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_durations(durations: dict, path: str = DURATIONS_FILE):
+    """Merge new per-test durations into the durations file."""
+    merged = load_durations(path)
+    merged.update({node_id: round(seconds, 3) for node_id, seconds in durations.items()})
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(merged, indent=2, sort_keys=True))
+
+
+def build_shards(node_ids: list[str], workers: int, durations: dict) -> list[list[str]]:
+    """
+    Split tests into `workers` shards of roughly equal total duration.
+    Uses longest-processing-time-first: the slowest remaining test always goes
+    to the currently least loaded shard. Unknown tests get the average duration.
+    """
+    known = [durations[node_id] for node_id in node_ids if node_id in durations]
+    default = sum(known) / len(known) if known else DEFAULT_TEST_DURATION
+    ordered = sorted(node_ids, key=lambda node_id: durations.get(node_id, default), reverse=True)
+
+    shards = [[] for _ in range(workers)]
+    heap = [(0.0, index) for index in range(workers)]
+    for node_id in ordered:
+        load, index = heapq.heappop(heap)
+        shards[index].append(node_id)
+        heapq.heappush(heap, (load + durations.get(node_id, default), index))
+    return [shard for shard in shards if shard]
+
+
+def collect_node_ids(paths: list[str], changed_since: str | None = None) -> list[str]:
+    """Collect test node ids without running them (only those affected by changes since `changed_since`)."""
+    selection = [f"--changed-since={changed_since}"] if changed_since else []
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *selection, *paths],
+        capture_output=True, text=True
+    )
+    node_ids = [line.strip() for line in result.stdout.splitlines() if "::" in line]
+    if not node_ids and result.returncode not in (0, 5):
+        logger.error(result.stdout + result.stderr)
+        raise RuntimeError("Test collection failed.")
+    return node_ids
+
+
+def merge_html_reports(report_paths: list[Path], output: Path):
+    """
+    Merge several pytest-html reports into one: result rows are appended to
+    the first report's results table and the summary counts are recomputed.
+    """
+    existing = [path for path in report_paths if path.exists()]
+    if not existing:
+        logger.warning("No worker reports to merge.")
+        return
+
+    contents = [path.read_text(encoding="utf-8") for path in existing]
+    merged = contents[0]
+    rows = [row for content in contents[1:] for row in RESULT_ROW_PATTERN.findall(content)]
+    insert_at = merged.rfind("</table>")
+    merged = merged[:insert_at] + "\n".join(rows) + merged[insert_at:]
+
+    for outcome in SUMMARY_OUTCOMES:
+        pattern = re.compile(rf'<span class="{outcome}">(\d+) ([^<]*)</span>')
+        total = sum(int(match.group(1)) for content in contents for match in pattern.finditer(content))
+        merged = pattern.sub(lambda match: f'<span class="{outcome}">{total} {match.group(2)}</span>', merged, count=1)
+        if total:
+            merged = re.sub(rf'(data-test-result="{outcome}"[^>]*?) disabled="true"', r"\1", merged)
+
+    ran = re.compile(r"<p>(\d+) tests ran in ([\d.]+) seconds. </p>")
+    totals = [(int(m.group(1)), float(m.group(2))) for content in contents for m in ran.finditer(content)]
+    if totals:
+        test_count = sum(count for count, _ in totals)
+        wall_clock = max(seconds for _, seconds in totals)
+        merged = ran.sub(f"<p>{test_count} tests ran in {wall_clock:.2f} seconds (longest worker). </p>", merged, count=1)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(merged, encoding="utf-8")
+    logger.info(f"Merged {len(existing)} worker reports into {output}.")
+
+
+def run(paths: list[str], workers: int, report: str, pytest_args: list[str], changed_since: str | None = None,
+        html_report: bool = True) -> int:
+    node_ids = collect_node_ids(paths, changed_since)
+    if not node_ids and changed_since:
+        # e.g. only docs or the CI workflow changed
+        logger.info(f"No tests affected by the changes since {changed_since}, nothing to run.")
+        return 0
+    if not node_ids:
+        logger.warning("No tests collected.")
+        return 5
+
+    durations = load_durations()
+    shards = build_shards(node_ids, workers, durations)
+    report_dir = Path(report).parent
+    logger.info(f"Running {len(node_ids)} tests across {len(shards)} workers.")
+    if RESULT_STREAM:
+        from support.result_stream import rotate
+        rotate(RESULT_STREAM_FILE)
+
+    processes = []
+    for worker_id, shard in enumerate(shards):
+        worker_dir = report_dir / f"worker_{worker_id}"
+        worker_dir.mkdir(parents=True, exist_ok=True)
+        # Workers merge into these files; start them empty so the parent only merges this run
+        for stale in ("durations.json", "step_timings.json", "step_timings.csv"):
+            (worker_dir / stale).unlink(missing_ok=True)
+        args_file = worker_dir / "tests.txt"
+        args_file.write_text("\n".join(shard))
+
+        env = dict(
+            os.environ,
+            WORKER_ID=str(worker_id),
+            WORKER_COUNT=str(len(shards)),
+            VIDEO_DIR=str(Path("videos") / f"worker_{worker_id}"),
+            DURATIONS_FILE=str(worker_dir / "durations.json"),
+            STEP_TIMINGS_FILE=str(worker_dir / "step_timings.json"),
+            RUN_ID=step_timer.run_id,
+        )
+        html_args = [f"--html={worker_dir / 'report.html'}", "--self-contained-html"] if html_report else []
+        command = [sys.executable, "-m", "pytest", f"@{args_file}", *html_args, *pytest_args]
+        log_file = open(worker_dir / "output.log", "w")
+        processes.append((worker_id, subprocess.Popen(command, env=env, stdout=log_file, stderr=subprocess.STDOUT), log_file))
+
+    exit_codes = []
+    for worker_id, process, log_file in processes:
+        exit_codes.append(process.wait())
+        log_file.close()
+        logger.info(f"Worker {worker_id} finished with exit code {exit_codes[-1]}.")
+
+    step_timings = load_aggregate(STEP_TIMINGS_FILE)
+    for worker_id in range(len(shards)):
+        worker_dir = report_dir / f"worker_{worker_id}"
+        save_durations(load_durations(str(worker_dir / "durations.json")))
+        step_timings = merge_aggregates(step_timings, load_aggregate(worker_dir / "step_timings.json"))
+    Path(STEP_TIMINGS_FILE).parent.mkdir(parents=True, exist_ok=True)
+    Path(STEP_TIMINGS_FILE).write_text(json.dumps(step_timings, indent=2))
+    if html_report:
+        merge_html_reports([report_dir / f"worker_{i}" / "report.html" for i in range(len(shards))], Path(report))
+    if RESULT_STREAM and Path(RESULT_STREAM_FILE).exists():
+        from support.result_stream import render
+        render(RESULT_STREAM_FILE, report_dir / "summary.html", step_timer.run_id)
+
+    failed = [code for code in exit_codes if code not in (0, 5)]
+    return failed[0] if failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    pytest_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, pytest_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(description="Run the test suite in parallel shards.")
+    parser.add_argument("paths", nargs="*", default=["tests"], help="Test paths to collect.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+    parser.add_argument("--report", default="reports/report.html", help="Merged HTML report path.")
+    parser.add_argument("--changed-since", metavar="BASE", help="Only run tests affected by changes since BASE.")
+    parser.add_argument("--no-html", action="store_true", help="Skip pytest-html; report from the result stream only.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    return run(args.paths, max(args.workers, 1), args.report, pytest_args, args.changed_since, not args.no_html)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
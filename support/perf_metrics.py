@@ -0,0 +1,267 @@
+"""
+Browser-side performance metrics of UI flows (PERF_METRICS=true).
+
+An init script registers PerformanceObservers in every document of the test's
+context before the app's own scripts run, so nothing is missed:
+- Navigation Timing (TTFB, DOMContentLoaded, load), first (contentful) paint,
+  largest contentful paint and cumulative layout shift;
+- long tasks (> 50 ms on the main thread) and the total blocking time of page
+  load: the long tasks from first contentful paint to the first chat action
+  (or to the load event when the test never clicked), so the budget does not
+  grow with the length of the conversation;
+- time to the next chat bubble: clicks on chat controls (options, buttons,
+  day and time slots) and the chat bubbles added to the DOM are timestamped
+  in the page, and each click is paired with the first bubble after it.
+
+Everything is recorded in the page itself; the test only pays for one
+`evaluate` after `navigate_to_home_page` (page-load metrics) and one at the
+end of the test (long tasks and bubble latencies).
+
+Metrics (milliseconds, CLS unitless) are checked against PERF_BUDGETS, e.g.
+"lcp=2500,next_bubble_p95=3000": over-budget metrics are logged and, with
+PERF_ENFORCE_BUDGETS=true, fail the test. Every test appends one line to
+PERF_METRICS_FILE, so runs can be compared:
+    python -m support.perf_metrics reports/perf_metrics.jsonl --runs 10
+"""
+import argparse
+import json
+import logging
+import math
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+from config.config import PERF_BUDGETS, PERF_ENFORCE_BUDGETS, PERF_METRICS_FILE, WORKER_ID
+from support.step_timer import timer as step_timer
+
+logger = logging.getLogger(__name__)
+
+BUBBLE_SELECTOR = "div.bubble-conatiner"
+ACTION_SELECTOR = "label.option-button, button, div.day-in-month, div.time"
+TREND_METRICS = ["ttfb", "fcp", "lcp", "total_blocking_time", "next_bubble_p95"]
+
+OBSERVER_SCRIPT = """
+((bubbleSelector, actionSelector) => {
+  if (window.__perf) return;
+  const perf = window.__perf = {lcp: null, cls: 0, longTasks: [], actions: [], bubbles: []};
+  const observe = (type, onEntry) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(onEntry)).observe({type, buffered: true});
+    } catch (error) {}  // Entry type not supported by this browser
+  };
+  observe("largest-contentful-paint", entry => { perf.lcp = entry.startTime; });
+  observe("layout-shift", entry => { if (!entry.hadRecentInput) perf.cls += entry.value; });
+  observe("longtask", entry => { perf.longTasks.push([entry.startTime, entry.duration]); });
+  document.addEventListener("click", event => {
+    const target = event.target.closest && event.target.closest(actionSelector);
+    if (target) perf.actions.push([performance.now(), (target.innerText || target.tagName).trim().slice(0, 40)]);
+  }, true);
+  new MutationObserver(mutations => {
+    for (const mutation of mutations) {
+      for (const node of mutation.addedNodes) {
+        if (node.nodeType === 1 && (node.matches(bubbleSelector) || node.querySelector(bubbleSelector))) {
+          perf.bubbles.push(performance.now());
+          return;
+        }
+      }
+    }
+  }).observe(document, {childList: true, subtree: true});
+})(%s, %s);
+"""
+
+COLLECT_SCRIPT = """
+() => {
+  const perf = window.__perf || {lcp: null, cls: 0, longTasks: [], actions: [], bubbles: []};
+  const navigation = performance.getEntriesByType("navigation")[0];
+  const paint = Object.fromEntries(performance.getEntriesByType("paint").map(entry => [entry.name, entry.startTime]));
+  return {
+    url: location.href,
+    ttfb: navigation ? navigation.responseStart : null,
+    dom_content_loaded: navigation && navigation.domContentLoadedEventEnd ? navigation.domContentLoadedEventEnd : null,
+    load: navigation && navigation.loadEventEnd ? navigation.loadEventEnd : null,
+    transfer_size: navigation ? navigation.transferSize : null,
+    first_paint: paint["first-paint"] ?? null,
+    fcp: paint["first-contentful-paint"] ?? null,
+    lcp: perf.lcp,
+    cls: perf.cls,
+    long_tasks: perf.longTasks,
+    actions: perf.actions,
+    bubbles: perf.bubbles,
+  };
+}
+"""
+PAGE_LOAD_METRICS = ("url", "ttfb", "dom_content_loaded", "load", "transfer_size", "first_paint", "fcp", "lcp", "cls")
+
+
+def parse_budgets(spec: str) -> dict[str, float]:
+    """'lcp=2500,cls=0.1' -> {'lcp': 2500.0, 'cls': 0.1}"""
+    budgets = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        metric, _, limit = item.partition("=")
+        budgets[metric.strip()] = float(limit)
+    return budgets
+
+
+def next_bubble_latencies(actions: list, bubbles: list[float]) -> list[tuple[str, float | None]]:
+    """
+    (action label, ms until the first bubble after it) per action; None when
+    no bubble appeared before the next action, e.g. ticking one of several options.
+    """
+    latencies = []
+    for index, (start, label) in enumerate(actions):
+        end = actions[index + 1][0] if index + 1 < len(actions) else math.inf
+        position = bisect_right(bubbles, start)
+        bubble = bubbles[position] if position < len(bubbles) else None
+        latencies.append((label, round(bubble - start, 1) if bubble is not None and bubble <= end else None))
+    return latencies
+
+
+def total_blocking_time(long_tasks: list, start: float, end: float) -> float:
+    """Sum of the time over 50 ms of the long tasks ([start, duration]) starting within [start, end)."""
+    return round(sum(duration - 50 for task_start, duration in long_tasks if start <= task_start < end), 1)
+
+
+def _round(value):
+    return round(value, 1) if isinstance(value, float) else value
+
+
+class PerfMonitor:
+    """
+    Performance metrics of one test. `attach` the observers to the test's
+    context, `capture_page_load` after navigating, `capture` at the end,
+    then `check_budgets` and `export`.
+    """
+
+    def __init__(self, test: str, budgets: dict[str, float] | None = None, enforce: bool = PERF_ENFORCE_BUDGETS,
+                 bubble_selector: str = BUBBLE_SELECTOR, action_selector: str = ACTION_SELECTOR):
+        self.test = test
+        self.budgets = parse_budgets(PERF_BUDGETS) if budgets is None else budgets
+        self.enforce = enforce
+        self.bubble_selector = bubble_selector
+        self.action_selector = action_selector
+        self.page = None
+        self.page_load: dict | None = None
+        self.metrics: dict = {}
+        self.over_budget: list[str] = []
+        self.captured = False
+
+    def attach(self, context, page=None):
+        """Inject the observers into every document `context` loads from now on."""
+        context.add_init_script(script=OBSERVER_SCRIPT % (json.dumps(self.bubble_selector), json.dumps(self.action_selector)))
+        self.page = page
+
+    def capture_page_load(self, page=None):
+        """Navigation, paint and LCP metrics of the document just loaded."""
+        self.page = page or self.page
+        raw = self.page.evaluate(COLLECT_SCRIPT)
+        self.page_load = {metric: _round(raw[metric]) for metric in PAGE_LOAD_METRICS}
+        return self.page_load
+
+    def capture(self, page=None) -> dict:
+        """Long tasks and bubble latencies since the last navigation, plus the page-load metrics."""
+        from api_utils.load_generator import percentile
+
+        self.page = page or self.page
+        raw = self.page.evaluate(COLLECT_SCRIPT)
+        if self.page_load is None or self.page_load["url"] != raw["url"]:
+            # No navigate_to_home_page (e.g. resumed from a checkpoint): take them from the current document
+            self.page_load = {metric: _round(raw[metric]) for metric in PAGE_LOAD_METRICS}
+        fcp = raw["fcp"] or 0.0
+        interactive = raw["actions"][0][0] if raw["actions"] else raw["load"] or math.inf
+        durations = [duration for _, duration in raw["long_tasks"]]
+        latencies = next_bubble_latencies(raw["actions"], raw["bubbles"])
+        answered = sorted(latency for _, latency in latencies if latency is not None)
+        self.metrics = {
+            **self.page_load,
+            "long_tasks": len(durations),
+            "long_task_ms": round(sum(durations), 1),
+            "total_blocking_time": total_blocking_time(raw["long_tasks"], fcp, interactive),
+            "next_bubble_count": len(answered),
+            "next_bubble_p50": percentile(answered, 50) if answered else None,
+            "next_bubble_p95": percentile(answered, 95) if answered else None,
+            "next_bubble_max": answered[-1] if answered else None,
+            "next_bubble": latencies,
+        }
+        self.captured = True
+        return self.metrics
+
+    def check_budgets(self) -> list[str]:
+        """Log the metrics over budget; raise AssertionError for them when enforcing."""
+        self.over_budget = [
+            f"{metric} {self.metrics[metric]} > {limit}"
+            for metric, limit in self.budgets.items()
+            if self.metrics.get(metric) is not None and self.metrics[metric] > limit
+        ]
+        if self.over_budget:
+            logger.warning("%s exceeded performance budgets: %s", self.test, "; ".join(self.over_budget))
+            if self.enforce:
+                raise AssertionError("Performance budgets exceeded: " + "; ".join(self.over_budget))
+        return self.over_budget
+
+    def to_dict(self) -> dict:
+        return {
+            "run": step_timer.run_id,
+            "test": self.test,
+            "worker": WORKER_ID,
+            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "metrics": self.metrics,
+            "over_budget": self.over_budget,
+        }
+
+    def export(self, path: str | Path = PERF_METRICS_FILE):
+        """Append this test's record as one JSON line (safe for parallel workers, see result_stream)."""
+        from support.result_stream import append_jsonl
+
+        if self.metrics:
+            append_jsonl(path, self.to_dict())
+
+
+def load_records(path: str | Path) -> list[dict]:
+    with Path(path).open(encoding="utf-8") as lines:
+        return [json.loads(line) for line in lines if line.strip()]
+
+
+def trend(records: list[dict], metrics: list[str] = TREND_METRICS) -> dict[str, dict]:
+    """Per run (oldest first): tests measured, tests over budget and the median of each metric."""
+    from statistics import median
+
+    runs = defaultdict(list)
+    for record in records:
+        runs[record["run"]].append(record)
+    summary = {}
+    for run in sorted(runs):
+        summary[run] = {"tests": len(runs[run]), "over_budget": sum(bool(r["over_budget"]) for r in runs[run])}
+        for metric in metrics:
+            values = [r["metrics"][metric] for r in runs[run] if r["metrics"].get(metric) is not None]
+            summary[run][metric] = round(median(values), 1) if values else None
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare browser performance metrics across runs.")
+    parser.add_argument("path", nargs="?", default=PERF_METRICS_FILE)
+    parser.add_argument("--test", help="Only tests whose ID contains this text.")
+    parser.add_argument("--runs", type=int, default=10, help="Number of most recent runs to show.")
+    parser.add_argument("--metrics", default=",".join(TREND_METRICS), help="Comma-separated metrics.")
+    parser.add_argument("--json", action="store_true", help="Print the trend as JSON.")
+    args = parser.parse_args(argv)
+
+    records = load_records(args.path)
+    if args.test:
+        records = [record for record in records if args.test in record["test"]]
+    metrics = args.metrics.split(",")
+    summary = dict(list(trend(records, metrics).items())[-args.runs:])
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    print(f"{'run':<18} {'tests':>5} {'over':>5} " + " ".join(f"{metric:>20}" for metric in metrics))
+    for run, stats in summary.items():
+        values = " ".join(f"{'-' if stats[m] is None else stats[m]:>20}" for m in metrics)
+        print(f"{run:<18} {stats['tests']:>5} {stats['over_budget']:>5} {values}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
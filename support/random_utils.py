@@ -1,9 +1,25 @@
+import logging
 import random
-from playwright.sync_api import Page
-from  faker import Faker
-import re
+import threading
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING
+from config.config import DATA_POOL_SEED, DATA_POOL_BATCH, DATA_POOL_FILE, WORKER_ID, WORKER_COUNT
+from support.data_pool import DataPool
+from support.step_timer import timed_step
 
-def click_random_option_by_text(page: Page, text_options: list[str], locator_prefix: str = "label.option-button.primary") -> str:
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+_data_pool: DataPool | None = None
+_data_pool_lock = threading.Lock()
+# Test data of the current test pinned for HAR record/replay: (pool, today)
+_pinned: tuple[DataPool, date] | None = None
+
+@timed_step
+def click_random_option_by_text(page: "Page", text_options: list[str], locator_prefix: str = "label.option-button.primary") -> str:
     """
     Randomly selects one text from `text_options` and clicks an element 
     matching the combined locator (locator_prefix + :has-text('<selected>')).
@@ -18,48 +34,66 @@ def click_random_option_by_text(page: Page, text_options: list[str], locator_pre
     
     locator.click()
     
-    print(f"Selected option: {selected_text}")
+    logger.info("Selected option: %s", selected_text)
     return selected_text
 
-def generate_user_details():
+def data_pool() -> DataPool:
+    """
+    The process-wide data pool. Created on first use from DATA_POOL_SEED (or a
+    random, logged seed); with DATA_POOL_FILE set, an existing file is loaded
+    and a new pool's first batch is saved there for reproducible reruns.
     """
-    Generates random user details: first name, last name, and email.
+    global _data_pool
+    if _pinned is not None:
+        return _pinned[0]
+    if _data_pool is not None:
+        return _data_pool
+    with _data_pool_lock:
+        if _data_pool is not None:
+            return _data_pool
+        path = DATA_POOL_FILE
+        if path and int(WORKER_COUNT) > 1:
+            path = str(Path(path).with_suffix(f".worker{WORKER_ID}.json"))
+        if path and Path(path).exists():
+            _data_pool = DataPool.load(path, DATA_POOL_BATCH)
+        else:
+            seed = int(DATA_POOL_SEED) if DATA_POOL_SEED else random.randrange(2**31)
+            logger.info("Data pool seed: %s (set DATA_POOL_SEED=%s to reproduce).", seed, seed)
+            _data_pool = DataPool(seed, int(WORKER_ID), int(WORKER_COUNT), DATA_POOL_BATCH)
+            if path:
+                _data_pool.prefill(users=DATA_POOL_BATCH, authors=DATA_POOL_BATCH)
+                _data_pool.save(path)
+    return _data_pool
+
+def pin_test_data(seed: int, today: date):
+    """
+    Make the current test's data reproducible: user details from a pool seeded
+    with `seed` (independent of the worker and of earlier tests), random option
+    picks from `random.seed(seed)` and dates relative to `today`.
+    `unpin_test_data` goes back to the process-wide pool and the real date.
     """
-    fake = Faker()
-    first_name = fake.first_name()
-    last_name = fake.last_name()
-    email = fake.email()
-    full_name = f"{first_name} {last_name}"
+    global _pinned
+    random.seed(seed)
+    _pinned = (DataPool(seed, batch_size=DATA_POOL_BATCH), today)
+    logger.info("Pinned test data: seed %s, today %s.", seed, today)
 
-    # Generate a phone number and remove non-digit characters
-    raw_phone = fake.phone_number()
-    digits_only = re.sub(r'\D', '', raw_phone) 
+def unpin_test_data():
+    global _pinned
+    _pinned = None
 
-    # Ensure 10 digits for a valid number
-    if len(digits_only) == 10:
-        phone = f"+1-{digits_only[:3]}-{digits_only[3:6]}-{digits_only[6:]}"
-    else:
-        phone = "+1-555-555-5555"  # Fallback in case Faker generates invalid phone number format
+def today() -> date:
+    """Today's date, or the pinned one (see `pin_test_data`)."""
+    return _pinned[1] if _pinned is not None else date.today()
 
-    return {
-        "first_name": first_name,
-        "last_name": last_name,
-        "full_name": full_name,
-        "email": email,
-        "phone": phone
-    }
+def generate_user_details():
+    """
+    Returns unique random user details: first name, last name, full name,
+    email and a valid 10-digit phone number.
+    """
+    return data_pool().next_user()
 
 def generate_author_payload() -> dict:
     """
-    Generates a payload for creating a new author.
+    Generates a payload for creating a new author with a unique ID.
     """
-    fake = Faker('en_US')
-    author_id = random.randint(10000, 99999)
-    first_name = fake.first_name()
-    last_name = fake.last_name()
-    return {
-        "id": author_id,
-        "idBook": 0,
-        "firstName": first_name,
-        "lastName": last_name
-    }
\ No newline at end of file
+    return data_pool().next_author()
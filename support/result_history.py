@@ -0,0 +1,272 @@
+"""
+Test-result history (SQLite).
+
+Every run appends one row per test to RESULT_HISTORY_DB: outcome, duration,
+reruns and a failure signature (exception location and message with numbers
+and addresses normalized, so the same failure hashes the same across runs).
+Parallel workers write to the same database; it is opened in WAL mode and
+written once per session.
+
+On top of the history:
+- Flaky scoring: over a test's last FLAKY_WINDOW results, the passes that
+  followed a failure, either in the previous run or in a rerun of the same
+  run. A regression and its fix is one flip, and a test needs FLAKY_MIN_FLIPS
+  flips to score at all, so a test that broke once and was fixed is not
+  flaky. Tests scoring FLAKY_THRESHOLD or more (with at least FLAKY_MIN_RUNS
+  results) are quarantined: rerun up to FLAKY_RERUNS times
+  (pytest-rerunfailures) and, with QUARANTINE=xfail, not allowed to fail
+  the build.
+- Failure-first ordering: tests run in order of their recency-weighted
+  failure rate, tests without history first, then the fastest first.
+- Selection of the tests affected by changed files (`--changed-since`,
+  see affected_tests).
+
+Usage:
+    python -m support.result_history flaky
+    python -m support.result_history history tests/test_e2e.py::test_pricing_flow
+"""
+import argparse
+import hashlib
+import re
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from config.config import (
+    RESULT_HISTORY_DB, FLAKY_WINDOW, FLAKY_THRESHOLD, FLAKY_MIN_RUNS, FLAKY_MIN_FLIPS, FLAKY_RERUNS, QUARANTINE,
+    FAILURE_FIRST
+)
+from support.step_timer import timer as step_timer
+
+# Weight of a result relative to the next newer one in the failure rate
+FAILURE_DECAY = 0.7
+# Failure rate assumed for tests without history, so new tests run early
+NEW_TEST_FAILURE_RATE = 0.5
+NUMBER_PATTERN = re.compile(r"0x[0-9a-fA-F]+|\d+(?:\.\d+)?")
+# Node IDs per query when filtering by test; stays below SQLite's bound-variable limit
+NODE_ID_BATCH = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    reruns INTEGER NOT NULL DEFAULT 0,
+    signature TEXT,
+    message TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (node_id, id);
+"""
+
+
+def failure_signature(report) -> tuple[str, str]:
+    """(hash, message) identifying a failure independently of line numbers, timings, IDs and addresses."""
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is not None:
+        location, message = Path(crash.path).name, crash.message
+    else:
+        location, message = report.nodeid, str(report.longrepr)
+    message = message.strip().splitlines()[0] if message.strip() else ""
+    normalized = NUMBER_PATTERN.sub("N", message)
+    digest = hashlib.sha1(f"{report.when}|{location}|{normalized}".encode()).hexdigest()[:12]
+    return digest, message[:500]
+
+
+class ResultHistory:
+    def __init__(self, path: str = RESULT_HISTORY_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def record(self, run: str, results: list[dict]):
+        """Append one run's results (node_id, outcome, duration, reruns, signature, message) in one transaction."""
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO results (run, node_id, outcome, duration, reruns, signature, message, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run, result["node_id"], result["outcome"], round(result["duration"], 3), result.get("reruns", 0),
+                     result.get("signature"), result.get("message"), now)
+                    for result in results
+                ]
+            )
+
+    def recent(self, window: int = FLAKY_WINDOW, node_ids: list[str] | None = None) -> dict[str, list[dict]]:
+        """The last `window` results of every test (or of `node_ids`), oldest first."""
+        query = (
+            "SELECT node_id, outcome, duration, reruns, signature, message FROM ("
+            "  SELECT *, ROW_NUMBER() OVER (PARTITION BY node_id ORDER BY id DESC) AS age FROM results{where}"
+            ") WHERE age <= ? ORDER BY node_id, id"
+        )
+        if node_ids is None:
+            rows = self.connection.execute(query.format(where=""), (window,)).fetchall()
+        else:
+            node_ids, rows = list(node_ids), []
+            for start in range(0, len(node_ids), NODE_ID_BATCH):
+                batch = node_ids[start:start + NODE_ID_BATCH]
+                where = f" WHERE node_id IN ({', '.join('?' * len(batch))})"
+                rows += self.connection.execute(query.format(where=where), (*batch, window)).fetchall()
+        history = defaultdict(list)
+        for node_id, outcome, duration, reruns, signature, message in rows:
+            history[node_id].append(
+                {"outcome": outcome, "duration": duration, "reruns": reruns, "signature": signature, "message": message}
+            )
+        return history
+
+    def flaky_scores(self, window: int = FLAKY_WINDOW, min_runs: int = FLAKY_MIN_RUNS,
+                     min_flips: int = FLAKY_MIN_FLIPS) -> dict[str, float]:
+        """
+        Flaky score (0-1) per test with at least `min_runs` results, highest first:
+        flips (passes right after a failed run or after a rerun) relative to the
+        most a test can have, one per two results; 0 below `min_flips` flips.
+        """
+        scores = {}
+        for node_id, results in self.recent(window).items():
+            results = [result for result in results if result["outcome"] in ("passed", "failed")]
+            if len(results) < min_runs:
+                continue
+            flips = sum(
+                current["outcome"] == "passed" and (current["reruns"] > 0 or previous == "failed")
+                for previous, current in zip([None] + [result["outcome"] for result in results], results)
+            )
+            scores[node_id] = round(min(flips / max(len(results) // 2, 1), 1.0), 3) if flips >= min_flips else 0.0
+        return dict(sorted(scores.items(), key=lambda item: item[1], reverse=True))
+
+    def quarantined(self, threshold: float = FLAKY_THRESHOLD) -> dict[str, float]:
+        return {node_id: score for node_id, score in self.flaky_scores().items() if score >= threshold}
+
+    def failure_rates(self, window: int = FLAKY_WINDOW) -> dict[str, tuple[float, float]]:
+        """(recency-weighted failure rate, mean duration) per test."""
+        rates = {}
+        for node_id, results in self.recent(window).items():
+            weights = [FAILURE_DECAY ** age for age in range(len(results) - 1, -1, -1)]
+            failed = sum(weight for weight, result in zip(weights, results) if result["outcome"] == "failed")
+            duration = sum(result["duration"] for result in results) / len(results)
+            rates[node_id] = (failed / sum(weights), duration)
+        return rates
+
+    def order(self, node_ids: list[str]) -> list[str]:
+        """`node_ids` most-likely-to-fail first (tests without history count as NEW_TEST_FAILURE_RATE), then fastest."""
+        rates = self.failure_rates()
+        return sorted(node_ids, key=lambda node_id: (
+            -rates.get(node_id, (NEW_TEST_FAILURE_RATE, 0.0))[0], rates.get(node_id, (0.0, 0.0))[1]
+        ))
+
+
+class ResultHistoryPlugin:
+    """
+    pytest hooks: select, quarantine and order tests at collection; record
+    results at the end. Without a history (RESULT_HISTORY=false) only the
+    changed-files selection is applied.
+    """
+
+    def __init__(self, history: ResultHistory | None, changed: set[str] | None = None):
+        self.history = history
+        self.changed = changed
+        self.quarantine = history.quarantined() if history and QUARANTINE != "off" else {}
+        self.results: dict[str, dict] = {}
+        self.selected = 0
+        self.deselected = 0
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if self.changed is not None:
+            from support.affected_tests import select
+
+            items[:], deselected = select(items, self.changed)
+            self.deselected = len(deselected)
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+        self.selected = len(items)
+
+        for item in items:
+            score = self.quarantine.get(item.nodeid)
+            if score is None:
+                continue
+            # Honoured by pytest-rerunfailures; without it the test simply runs once
+            item.add_marker(pytest.mark.flaky(reruns=FLAKY_RERUNS))
+            if QUARANTINE == "xfail":
+                item.add_marker(pytest.mark.xfail(reason=f"Quarantined, flaky score {score}", strict=False))
+
+        if FAILURE_FIRST and self.history:
+            position = {node_id: index for index, node_id in enumerate(self.history.order([i.nodeid for i in items]))}
+            items.sort(key=lambda item: position[item.nodeid])
+
+    def pytest_runtest_logreport(self, report):
+        result = self.results.setdefault(
+            report.nodeid, {"node_id": report.nodeid, "outcome": "passed", "duration": 0.0, "reruns": 0}
+        )
+        if report.outcome == "rerun":
+            result["reruns"] += 1
+            return
+        result["duration"] += report.duration
+        # An xfailed quarantined test still failed
+        if report.failed or (report.skipped and hasattr(report, "wasxfail")):
+            if result["outcome"] != "failed":
+                result["outcome"] = "failed"
+                result["signature"], result["message"] = failure_signature(report)
+        elif report.skipped and result["outcome"] == "passed":
+            result["outcome"] = "skipped"
+
+    def pytest_sessionfinish(self, session):
+        if self.history and self.results:
+            self.history.record(step_timer.run_id, list(self.results.values()))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        quarantined = [node_id for node_id in self.results if node_id in self.quarantine]
+        if not (quarantined or self.changed is not None):
+            return
+        terminalreporter.write_sep("-", "result history")
+        if self.changed is not None:
+            terminalreporter.write_line(
+                f"{len(self.changed)} changed files: {self.selected} tests selected, {self.deselected} deselected."
+            )
+        for node_id in quarantined:
+            result = self.results[node_id]
+            terminalreporter.write_line(
+                f"Quarantined {node_id} (flaky score {self.quarantine[node_id]}): {result['outcome']} "
+                f"after {result['reruns']} reruns."
+            )
+
+    def pytest_unconfigure(self, config):
+        if self.history:
+            self.history.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect the test-result history.")
+    parser.add_argument("--db", default=RESULT_HISTORY_DB)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("flaky", help="Flaky scores, quarantined tests marked with *.")
+    history_parser = commands.add_parser("history", help="Recent results of one test.")
+    history_parser.add_argument("node_id")
+    args = parser.parse_args(argv)
+
+    history = ResultHistory(args.db)
+    if args.command == "flaky":
+        quarantined = history.quarantined()
+        for node_id, score in history.flaky_scores().items():
+            print(f"{'*' if node_id in quarantined else ' '} {score:.3f}  {node_id}")
+    else:
+        for result in history.recent(node_ids=[args.node_id]).get(args.node_id, []):
+            print(f"{result['outcome']:<8} {result['duration']:>8.3f}s  reruns {result['reruns']}  "
+                  f"{result['signature'] or ''} {result['message'] or ''}")
+    history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
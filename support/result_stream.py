@@ -0,0 +1,345 @@
+"""
+Streaming result reporter (RESULT_STREAM=true).
+
+Appends one JSON line per test (after its teardown) and per timed step to
+RESULT_STREAM_FILE as results arrive, plus a line when a worker session
+starts and finishes. Nothing is kept in memory once written, and every
+record reaches the file immediately, so an aborted or timed-out job still
+leaves the results of every test that completed.
+
+Parallel workers append to the same file: each record is a single O_APPEND
+write under an exclusive lock (fcntl, where available), so lines never
+interleave. Records carry the run ID (shared by the workers of one
+parallel run). A new run (a plain pytest session, or the parallel runner
+before it starts its workers) moves the previous run's file aside to
+`<name>.previous.jsonl`, so the stream never holds more than one run and
+the one before it is kept for comparison.
+
+Render an HTML summary from the stream afterwards (the last run by default).
+The summary links videos/traces instead of embedding them:
+    python -m support.result_stream reports/results.jsonl -o reports/summary.html
+"""
+import argparse
+import html
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+try:
+    import fcntl
+except ImportError:  # Windows: O_APPEND writes only
+    fcntl = None
+
+from config.config import RESULT_STREAM_FILE, RESULT_STREAM_STEPS, RUN_ID, WORKER_ID
+from support.step_timer import timer as step_timer
+
+logger = logging.getLogger(__name__)
+
+MAX_LONGREPR = 4000
+FAILED_OUTCOMES = ("failed", "error")
+
+
+def now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+class JsonlAppender:
+    """
+    Appends JSON lines to a file shared by several processes and threads.
+    Each record is written with one `os.write` on an O_APPEND descriptor
+    while holding an exclusive lock, and goes straight to the OS (no buffer).
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._lock = threading.Lock()
+
+    def write(self, record: dict):
+        data = memoryview((json.dumps(record, default=str, separators=(",", ":")) + "\n").encode())
+        with self._lock:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                # Regular files take the whole line at once; loop in case of a short write
+                while data:
+                    data = data[os.write(self._fd, data):]
+            finally:
+                if fcntl:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def append_jsonl(path: str | Path, record: dict):
+    """Append a single record (opens and closes the file)."""
+    appender = JsonlAppender(path)
+    try:
+        appender.write(record)
+    finally:
+        appender.close()
+
+
+def rotate(path: str | Path) -> Path | None:
+    """Move a non-empty stream of an earlier run to `<name>.previous.jsonl`, replacing the older one."""
+    path = Path(path)
+    if not path.exists() or not path.stat().st_size:
+        return None
+    previous = path.with_suffix(".previous" + path.suffix)
+    path.replace(previous)
+    logger.info("Moved the previous run's results from %s to %s.", path, previous)
+    return previous
+
+
+def final_outcome(reports: dict) -> str:
+    """pytest-style outcome of a test from its setup/call/teardown reports."""
+    setup, call, teardown = reports.get("setup"), reports.get("call"), reports.get("teardown")
+    if setup is not None and setup.failed:
+        return "error"
+    if setup is not None and setup.skipped:
+        return "xfailed" if hasattr(setup, "wasxfail") else "skipped"
+    if call is not None:
+        if hasattr(call, "wasxfail"):
+            return "xfailed" if call.skipped else "xpassed"
+        if not call.passed:
+            return call.outcome
+    if teardown is not None and teardown.failed:
+        return "error"
+    return "passed"
+
+
+class ResultStreamPlugin:
+    """pytest hooks: write each test's record once its teardown is reported, and the session boundaries."""
+
+    def __init__(self, path: str | Path = RESULT_STREAM_FILE, steps: bool = RESULT_STREAM_STEPS):
+        self.path = Path(path)
+        self.steps = steps
+        self.appender = None
+        self.counts = Counter()
+        self._reports: dict[str, dict] = {}
+        self._artifacts: dict[str, list[str]] = {}
+        self._started = 0.0
+
+    def _write(self, record: dict):
+        self.appender.write({"run": step_timer.run_id, "worker": WORKER_ID, "ts": now(), **record})
+
+    def _write_step(self, record: dict):
+        self._write({"type": "step", **{key: value for key, value in record.items() if key != "run"}})
+
+    def pytest_sessionstart(self, session):
+        if not RUN_ID:
+            # A run of its own; parallel workers share RUN_ID and the runner has rotated already
+            rotate(self.path)
+        self.appender = JsonlAppender(self.path)
+        self._started = time.time()
+        self._write({"type": "session", "event": "start", "host": socket.gethostname(), "pid": os.getpid(),
+                     "args": session.config.invocation_params.args})
+        if self.steps:
+            step_timer.listeners.append(self._write_step)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        report = yield
+        if report.when == "teardown":
+            # Videos/traces kept by the capture policy (see browser_context)
+            self._artifacts[item.nodeid] = [str(path) for path in getattr(item, "capture_artifacts", None) or []]
+        return report
+
+    def pytest_runtest_logreport(self, report):
+        if report.outcome == "rerun":
+            # pytest-rerunfailures: the failed attempt is a record of its own
+            self._reports.pop(report.nodeid, None)
+            self._write_test(report.nodeid, {report.when: report}, "rerun")
+            return
+        reports = self._reports.setdefault(report.nodeid, {})
+        reports[report.when] = report
+        if report.when == "teardown":
+            self._write_test(report.nodeid, self._reports.pop(report.nodeid), final_outcome(reports))
+
+    def _write_test(self, node_id: str, reports: dict, outcome: str):
+        self.counts[outcome] += 1
+        record = {
+            "type": "test",
+            "node_id": node_id,
+            "outcome": outcome,
+            "duration": round(sum(report.duration for report in reports.values()), 4),
+            "phases": {when: report.outcome for when, report in reports.items()},
+            "artifacts": self._artifacts.pop(node_id, []),
+        }
+        failed = next((report for report in reports.values() if report.failed), None)
+        if failed is not None:
+            crash = getattr(failed.longrepr, "reprcrash", None)
+            record["when"] = failed.when
+            message = (crash.message if crash else str(failed.longrepr)).strip()
+            record["message"] = message.splitlines()[0][:500] if message else ""
+            record["longrepr"] = str(failed.longrepr)[-MAX_LONGREPR:]
+        elif outcome in ("skipped", "xfailed", "xpassed"):
+            report = reports.get("call") or reports.get("setup")
+            record["message"] = getattr(report, "wasxfail", "") or (
+                str(report.longrepr[2]) if isinstance(report.longrepr, tuple) else ""
+            )
+        self._write(record)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.steps and self._write_step in step_timer.listeners:
+            step_timer.listeners.remove(self._write_step)
+        self._write({"type": "session", "event": "finish", "exitstatus": int(exitstatus),
+                     "duration": round(time.time() - self._started, 3), "counts": dict(self.counts)})
+        self.appender.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", "result stream")
+        terminalreporter.write_line(
+            f"{sum(self.counts.values())} results streamed to {self.path}. "
+            f"Summary: python -m support.result_stream {self.path}"
+        )
+
+
+def read_records(path: str | Path, run: str | None = None):
+    """
+    Records of `path` one at a time (of `run` only, if given). A line cut off
+    by an aborted writer is skipped.
+    """
+    with Path(path).open(encoding="utf-8") as lines:
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if run is None or record.get("run") == run:
+                yield record
+
+
+def last_run(path: str | Path) -> str | None:
+    run = None
+    for record in read_records(path):
+        run = record.get("run", run)
+    return run
+
+
+def summarize(path: str | Path, run: str) -> dict:
+    """Outcome counts, per-step stats and session bookkeeping of `run`, in one pass and constant memory per step name."""
+    summary = {
+        "run": run, "tests": 0, "outcomes": Counter(), "duration": 0.0, "workers": set(),
+        "started": 0, "finished": 0, "first_ts": None, "last_ts": None,
+        "steps": defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0, "failures": 0}),
+    }
+    for record in read_records(path, run):
+        summary["workers"].add(record.get("worker"))
+        summary["first_ts"] = summary["first_ts"] or record.get("ts")
+        summary["last_ts"] = record.get("ts", summary["last_ts"])
+        if record["type"] == "session":
+            summary["started" if record["event"] == "start" else "finished"] += 1
+        elif record["type"] == "test":
+            summary["outcomes"][record["outcome"]] += 1
+            summary["tests"] += record["outcome"] != "rerun"
+            summary["duration"] += record["duration"]
+        elif record["type"] == "step":
+            step = summary["steps"][record["step"]]
+            step["count"] += 1
+            step["total"] += record["duration"]
+            step["max"] = max(step["max"], record["duration"])
+            step["failures"] += record["outcome"] != "passed"
+    return summary
+
+
+def _link(artifact: str, output_dir: Path) -> str:
+    href = os.path.relpath(Path(artifact).resolve(), output_dir.resolve())
+    return f"<a href='{html.escape(href)}'>{html.escape(Path(artifact).name)}</a>"
+
+
+def _test_row(record: dict, output_dir: Path) -> str:
+    message = html.escape(record.get("message", ""))
+    if record.get("longrepr"):
+        message = f"<details><summary>{message}</summary><pre>{html.escape(record['longrepr'])}</pre></details>"
+    artifacts = " ".join(_link(artifact, output_dir) for artifact in record.get("artifacts", []))
+    return (
+        f"<tr class='{record['outcome']}'><td>{record['outcome']}</td><td>{html.escape(record['node_id'])}</td>"
+        f"<td>{record['duration']:.2f}</td><td>{html.escape(str(record.get('worker', '')))}</td>"
+        f"<td>{message}</td><td>{artifacts}</td></tr>\n"
+    )
+
+
+STYLE = (
+    "body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;margin-bottom:2em}"
+    "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left;vertical-align:top}"
+    "tr.failed td:first-child,tr.error td:first-child{color:#c00}tr.passed td:first-child{color:#080}"
+    "pre{white-space:pre-wrap;max-width:100em}"
+)
+
+
+def render(path: str | Path, output: str | Path, run: str | None = None) -> dict:
+    """
+    Write the HTML summary of `run` (default: the last run in `path`).
+    Rows are streamed from the file to the output, failures first; only the
+    per-step aggregates are held in memory.
+    """
+    path, output = Path(path), Path(output)
+    run = run or last_run(path)
+    summary = summarize(path, run)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    outcomes = ", ".join(f"{count} {outcome}" for outcome, count in sorted(summary["outcomes"].items())) or "no tests"
+    complete = summary["started"] and summary["finished"] == summary["started"]
+    status = "complete" if complete else (
+        f"incomplete: {summary['finished']} of {summary['started']} worker sessions finished (aborted run?)"
+    )
+    headings = "<tr><th>Outcome</th><th>Test</th><th>Duration (s)</th><th>Worker</th><th>Message</th><th>Artifacts</th></tr>"
+    with output.open("w", encoding="utf-8") as out:
+        out.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Run {html.escape(str(run))}</title>"
+                  f"<style>{STYLE}</style></head><body><h1>Run {html.escape(str(run))}</h1>")
+        out.write(f"<p>{summary['tests']} tests: {html.escape(outcomes)}. "
+                  f"{len(summary['workers'])} workers, {summary['duration']:.1f}s of test time, "
+                  f"{html.escape(str(summary['first_ts']))} to {html.escape(str(summary['last_ts']))}.</p>"
+                  f"<p>Run {html.escape(status)}.</p>")
+        for title, wanted in (("Failures", FAILED_OUTCOMES), ("All results", None)):
+            out.write(f"<h2>{title}</h2><table>{headings}")
+            for record in read_records(path, run):
+                if record["type"] == "test" and (wanted is None or record["outcome"] in wanted):
+                    out.write(_test_row(record, output.parent))
+            out.write("</table>")
+        steps = sorted(summary["steps"].items(), key=lambda item: item[1]["total"], reverse=True)
+        if steps:
+            out.write("<h2>Steps</h2><table><tr><th>Step</th><th>Count</th><th>Mean (s)</th><th>Max (s)</th>"
+                      "<th>Total (s)</th><th>Failures</th></tr>")
+            for name, stats in steps:
+                out.write(f"<tr><td>{html.escape(name)}</td><td>{stats['count']}</td>"
+                          f"<td>{stats['total'] / stats['count']:.3f}</td><td>{stats['max']:.3f}</td>"
+                          f"<td>{stats['total']:.3f}</td><td>{stats['failures']}</td></tr>\n")
+            out.write("</table>")
+        out.write("</body></html>\n")
+    logger.info("Rendered %s (%s) into %s.", run, outcomes, output)
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Render an HTML summary from the streamed results.")
+    parser.add_argument("path", nargs="?", default=RESULT_STREAM_FILE)
+    parser.add_argument("-o", "--output", default=None, help="HTML file (default: summary.html next to the stream).")
+    parser.add_argument("--run", help="Run ID to render (default: the last run in the file).")
+    args = parser.parse_args(argv)
+
+    if not Path(args.path).exists():
+        print(f"No result stream at {args.path}.")
+        return 1
+    output = args.output or Path(args.path).with_name("summary.html")
+    summary = render(args.path, output, args.run)
+    print(f"Run {summary['run']}: {summary['tests']} tests, "
+          f"{sum(summary['outcomes'][outcome] for outcome in FAILED_OUTCOMES)} failed or errored. Summary written to {output}.")
+    return 0 if not any(summary["outcomes"][outcome] for outcome in FAILED_OUTCOMES) else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Import-time and collection-time profiling (STARTUP_PROFILE=true).
+
+Installed at the top of conftest.py, before anything else is imported. A
+meta-path hook times the execution of every module imported from then on,
+tagged with the phase it was imported in (startup, collection or run), and
+the pytest hooks time collection. The report is printed in the terminal
+summary and written to STARTUP_PROFILE_FILE.
+
+Standard library only, so installing it costs nothing measurable.
+"""
+import json
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+
+
+class _TimedLoader:
+    """Wraps a module loader to time `exec_module`; everything else is delegated."""
+
+    def __init__(self, loader, profiler: "StartupProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Restore the real loader so importlib.resources etc. see the original
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._begin()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._end(self._name, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class StartupProfiler(MetaPathFinder):
+    def __init__(self):
+        self.imports: dict[str, dict] = {}
+        self.phase = "startup"
+        self.installed_at: float | None = None
+        self.startup_seconds = 0.0
+        self.collection_seconds = 0.0
+        self.collected = 0
+        self._children: list[float] = []
+        self._finding: set[str] = set()
+
+    def install(self):
+        if self not in sys.meta_path:
+            self.installed_at = time.perf_counter()
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self, fullname)
+                    return spec
+            return None
+        finally:
+            self._finding.discard(fullname)
+
+    def _begin(self):
+        self._children.append(0.0)
+
+    def _end(self, name: str, elapsed: float):
+        children = self._children.pop()
+        if self._children:
+            self._children[-1] += elapsed
+        self.imports[name] = {
+            "phase": self.phase,
+            # Not imported from within another profiled import
+            "root": not self._children,
+            "cumulative_ms": round(elapsed * 1000, 2),
+            "self_ms": round((elapsed - children) * 1000, 2),
+        }
+
+    def top_level_imports(self, phase: str | None = None) -> dict[str, float]:
+        """Cumulative milliseconds per root import (see `_end`) in `phase` (default: all), slowest first."""
+        totals = {
+            name: timing["cumulative_ms"] for name, timing in self.imports.items()
+            if timing["root"] and (phase is None or timing["phase"] == phase)
+        }
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def phase_totals(self) -> dict[str, float]:
+        """Milliseconds spent importing in each phase (root imports only, so nothing is counted twice)."""
+        totals: dict[str, float] = {}
+        for timing in self.imports.values():
+            if timing["root"]:
+                totals[timing["phase"]] = round(totals.get(timing["phase"], 0.0) + timing["cumulative_ms"], 2)
+        return totals
+
+    def to_dict(self) -> dict:
+        return {
+            "startup_seconds": round(self.startup_seconds, 3),
+            "collection_seconds": round(self.collection_seconds, 3),
+            "collected": self.collected,
+            "import_ms_by_phase": self.phase_totals(),
+            "top_level_imports": self.top_level_imports(),
+            "modules": self.imports,
+        }
+
+    def save(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+
+class StartupProfilePlugin:
+    """pytest hooks that time collection and report the profile."""
+
+    def __init__(self, profiler: StartupProfiler, output: str):
+        self.profiler = profiler
+        self.output = output
+        self._collection_start = 0.0
+
+    def pytest_collection(self, session):
+        self.profiler.phase = "collection"
+        self._collection_start = time.perf_counter()
+        if self.profiler.installed_at is not None:
+            self.profiler.startup_seconds = self._collection_start - self.profiler.installed_at
+
+    def pytest_collection_finish(self, session):
+        self.profiler.collection_seconds = time.perf_counter() - self._collection_start
+        self.profiler.collected = len(session.items)
+        self.profiler.phase = "run"
+
+    def pytest_sessionfinish(self, session):
+        self.profiler.save(self.output)
+        self.profiler.uninstall()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        phases = self.profiler.phase_totals()
+        terminalreporter.write_sep("-", "startup profile")
+        terminalreporter.write_line(
+            f"Startup (conftest to collection) {self.profiler.startup_seconds:.3f}s. "
+            f"Imports: {phases.get('startup', 0.0):.0f}ms at startup, {phases.get('collection', 0.0):.0f}ms "
+            f"during collection, {phases.get('run', 0.0):.0f}ms while running tests. "
+            f"Collected {self.profiler.collected} items in {self.profiler.collection_seconds:.3f}s."
+        )
+        for name, cumulative_ms in list(self.profiler.top_level_imports().items())[:10]:
+            terminalreporter.write_line(f"  {cumulative_ms:>8.1f}ms  {name} ({self.profiler.imports[name]['phase']})")
+        terminalreporter.write_line(f"Full profile: {self.output}")
+
+
+profiler = StartupProfiler()
@@ -0,0 +1,68 @@
+import json
+import logging
+from playwright.sync_api import BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+# Injected into restored contexts; sessionStorage is not part of Playwright's storage state
+RESTORE_SESSION_STORAGE_SCRIPT = """
+(snapshot => {
+    const items = snapshot[window.location.origin];
+    if (!items || window.sessionStorage.getItem("__snapshot_restored")) {
+        return;
+    }
+    for (const [key, value] of Object.entries(items)) {
+        window.sessionStorage.setItem(key, value);
+    }
+    window.sessionStorage.setItem("__snapshot_restored", "1");
+})(%s);
+"""
+
+
+class SnapshotStore:
+    """
+    Session-wide cache of browser storage snapshots taken at named checkpoints
+    of a flow (cookies, localStorage, sessionStorage and the current URL).
+    Restoring a snapshot into a new context lets a test start mid-flow.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[str, dict] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._snapshots
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._snapshots)
+
+    def capture(self, name: str, context: BrowserContext, page: Page, data: dict | None = None):
+        """
+        Capture the storage state of `context` (and `page`'s sessionStorage) as `name`.
+        `data` holds test data the flow used so far (e.g. the user details entered).
+        """
+        state = context.storage_state()
+        origin = page.evaluate("() => window.location.origin")
+        session_storage = page.evaluate("() => Object.assign({}, window.sessionStorage)")
+        self._snapshots[name] = {
+            "storage_state": state,
+            "session_storage": {origin: session_storage},
+            "url": page.url,
+            "data": data or {},
+        }
+        logger.info(f"Captured snapshot '{name}' at {page.url}.")
+
+    def context_options(self, name: str) -> dict:
+        """Options for `browser.new_context` that restore cookies and localStorage."""
+        return {"storage_state": self._snapshots[name]["storage_state"]}
+
+    def restore_session_storage(self, name: str, context: BrowserContext):
+        """Re-populate sessionStorage on the first navigation of each origin."""
+        script = RESTORE_SESSION_STORAGE_SCRIPT % json.dumps(self._snapshots[name]["session_storage"])
+        context.add_init_script(script)
+
+    def url(self, name: str) -> str:
+        return self._snapshots[name]["url"]
+
+    def data(self, name: str) -> dict:
+        return self._snapshots[name]["data"]
@@ -0,0 +1,224 @@
+"""
+Per-step timing instrumentation.
+
+Page-object actions and API requests are decorated with `timed_step`, which
+records duration, outcome, retries and the locator/endpoint of every call
+made while timing is enabled. When disabled the decorator only adds a single
+attribute check per call.
+
+Timings are aggregated per step and per test as they are recorded and
+merged into a JSON file across runs; the raw records are streamed to a CSV
+file instead of being kept in memory.
+With `log_events` every record is also logged as a structured event (see
+structured_log), and every listener (e.g. the result stream) is called with it.
+"""
+import csv
+import functools
+import heapq
+import html
+import json
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from config.config import STEP_TIMING, STEP_TIMINGS_FILE, RUN_ID
+
+SELECTOR_PATTERN = re.compile(r"selector='(.*)'>$")
+CSV_FIELDS = ["run", "test", "step", "target", "duration", "retries", "outcome"]
+SLOWEST_STEPS = 10
+
+logger = logging.getLogger(__name__)
+
+
+def describe_target(args: tuple) -> str:
+    """
+    Describe what a step acted on: a locator's selector or an endpoint.
+    Other text arguments (typed or expected text, often generated names and
+    emails) are never recorded.
+    """
+    for arg in args:
+        if hasattr(arg, "nth") and hasattr(arg, "click"):
+            match = SELECTOR_PATTERN.search(repr(arg))
+            return match.group(1) if match else repr(arg)
+        if isinstance(arg, str) and (arg.startswith("/") or "://" in arg):
+            return arg
+    return ""
+
+
+class StepTimer:
+    """
+    Keeps running aggregates (per step, per test and step) and the slowest
+    SLOWEST_STEPS records instead of every record, so memory does not grow
+    with the number of steps. Raw records are streamed to the CSV once
+    `start` has been called. Safe to record from several threads.
+    """
+
+    def __init__(self, enabled: bool = STEP_TIMING):
+        self.enabled = enabled
+        self.log_events = False
+        self.current_test = ""
+        self.count = 0
+        self.listeners: list[Callable[[dict], None]] = []
+        # Set by the parallel runner so all workers share the run ID
+        self.run_id = RUN_ID or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        self._csv_file = None
+        self._csv_writer = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget this run's aggregates (e.g. after benchmarks)."""
+        self.count = 0
+        self._steps = defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0, "retries": 0, "failures": 0})
+        self._tests = defaultdict(lambda: defaultdict(lambda: {"count": 0, "total": 0.0}))
+        self._slowest: list[tuple[float, int, dict]] = []
+
+    def start(self, path: str = STEP_TIMINGS_FILE):
+        """Stream raw records to the CSV next to `path` from now on."""
+        csv_path = Path(path).with_suffix(".csv")
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        write_header = not csv_path.exists()
+        self._csv_file = csv_path.open("a", newline="")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDS)
+        if write_header:
+            self._csv_writer.writeheader()
+
+    def record(self, step: str, duration: float, target: str = "", retries: int = 0, outcome: str = "passed"):
+        record = {
+            "run": self.run_id,
+            "test": self.current_test,
+            "step": step,
+            "target": target,
+            "duration": round(duration, 4),
+            "retries": retries,
+            "outcome": outcome,
+        }
+        # Steps are recorded from several threads (bulk API calls, cleanup teardown)
+        with self._lock:
+            self.count += 1
+            stats = self._steps[step]
+            stats["count"] += 1
+            stats["total"] += record["duration"]
+            stats["max"] = max(stats["max"], record["duration"])
+            stats["retries"] += retries
+            stats["failures"] += outcome != "passed"
+            test_step = self._tests[self.current_test][step]
+            test_step["count"] += 1
+            test_step["total"] += record["duration"]
+            entry = (record["duration"], self.count, record)
+            if len(self._slowest) < SLOWEST_STEPS:
+                heapq.heappush(self._slowest, entry)
+            elif entry > self._slowest[0]:
+                heapq.heapreplace(self._slowest, entry)
+            if self._csv_writer:
+                self._csv_writer.writerow(record)
+        if self.log_events:
+            logger.info("%s %s in %.3fs", step, outcome, duration, extra=record)
+        for listener in self.listeners:
+            listener(record)
+
+    def aggregate(self) -> dict:
+        """This run's aggregate per step and per test."""
+        return {"steps": self._steps, "tests": self._tests}
+
+    def slowest_steps(self, limit: int = SLOWEST_STEPS) -> list[dict]:
+        return [record for _, _, record in sorted(self._slowest, reverse=True)[:limit]]
+
+    def save(self, path: str = STEP_TIMINGS_FILE):
+        """Merge this run into the JSON aggregate and close the CSV stream."""
+        with self._lock:
+            if self._csv_file:
+                self._csv_file.close()
+                self._csv_file = self._csv_writer = None
+        if not self.count:
+            return
+        json_path = Path(path)
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(merge_aggregates(load_aggregate(json_path), self.aggregate()), indent=2))
+
+    def slowest_steps_html(self, limit: int = SLOWEST_STEPS) -> str:
+        rows = "".join(
+            f"<tr><td>{html.escape(record['test'])}</td><td>{html.escape(record['step'])}</td>"
+            f"<td>{html.escape(record['target'])}</td><td>{record['duration']:.3f}</td>"
+            f"<td>{record['retries']}</td><td>{record['outcome']}</td></tr>"
+            for record in self.slowest_steps(limit)
+        )
+        return (
+            "<h2>Slowest steps</h2><table><tr><th>Test</th><th>Step</th><th>Target</th>"
+            f"<th>Duration (s)</th><th>Retries</th><th>Outcome</th></tr>{rows}</table>"
+        )
+
+
+def load_aggregate(path) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"steps": {}, "tests": {}}
+
+
+def merge_aggregates(base: dict, new: dict) -> dict:
+    """Combine two aggregates (e.g. previous runs + this run, or several workers)."""
+    steps = base.setdefault("steps", {})
+    for name, stats in new.get("steps", {}).items():
+        merged = steps.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "retries": 0, "failures": 0})
+        merged["count"] += stats["count"]
+        merged["total"] = round(merged["total"] + stats["total"], 4)
+        merged["max"] = max(merged["max"], stats["max"])
+        merged["retries"] += stats["retries"]
+        merged["failures"] += stats["failures"]
+        merged["mean"] = round(merged["total"] / merged["count"], 4)
+    tests = base.setdefault("tests", {})
+    for test, test_steps in new.get("tests", {}).items():
+        for name, stats in test_steps.items():
+            merged = tests.setdefault(test, {}).setdefault(name, {"count": 0, "total": 0.0})
+            merged["count"] += stats["count"]
+            merged["total"] = round(merged["total"] + stats["total"], 4)
+    return base
+
+
+timer = StepTimer()
+
+
+def timed_step(func):
+    """Record duration, outcome, retries and target of every call to `func`."""
+    step = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not timer.enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            timer.record(step, time.perf_counter() - start, describe_target(args[1:]), outcome="failed")
+            raise
+        timer.record(step, time.perf_counter() - start, describe_target(args[1:]), getattr(result, "retries", 0))
+        return result
+
+    return wrapper
+
+
+def timed_async_step(func):
+    """`timed_step` for coroutine functions (async page objects)."""
+    step = func.__qualname__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not timer.enabled:
+            return await func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            timer.record(step, time.perf_counter() - start, describe_target(args[1:]), outcome="failed")
+            raise
+        timer.record(step, time.perf_counter() - start, describe_target(args[1:]), getattr(result, "retries", 0))
+        return result
+
+    return wrapper
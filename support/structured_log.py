@@ -0,0 +1,275 @@
+"""
+Structured JSON logging (STRUCTURED_LOGS=true).
+
+Records from the framework's loggers (LOG_LOGGERS) are put on a queue as they
+are; a background listener thread formats them as one JSON event per line
+into LOG_DIR/worker_<WORKER_ID>.jsonl. Emitting a record therefore costs a
+level check, the sampling filter and a queue put, and message arguments are
+only interpolated on the listener thread (log with `%s` args, not f-strings).
+
+The framework loggers stop propagating while this runs: their records go
+to the JSON log only, not to pytest's log capture.
+
+Every event carries the test ID, worker, the function that logged it as
+`step` and any `extra` fields; step timings (see step_timer) add `duration`,
+`outcome` and `target`. Emails, phone numbers and the LOG_REDACT_FIELDS
+extras (e.g. text typed by `input_text`) are redacted unless LOG_REDACT=false.
+
+Summarize step timings from the events:
+    python -m support.structured_log reports/logs --slowest 20
+"""
+import argparse
+import copy
+import json
+import logging
+import re
+import sys
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from queue import SimpleQueue
+
+from config.config import LOG_DIR, LOG_LEVEL, LOG_LOGGERS, LOG_SAMPLE_RATES, LOG_REDACT, LOG_REDACT_FIELDS, WORKER_ID
+from support.step_timer import timer as step_timer
+
+# Attributes every LogRecord has; anything else on a record came from `extra`
+RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+# Formatted or international numbers; bare digit runs (seeds, IDs, timestamps) are left alone
+PHONE_PATTERN = re.compile(r"(?<![\w.+])(?:(?:\+\d{1,3}[\s.-]?)?\(?\d{3}\)?[\s.-]\d{3}[\s.-]\d{4}|\+\d{10,14})(?![\w.])")
+REDACTED = "[redacted]"
+
+
+def parse_sample_rates(spec: str) -> dict[int, float]:
+    """'DEBUG=0.1,INFO=0.5' -> {10: 0.1, 20: 0.5}. Levels not listed are always kept."""
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        level, _, rate = item.partition("=")
+        rates[logging.getLevelName(level.strip().upper())] = float(rate)
+    return rates
+
+
+def redact(value: str) -> str:
+    return PHONE_PATTERN.sub("[phone]", EMAIL_PATTERN.sub("[email]", value))
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a fixed fraction of the records of each level, e.g. every tenth
+    DEBUG record at 0.1. Deterministic, so reruns log the same records.
+    """
+
+    def __init__(self, rates: dict[int, float]):
+        super().__init__()
+        self.rates = rates
+        self.dropped = 0
+        self._credit = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelno, 1.0)
+        if rate >= 1.0:
+            return True
+        with self._lock:
+            credit = self._credit[record.levelno] + rate
+            keep = credit >= 1.0
+            self._credit[record.levelno] = credit - keep
+            self.dropped += not keep
+        return keep
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Enqueues records without formatting them (QueueHandler.prepare would
+    interpolate the message on the calling thread). Adds the test and worker.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Other handlers (e.g. pytest's capture) see the same record; work on a copy
+        record = copy.copy(record)
+        record.__dict__.setdefault("test", step_timer.current_test)
+        record.worker = WORKER_ID
+        if record.exc_info:
+            # Tracebacks are rendered now, while their frames are still alive
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record; runs on the listener thread."""
+
+    def __init__(self, redact_pii: bool = LOG_REDACT, redact_fields: list[str] = LOG_REDACT_FIELDS):
+        super().__init__()
+        self.redact_pii = redact_pii
+        self.redact_fields = set(redact_fields)
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "test": "",
+            "worker": "",
+            "step": record.funcName,
+            "message": record.getMessage(),
+        }
+        event.update((key, value) for key, value in vars(record).items() if key not in RECORD_ATTRIBUTES)
+        if record.exc_text:
+            event["exception"] = record.exc_text
+        if self.redact_pii:
+            for key, value in event.items():
+                if key in self.redact_fields:
+                    event[key] = REDACTED
+                elif isinstance(value, str):
+                    event[key] = redact(value)
+        return json.dumps(event, default=str)
+
+
+class StructuredLogging:
+    """
+    Attaches a ContextQueueHandler to `loggers` and runs the listener that
+    writes their records to `path`. While attached the loggers do not
+    propagate, so no other handler (e.g. pytest's log capture) formats their
+    records on the calling thread. `start`/`stop` are idempotent.
+    """
+
+    def __init__(self, path: str | Path, level: str = LOG_LEVEL, loggers: list[str] = LOG_LOGGERS,
+                 sample_rates: dict[int, float] | None = None, formatter: logging.Formatter | None = None):
+        self.path = Path(path)
+        self.level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+        self.loggers = loggers
+        self.sampler = SamplingFilter(parse_sample_rates(LOG_SAMPLE_RATES) if sample_rates is None else sample_rates)
+        self.formatter = formatter or JsonFormatter()
+        self._queue = SimpleQueue()
+        self._handler = ContextQueueHandler(self._queue)
+        self._handler.addFilter(self.sampler)
+        self._file_handler = None
+        self._listener = None
+        self._saved_levels = {}
+        self._saved_propagate = {}
+
+    def start(self):
+        if self._listener:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file_handler = logging.FileHandler(self.path, encoding="utf-8")
+        self._file_handler.setFormatter(self.formatter)
+        self._listener = QueueListener(self._queue, self._file_handler)
+        self._listener.start()
+        for name in self.loggers:
+            logger = logging.getLogger(name)
+            self._saved_levels[name] = logger.level
+            # Only lower the level: a more verbose level set elsewhere is kept
+            if logger.level == logging.NOTSET or logger.level > self.level:
+                logger.setLevel(self.level)
+            logger.addHandler(self._handler)
+            self._saved_propagate[name] = logger.propagate
+            logger.propagate = False
+
+    def stop(self):
+        """Detach, then drain the queue and close the file."""
+        if not self._listener:
+            return
+        for name in self.loggers:
+            logger = logging.getLogger(name)
+            logger.removeHandler(self._handler)
+            logger.setLevel(self._saved_levels.pop(name, logging.NOTSET))
+            logger.propagate = self._saved_propagate.pop(name, True)
+        self._listener.stop()
+        self._file_handler.close()
+        self._listener = None
+
+    def stats(self) -> dict:
+        return {"path": str(self.path), "dropped_by_sampling": self.sampler.dropped}
+
+
+def worker_log_path(log_dir: str = LOG_DIR) -> Path:
+    return Path(log_dir) / f"worker_{WORKER_ID}.jsonl"
+
+
+class StructuredLogPlugin:
+    """pytest hooks: log step timings as events while the session runs and report where they went."""
+
+    def __init__(self, structured_logging: StructuredLogging):
+        self.structured_logging = structured_logging
+
+    def pytest_sessionstart(self, session):
+        self.structured_logging.start()
+        step_timer.log_events = True
+
+    def pytest_terminal_summary(self, terminalreporter):
+        stats = self.structured_logging.stats()
+        terminalreporter.write_sep("-", "structured logs")
+        terminalreporter.write_line(f"Events written to {stats['path']} ({stats['dropped_by_sampling']} dropped by sampling).")
+
+    def pytest_unconfigure(self, config):
+        step_timer.log_events = False
+        self.structured_logging.stop()
+
+
+def load_events(paths: list[str]) -> list[dict]:
+    """Events from JSONL files and/or directories of them (e.g. every worker's log)."""
+    events = []
+    for path in map(Path, paths):
+        for file in sorted(path.glob("*.jsonl")) if path.is_dir() else [path]:
+            with file.open(encoding="utf-8") as lines:
+                events.extend(json.loads(line) for line in lines if line.strip())
+    return events
+
+
+def summarize_steps(events: list[dict]) -> dict[str, dict]:
+    """Per-step count, failures and p50/p95/max duration of the step timing events, slowest p95 first."""
+    from api_utils.load_generator import percentile
+
+    durations = defaultdict(list)
+    failures = defaultdict(int)
+    for event in events:
+        if "duration" in event and "outcome" in event:
+            durations[event["step"]].append(event["duration"])
+            failures[event["step"]] += event["outcome"] != "passed"
+    summary = {}
+    for step, values in durations.items():
+        values.sort()
+        summary[step] = {
+            "count": len(values),
+            "failures": failures[step],
+            "p50": round(percentile(values, 50), 4),
+            "p95": round(percentile(values, 95), 4),
+            "max": values[-1],
+        }
+    return dict(sorted(summary.items(), key=lambda item: item[1]["p95"], reverse=True))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Summarize step timings from structured logs.")
+    parser.add_argument("paths", nargs="*", default=[LOG_DIR], help="JSONL files or directories.")
+    parser.add_argument("--test", help="Only events of tests whose ID contains this text.")
+    parser.add_argument("--slowest", type=int, default=20, help="Number of steps to show.")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON.")
+    args = parser.parse_args(argv)
+
+    events = load_events(args.paths)
+    if args.test:
+        events = [event for event in events if args.test in event.get("test", "")]
+    summary = dict(list(summarize_steps(events).items())[:args.slowest])
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    print(f"{'step':<50} {'count':>6} {'fail':>5} {'p50':>8} {'p95':>8} {'max':>8}")
+    for step, stats in summary.items():
+        print(f"{step:<50} {stats['count']:>6} {stats['failures']:>5} "
+              f"{stats['p50']:>8.3f} {stats['p95']:>8.3f} {stats['max']:>8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""
+UI fixtures (browser pool, contexts, page objects).
+
+Loaded as a pytest plugin from conftest.py. Playwright and the page objects
+are imported inside the fixtures, so runs that request no UI fixture (e.g.
+API-only runs) never import them.
+"""
+import logging
+
+import pytest
+
+from config.config import BASE_URL, HEADLESS, BROWSER_MAX_CONTEXTS, VIDEO_DIR
+from config.config import (
+    NETWORK_ROUTING, BLOCKED_RESOURCE_TYPES, NETWORK_DENY_PATTERNS,
+    NETWORK_ALLOW_PATTERNS, NETWORK_CACHE_DIR
+)
+from config.config import HAR_MODE, HAR_DIR, HAR_URL_FILTER, HAR_NOT_FOUND
+from config.config import CAPTURE_MODE, VIDEO_WIDTH, VIDEO_HEIGHT
+from config.config import PERF_METRICS, PERF_METRICS_FILE
+
+browser_pool_stats_key = pytest.StashKey[dict]()
+network_router_stats_key = pytest.StashKey[dict]()
+perf_results_key = pytest.StashKey[list]()
+
+logger = logging.getLogger(__name__)
+
+
+def item_failed(item) -> bool:
+    """True when setup or the test body of `item` failed."""
+    return any(getattr(getattr(item, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+
+def item_passed(item) -> bool:
+    """True when the test body of `item` has run and passed."""
+    report = getattr(item, "rep_call", None)
+    return report is not None and report.passed
+
+def new_network_router():
+    """The NetworkRouter configured by NETWORK_*, or None when NETWORK_ROUTING=false."""
+    if not NETWORK_ROUTING:
+        return None
+    from support.network_router import NetworkRouter
+
+    return NetworkRouter(
+        blocked_resource_types=BLOCKED_RESOURCE_TYPES,
+        deny_patterns=NETWORK_DENY_PATTERNS,
+        allow_patterns=NETWORK_ALLOW_PATTERNS,
+        cache_dir=NETWORK_CACHE_DIR or None
+    )
+
+def new_har_manager():
+    from support.har_replay import HarManager
+
+    return HarManager(mode=HAR_MODE, har_dir=HAR_DIR, url_filter=HAR_URL_FILTER, not_found=HAR_NOT_FOUND)
+
+def new_capture_policy():
+    from support.capture_policy import CapturePolicy
+
+    return CapturePolicy(mode=CAPTURE_MODE, artifacts_dir=VIDEO_DIR, video_size=(VIDEO_WIDTH, VIDEO_HEIGHT))
+
+def open_test_context(browser_pool, network_router, har_manager, capture_policy, test_id: str, retry: int = 0,
+                      snapshot_store=None, restored_snapshot: str | None = None):
+    """
+    A test's browser context as the `browser_context` fixture sets it up
+    (also timed by the fixture benchmarks): capture policy, restored
+    snapshot, network routing and HAR recording/replay.
+    """
+    context_options = snapshot_store.context_options(restored_snapshot) if restored_snapshot else {}
+    context = browser_pool.new_context(
+        viewport={"width": 2560, "height": 1440},
+        **capture_policy.context_options(),
+        **context_options
+    )
+    capture_policy.start(context, retry=retry)
+    if restored_snapshot:
+        snapshot_store.restore_session_storage(restored_snapshot, context)
+    if network_router:
+        network_router.attach(context)
+    # Registered last so replayed responses take precedence over the router
+    har_manager.attach(context, test_id)
+    return context
+
+def close_test_context(context, har_manager, capture_policy, test_id: str, test_name: str,
+                       failed: bool, passed: bool) -> list:
+    """Close a context from `open_test_context`; returns the kept capture artifacts."""
+    # Closing the context clears cookies, cache and storage
+    artifacts = capture_policy.finish(context, test_name, failed=failed)
+    har_manager.finalize(test_id, passed=passed)
+    return artifacts
+
+@pytest.fixture(scope="session")
+def browser_pool(pytestconfig):
+    """
+    One browser per worker process, kept alive for the whole session.
+    Recycled after BROWSER_MAX_CONTEXTS contexts or when it crashes.
+    """
+    from support.browser_pool import BrowserPool
+
+    pool = BrowserPool(
+        headless=HEADLESS,
+        max_contexts=BROWSER_MAX_CONTEXTS,
+        launch_args=["--window-size=1920,1080"]
+    )
+    yield pool
+    pool.close()
+    pytestconfig.stash[browser_pool_stats_key] = pool.stats()
+
+@pytest.fixture
+def browser(browser_pool):
+    """Provide the pooled Playwright browser."""
+    return browser_pool.browser
+
+@pytest.fixture(scope="session")
+def network_router(pytestconfig):
+    """
+    Blocks heavy/third-party requests and serves static assets from disk.
+    Returns None when NETWORK_ROUTING=false for full-fidelity runs.
+    """
+    router = new_network_router()
+    yield router
+    if router:
+        pytestconfig.stash[network_router_stats_key] = router.stats()
+
+@pytest.fixture(scope="session")
+def har_manager():
+    """Records or replays per-test HAR archives depending on HAR_MODE."""
+    return new_har_manager()
+
+@pytest.fixture(scope="session")
+def snapshot_store():
+    """Storage-state snapshots captured at HomePage checkpoints during the session."""
+    from support.state_snapshots import SnapshotStore
+
+    return SnapshotStore()
+
+@pytest.fixture(scope="session")
+def snapshot_warmer(browser_pool, network_router, har_manager, snapshot_store):
+    """
+    Creates the snapshots `start_from` tests need on demand, so they do not
+    depend on another test having run first in the same worker. The flow that
+    defines the checkpoint runs up to it in a throwaway context, once per
+    session (recorded or replayed like a test, as `checkpoint_<name>`); the
+    snapshot then stays in `snapshot_store` for later tests.
+    Returns a callable: snapshot name -> True when the snapshot is available.
+    """
+    from pages.home_page import HomePage
+    from support.flow_engine import FlowEngine, find_checkpoint_flow
+
+    failed = set()
+
+    def warm(name: str) -> bool:
+        if name in snapshot_store or name in failed:
+            return name in snapshot_store
+        har_name = f"checkpoint_{name}"
+        context = browser_pool.new_context(viewport={"width": 2560, "height": 1440})
+        try:
+            if network_router:
+                network_router.attach(context)
+            har_manager.attach(context, har_name)
+            home_page = HomePage(context.new_page(), context, BASE_URL, snapshot_store)
+            FlowEngine(home_page).run(find_checkpoint_flow(name), stop_after=name)
+        except Exception as error:
+            logger.warning("Could not create snapshot '%s': %s", name, error)
+        finally:
+            context.close()
+            har_manager.finalize(har_name, passed=name in snapshot_store)
+        if name not in snapshot_store:
+            failed.add(name)
+        return name in snapshot_store
+
+    return warm
+
+@pytest.fixture
+def restored_snapshot(request, snapshot_warmer):
+    """
+    Name of the snapshot the test starts from (`@pytest.mark.start_from(name)`),
+    created on demand when no earlier test captured it; None when the test is
+    unmarked or the snapshot could not be created.
+    """
+    marker = request.node.get_closest_marker("start_from")
+    if marker and snapshot_warmer(marker.args[0]):
+        return marker.args[0]
+    return None
+
+@pytest.fixture(scope="session")
+def capture_policy():
+    """Decides which videos/traces are recorded and kept (CAPTURE_MODE)."""
+    policy = new_capture_policy()
+    yield policy
+    policy.shutdown()
+
+@pytest.fixture
+def browser_context(request, browser_pool, network_router, har_manager, capture_policy, snapshot_store, restored_snapshot):
+    """Set up a fresh browser context for each test to avoid shared session data."""
+    context = open_test_context(
+        browser_pool, network_router, har_manager, capture_policy, request.node.nodeid,
+        # pytest-rerunfailures counts executions from 1
+        retry=getattr(request.node, "execution_count", 1) - 1,
+        snapshot_store=snapshot_store, restored_snapshot=restored_snapshot
+    )
+    yield context
+    request.node.capture_artifacts = close_test_context(
+        context, har_manager, capture_policy, request.node.nodeid, request.node.name,
+        failed=item_failed(request.node), passed=item_passed(request.node)
+    )
+
+@pytest.fixture
+def page(browser_context):
+    """Provide a new page for each test, ensuring isolation."""
+    page = browser_context.new_page()
+    yield page
+    page.close()
+
+@pytest.fixture
+def perf_monitor(request, browser_context, page):
+    """
+    Browser performance metrics of the test (page load, long tasks, time to
+    the next chat bubble), checked against PERF_BUDGETS after the test body
+    and appended to PERF_METRICS_FILE. None when PERF_METRICS=false.
+    """
+    if not PERF_METRICS:
+        yield None
+        return
+    from support.perf_metrics import PerfMonitor
+
+    monitor = PerfMonitor(request.node.nodeid)
+    monitor.attach(browser_context, page)
+    request.node.perf_monitor = monitor
+    yield monitor
+    if not monitor.captured:
+        # The test failed before the budgets were checked; keep what the page recorded
+        try:
+            monitor.capture()
+        except Exception as error:
+            logger.debug("No performance metrics for %s: %s", request.node.nodeid, error)
+    monitor.export(PERF_METRICS_FILE)
+    request.config.stash.setdefault(perf_results_key, []).append(monitor.to_dict())
+
+@pytest.fixture
+def common_functions(page):
+    """Initialize and provide the CommonFunctions class."""
+    from support.common_functions import CommonFunctions
+
+    return CommonFunctions(page)
+
+@pytest.fixture
+def home_page(page, browser_context, snapshot_store, restored_snapshot, perf_monitor):
+    """Initialize and provide the HomePage class."""
+    from pages.home_page import HomePage
+
+    return HomePage(page, browser_context, BASE_URL, snapshot_store, restored_snapshot, perf_monitor)
+
+@pytest.fixture
+def flow_engine(home_page):
+    """Runs declarative chat flows from FLOW_DIR through the HomePage."""
+    from support.flow_engine import FlowEngine
+
+    return FlowEngine(home_page)
+
+@pytest.fixture
+def conversation_runner():
+    """
+    Runs many flows concurrently with the async page objects, each in its
+    own context of a dedicated browser (up to UI_CONCURRENCY at a time).
+    """
+    from support.conversation_runner import ConversationRunner
+
+    return ConversationRunner(BASE_URL)
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Check the performance budgets right after the test body, so enforced budgets fail the test itself."""
+    result = yield
+    monitor = getattr(item, "perf_monitor", None)
+    if monitor:
+        try:
+            monitor.capture()
+        except Exception as error:
+            logger.warning("Could not capture performance metrics for %s: %s", item.nodeid, error)
+        else:
+            monitor.check_budgets()
+    return result
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report how much browser launch time and network traffic were saved."""
+    stats = config.stash.get(browser_pool_stats_key, None)
+    if stats:
+        terminalreporter.write_sep("-", "browser pool")
+        terminalreporter.write_line(
+            f"{stats['contexts_served']} contexts served by {stats['launches']} browser launches "
+            f"({stats['recycles']} recycles, {stats['crashes']} crashes). "
+            f"Avg launch {stats['average_launch_seconds']}s, "
+            f"estimated {stats['estimated_seconds_saved']}s saved."
+        )
+    stats = config.stash.get(network_router_stats_key, None)
+    if stats:
+        terminalreporter.write_sep("-", "network routing")
+        terminalreporter.write_line(
+            f"{stats['requests_blocked']} of {stats['requests_seen']} requests blocked. "
+            f"Cache: {stats['cache_hits']} hits, {stats['cache_misses']} misses, "
+            f"{stats['cache_revalidations']} revalidations, "
+            f"{stats['bytes_from_cache'] / 1024:.1f} KiB served from disk."
+        )
+    results = config.stash.get(perf_results_key, None)
+    if results:
+        over_budget = [result for result in results if result["over_budget"]]
+        terminalreporter.write_sep("-", "browser performance")
+        terminalreporter.write_line(
+            f"{len(results)} tests measured, {len(over_budget)} over budget. Metrics appended to {PERF_METRICS_FILE}."
+        )
+        for result in over_budget:
+            terminalreporter.write_line(f"{result['test']}: {'; '.join(result['over_budget'])}")
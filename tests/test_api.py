@@ -1,3 +1,5 @@
+import asyncio
+from api_utils.schemas import AUTHOR, VALIDATION_PROBLEM, validate_responses
 from support.random_utils import generate_author_payload
 
 def test_create_author(authors_api):
@@ -12,6 +14,7 @@ def test_create_author(authors_api):
     assert create_response.status_code in [200], f"Create failed: {create_response.status_code}"
 
     created_author = create_response.json()
+    AUTHOR.assert_valid(created_author)
     assert created_author["id"] == payload["id"], "ID mismatch"
     assert created_author["firstName"] == payload["firstName"], "firstName mismatch"
     assert created_author["lastName"] == payload["lastName"], "lastName mismatch"
@@ -27,9 +30,8 @@ def test_get_author(authors_api):
     assert get_response.status_code == 200, f"GET failed: {get_response.status_code}"
     
     author_data = get_response.json()
-    assert "id" in author_data
-    assert "firstName" in author_data
-    assert "lastName" in author_data
+    AUTHOR.assert_valid(author_data)
+    assert author_data["id"] == author_id, "ID mismatch"
 
 def test_delete_author(authors_api):
     """
@@ -53,3 +55,64 @@ def test_create_author_invalid_payload(authors_api):
     }
     response = authors_api.create_author(invalid_payload)
     assert response.status_code in [400], f"Expected error, got {response.status_code}"
+    VALIDATION_PROBLEM.assert_valid(response.json())
+
+
+def test_create_authors_concurrently(async_authors_api):
+    """
+    1) Generate several random author payloads
+    2) POST them all concurrently through the async client
+    3) Assert every author was created and echoed back in order
+    """
+    payloads = [generate_author_payload() for _ in range(10)]
+
+    async def create_all():
+        async with async_authors_api:
+            return await async_authors_api.create_authors(payloads)
+
+    responses = asyncio.run(create_all())
+    for payload, response in zip(payloads, responses):
+        assert response.status_code == 200, f"Create failed: {response.status_code}"
+        AUTHOR.assert_valid(response.json())
+        assert response.json()["id"] == payload["id"], "ID mismatch"
+
+
+def test_bulk_authors(authors_api):
+    """
+    1) Create several authors in parallel and validate every response against the Author schema
+    2) GET several existing authors (IDs 1-20) from the default data set in parallel and validate them
+    3) Delete the created authors in parallel; they are no longer tracked for cleanup
+    """
+    payloads = [generate_author_payload() for _ in range(20)]
+    responses = authors_api.create_authors(payloads)
+    report = validate_responses(responses, AUTHOR)
+    assert report.valid, report.summary()
+    assert [response.json()["id"] for response in responses] == [payload["id"] for payload in payloads], "ID mismatch"
+
+    author_ids = list(range(1, 21))
+    responses = authors_api.get_authors(author_ids)
+    report = validate_responses(responses, AUTHOR)
+    assert report.valid, report.summary()
+    assert [response.json()["id"] for response in responses] == author_ids, "ID mismatch"
+
+    created_ids = [payload["id"] for payload in payloads]
+    for response in authors_api.delete_authors(created_ids):
+        assert response.status_code == 200, f"Delete failed: {response.status_code}"
+    if authors_api.registry is not None:
+        assert not {author_id for _, _, author_id in authors_api.registry.pending()} & set(created_ids)
+
+def test_local_api_keep_alive_reuse():
+    """
+    Requests on a keep-alive session to the local stand-in must all share one
+    connection, with Nagle disabled so they do not stall on delayed ACKs (~40 ms each).
+    """
+    import requests
+    from support.fake_rest_server import FakeRestHandler, FakeRestServer
+
+    with FakeRestServer() as server, requests.Session() as session:
+        for _ in range(20):
+            assert session.get(f"{server.url}/api/v1/Authors/1").status_code == 200
+        assert list(server.requests_per_connection.values()) == [20], (
+            f"Keep-alive connection not reused: {dict(server.requests_per_connection)}"
+        )
+    assert FakeRestHandler.disable_nagle_algorithm
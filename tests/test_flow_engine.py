@@ -0,0 +1,71 @@
+from support.common_functions import CommonFunctions
+from support.flow_engine import FlowEngine, load_flow
+
+
+class FakePage:
+    """Stands in for a Playwright page: each selector turns visible after a number of polls."""
+
+    def __init__(self, visible_after: dict[str, int]):
+        self.visible_after = visible_after
+        self.polls = 0
+        self.checks = []
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    def wait_for_timeout(self, timeout):
+        self.polls += 1
+
+
+class FakeLocator:
+    def __init__(self, page: FakePage, selector: str):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    def is_visible(self):
+        self.page.checks.append((self.page.polls, self.selector))
+        return self.page.polls >= self.page.visible_after[self.selector]
+
+
+class FakeHomePage:
+    def __init__(self, page: FakePage):
+        self.page = page
+        self.common_functions = CommonFunctions(page)
+        self.close_chat_btn = page.locator("span:has-text('Close Chat')")
+
+
+def test_flows_group_independent_assertions():
+    """The shipped flows wait for the finished conversation's checks together."""
+    for name in ("schedule_a_tour", "pricing"):
+        groups = [step for step in load_flow(name).steps if step.kind == "concurrent"]
+        assert groups, f"Flow '{name}' has no concurrent assertions"
+        assert {step.kind for step in groups[0].arg} == {"expect_text", "expect_visible"}
+
+
+def test_concurrent_assertions_share_one_wait(tmp_path):
+    """
+    1) Run a flow whose only step groups two assertions under `concurrent`
+    2) Assert both were polled in the same loop and the step ended when the slower one was met
+    3) Assert a met assertion is not checked again
+    """
+    (tmp_path / "group.yaml").write_text(
+        "steps:\n"
+        "  - concurrent:\n"
+        "      - expect_text: Jane Doe\n"
+        "      - expect_visible: close_chat_btn\n"
+    )
+    page = FakePage({"text=Jane Doe": 2, "span:has-text('Close Chat')": 4})
+    engine = FlowEngine(FakeHomePage(page), flow_dir=str(tmp_path))
+
+    engine.run("group", data={})
+
+    assert page.polls == 4, "The group should take as long as its slowest assertion"
+    assert (0, "text=Jane Doe") in page.checks and (0, "span:has-text('Close Chat')") in page.checks
+    assert [poll for poll, selector in page.checks if selector == "text=Jane Doe"] == [0, 1, 2]
+    assert [timing.label for timing in engine.timings] == [
+        "concurrent[expect_text Jane Doe, expect_visible close_chat_btn]"
+    ]
@@ -0,0 +1,27 @@
+import json
+from pathlib import Path
+import pytest
+from pytest_html import extras
+from api_utils.load_generator import LoadGenerator
+from config.config import LOAD_MAX_ERROR_RATE
+
+
+@pytest.mark.load
+def test_authors_api_under_load(api_base_url, api_cleanup, extra):
+    """
+    1) Drive create/get/delete author calls for LOAD_DURATION seconds
+    2) Attach latency percentiles, throughput and errors to the HTML report
+    3) Assert the error rate stays within LOAD_MAX_ERROR_RATE and every response matched the Author schema
+    """
+    report = LoadGenerator(api_base_url, registry=api_cleanup).run()
+
+    Path("reports").mkdir(exist_ok=True)
+    Path("reports/load_report.json").write_text(report.to_json())
+    extra.append(extras.html(report.to_html()))
+    extra.append(extras.json(report.to_dict(), name="Load report"))
+
+    summary = report.to_dict()
+    assert summary["total_requests"] > 0, "No requests were sent"
+    assert report.error_rate <= LOAD_MAX_ERROR_RATE, f"Error rate too high: {json.dumps(summary['errors'])}"
+    if report.validation is not None:
+        assert report.validation.valid, report.validation.summary()